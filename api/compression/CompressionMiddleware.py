@@ -0,0 +1,88 @@
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+from django.utils.http import parse_etags
+
+from . import GZIP, is_compressible, get_encoding, compress, compress_stream, add_etag_coding, strip_etag_coding
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+# The most random bytes of padding added to a compressed response which carries the CSRF token
+MAX_BREACH_PADDING = 100
+
+
+class CompressionMiddleware(MiddlewareMixin):
+    """ Middleware which compresses responses with brotli or gzip, whichever the client prefers of those it accepts in
+    its Accept-Encoding header. Only text and JSON-like content types are compressed, and only responses of at least
+    COMPRESSION_MIN_SIZE bytes, since the headers and CPU time cost more than compressing a small response saves.
+    Streaming responses, whose size isn't known, are compressed chunk by chunk as they're sent, except for event
+    streams, which have to reach the client an event at a time.
+
+    A response which carries the CSRF token is only ever gzipped, with a random amount of padding, so that its length
+    gives nothing away to a BREACH attack. Django already masks the token differently in every response, but the
+    padding also covers anything else secret on the page.
+
+    A compressed response's ETag gets the coding added to it, such as "abc-gzip", since each coding is a different
+    string of bytes and ETags are strong, which If-Match requires. The coding is taken back off the ETags in incoming
+    If-Match and If-None-Match headers, so that views check them against the ETags they compute from the data, and a
+    304 answers with the ETag the client sent. Responses also vary on Accept-Encoding, so no cache mixes up the codings.
+
+    This should come near the top of MIDDLEWARE_CLASSES, so it compresses the response after every other middleware
+    is done with it. """
+
+    def process_request(self, request):
+        request._coded_etags = dict()
+
+        for header in ('HTTP_IF_MATCH', 'HTTP_IF_NONE_MATCH'):
+            if header not in request.META:
+                continue
+
+            etags = parse_etags(request.META[header])
+            if etags == ['*']:
+                continue
+
+            stripped = [strip_etag_coding(etag) for etag in etags]
+            request._coded_etags.update(zip(stripped, etags))
+            request.META[header] = ', '.join(stripped)
+
+    def process_response(self, request, response):
+        patch_vary_headers(response, ('Accept-Encoding',))
+
+        if response.status_code == 304 and response.has_header('ETag'):
+            response['ETag'] = getattr(request, '_coded_etags', {}).get(response['ETag'], response['ETag'])
+            return response
+
+        if response.has_header('Content-Encoding') or not is_compressible(response.get('Content-Type', '')):
+            return response
+        if 'no-transform' in response.get('Cache-Control', '').lower():
+            return response
+        if not response.streaming and len(response.content) < settings.COMPRESSION_MIN_SIZE:
+            return response
+
+        protected = request.META.get('CSRF_COOKIE_USED', False)
+        if protected and response.streaming:
+            return response
+
+        encoding = get_encoding(request.META.get('HTTP_ACCEPT_ENCODING', ''), allow_brotli=not protected)
+        if encoding is None:
+            return response
+
+        options = (settings.COMPRESSION_BROTLI_QUALITY, settings.COMPRESSION_GZIP_LEVEL)
+        if response.streaming:
+            response.streaming_content = compress_stream(response.streaming_content, encoding, *options)
+            del response['Content-Length']
+        else:
+            compressed = compress(response.content, encoding, *options,
+                                  max_padding=MAX_BREACH_PADDING if protected and encoding == GZIP else 0)
+            # Not worth it for content which barely compresses
+            if len(compressed) >= len(response.content):
+                return response
+
+            response.content = compressed
+            response['Content-Length'] = str(len(compressed))
+
+        response['Content-Encoding'] = encoding
+        if response.has_header('ETag'):
+            response['ETag'] = add_etag_coding(response['ETag'], encoding)
+
+        return response
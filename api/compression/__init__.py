@@ -0,0 +1,124 @@
+import gzip
+import secrets
+import zlib
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+BROTLI = 'br'
+GZIP = 'gzip'
+
+# The content types worth compressing. Everything else, such as images, fonts and ZIP archives, is either compressed
+# already or too rare to matter.
+COMPRESSIBLE_TYPES = {
+    'application/javascript',
+    'application/json',
+    'application/x-ndjson',
+    'application/xml',
+    'image/svg+xml',
+}
+
+# Event streams are excluded, since a compressor holds back what it's given until it has enough to compress, and each
+# event must reach the browser as soon as it's sent
+INCOMPRESSIBLE_TYPES = {
+    'text/event-stream',
+}
+
+
+def is_compressible(content_type):
+    """ Return whether a response of the content type is worth compressing. """
+
+    media_type = content_type.split(';', 1)[0].strip().lower()
+    if media_type in INCOMPRESSIBLE_TYPES:
+        return False
+
+    return media_type.startswith('text/') or media_type in COMPRESSIBLE_TYPES or media_type.endswith('+json')
+
+
+def get_encoding(accept_encoding, allow_brotli=True):
+    """ Pick the content coding to compress a response with from a request's Accept-Encoding header: brotli when the
+    client takes it and it's installed, since it's smaller, otherwise gzip. Returns None if the client accepts neither.
+    Codings given a quality of 0 are refused, and `*` stands for any coding not named. """
+
+    qualities = dict()
+    for item in accept_encoding.split(','):
+        coding, _, params = item.strip().partition(';')
+        quality = 1.0
+        for param in params.split(';'):
+            name, _, value = param.strip().partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if coding:
+            qualities[coding.strip().lower()] = quality
+
+    default = qualities.get('*', 0.0)
+    candidates = [BROTLI, GZIP] if allow_brotli and brotli is not None else [GZIP]
+    accepted = [coding for coding in candidates if qualities.get(coding, default) > 0]
+
+    # The client's preference decides, and brotli wins a tie
+    return max(accepted, key=lambda coding: qualities.get(coding, default), default=None)
+
+
+def compress(content, encoding, brotli_quality, gzip_level, max_padding=0):
+    """ Return the content compressed with the encoding. Gzip output may be padded with up to `max_padding` random
+    bytes, stored as the file name in its header, which any client ignores. The padding makes the length of the output
+    vary from one response to the next, which defeats attacks like BREACH that learn a secret in the page by watching
+    how its compressed length changes with what's reflected back alongside it. """
+
+    if encoding == BROTLI:
+        return brotli.compress(content, quality=brotli_quality)
+
+    compressed = gzip.compress(content, compresslevel=gzip_level)
+    if not max_padding:
+        return compressed
+
+    # The gzip header is 10 bytes, and the file name, if the FNAME flag is set, follows it terminated by a null byte
+    header = bytearray(compressed[:10])
+    header[3] |= gzip.FNAME
+    return bytes(header) + b'a' * secrets.randbelow(max_padding + 1) + b'\0' + compressed[10:]
+
+
+def compress_stream(chunks, encoding, brotli_quality, gzip_level):
+    """ Compress a stream of chunks of content with the encoding, yielding compressed chunks as they become
+    available, so a long stream is never held in memory. """
+
+    if encoding == BROTLI:
+        compressor = brotli.Compressor(quality=brotli_quality)
+        process, finish = compressor.process, compressor.finish
+    else:
+        # A window size of 16 plus the maximum makes zlib write the gzip header and trailer
+        compressor = zlib.compressobj(gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        process, finish = compressor.compress, compressor.flush
+
+    for chunk in chunks:
+        data = process(chunk)
+        if data:
+            yield data
+
+    yield finish()
+
+
+def add_etag_coding(etag, encoding):
+    """ Return the ETag of a response's content, marked with the coding the content was compressed with. Each coding
+    of the content is a different string of bytes, so under a strong ETag each needs an ETag of its own. """
+    return '{}-{}"'.format(etag[:-1], encoding)
+
+
+def strip_etag_coding(etag):
+    """ Return the ETag with any coding added by `add_etag_coding` taken off again. """
+
+    for encoding in (BROTLI, GZIP):
+        suffix = '-{}"'.format(encoding)
+        if etag.endswith(suffix):
+            return etag[:-len(suffix)] + '"'
+
+    return etag
+
+from .CompressionMiddleware import CompressionMiddleware
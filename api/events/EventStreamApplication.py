@@ -0,0 +1,51 @@
+import asyncio
+
+from asgiref.sync import sync_to_async
+
+from cloudcache.events import aiter_event_stream
+
+from . import authenticate_scope
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class EventStreamApplication(object):
+    """ ASGI application serving the change event stream natively, rather than through the WSGI adapter, which would
+    tie up one of its threads for every open dashboard. Authentication still runs on a thread, since it may need the
+    database, but the stream itself just waits on the event loop. """
+
+    headers = [
+        (b'content-type', b'text/event-stream'),
+        (b'cache-control', b'no-cache'),
+        (b'x-accel-buffering', b'no'),
+    ]
+
+    async def __call__(self, scope, receive, send):
+        owner_id = await sync_to_async(authenticate_scope)(scope)
+        if owner_id is None:
+            await send({'type': 'http.response.start', 'status': 403,
+                        'headers': [(b'content-type', b'application/json')]})
+            await send({'type': 'http.response.body',
+                        'body': b'{"detail":"Authentication credentials were not provided."}'})
+            return
+
+        await send({'type': 'http.response.start', 'status': 200, 'headers': self.headers})
+
+        # Stream until the stream times out, or the client goes away, whichever comes first
+        streaming = asyncio.ensure_future(self.stream(owner_id, send))
+        disconnected = asyncio.ensure_future(self.wait_for_disconnect(receive))
+        _, pending = await asyncio.wait([streaming, disconnected], return_when=asyncio.FIRST_COMPLETED)
+
+        for task in pending:
+            task.cancel()
+
+    @staticmethod
+    async def stream(owner_id, send):
+        async for chunk in aiter_event_stream(owner_id):
+            await send({'type': 'http.response.body', 'body': chunk, 'more_body': True})
+
+        await send({'type': 'http.response.body', 'body': b''})
+
+    @staticmethod
+    async def wait_for_disconnect(receive):
+        while (await receive())['type'] != 'http.disconnect':
+            pass
@@ -0,0 +1,38 @@
+from io import BytesIO
+
+from asgiref.wsgi import WsgiToAsgiInstance
+from django.contrib.sessions.middleware import SessionMiddleware
+from django.core.handlers.wsgi import WSGIRequest
+from django.db import close_old_connections
+
+from rest_framework.exceptions import APIException
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+
+from authentication.middleware import CachedAuthenticationMiddleware
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+def authenticate_scope(scope):
+    """ Return the ID of the user an ASGI request is authenticated as, or None. The request is authenticated exactly as
+    an API view would: the session and user middleware run first, then each of the API's authentication classes. """
+
+    adapter = WsgiToAsgiInstance(None)
+    adapter.scope = scope
+    request = WSGIRequest(adapter.build_environ(scope, BytesIO()))
+
+    try:
+        SessionMiddleware().process_request(request)
+        CachedAuthenticationMiddleware().process_request(request)
+
+        request = Request(request, authenticators=[cls() for cls in api_settings.DEFAULT_AUTHENTICATION_CLASSES])
+        try:
+            user = request.user
+        except APIException:
+            return None
+
+        return user.pk if user.is_authenticated else None
+    finally:
+        close_old_connections()
+
+from .EventStreamApplication import EventStreamApplication
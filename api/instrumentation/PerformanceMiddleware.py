@@ -0,0 +1,122 @@
+import json
+import logging
+import os
+import random
+from cProfile import Profile
+from time import strftime
+
+from django.conf import settings
+from django.utils.deprecation import MiddlewareMixin
+
+from . import install, start_request, finish_request
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+logger = logging.getLogger('cloudcache.perf')
+
+# The parts of a request reported, in the order they appear in the Server-Timing header
+PARTS = ('auth', 'db', 'serialize', 'render')
+
+
+class PerformanceMiddleware(MiddlewareMixin):
+    """ Middleware which times each request, breaking it down into authentication, database queries, serialization and
+    rendering. They're logged as one JSON line per request to the `cloudcache.perf` logger, for whatever collects the
+    logs. They're also sent back in a Server-Timing header, where the browser's developer tools show them, but only to
+    admins, or to everyone with PERF_SERVER_TIMING, since they give away how much work each request is.
+
+    The parts overlap: serializing a lazy queryset runs its queries, so `db` time can also be part of `serialize`. The
+    cost is a couple of timer reads per query, view and serializer, so it's fine to leave on in production.
+
+    A sampled fraction of requests, PERF_PROFILE_SAMPLE_RATE, also run under cProfile. If one of those is slower than
+    PERF_PROFILE_THRESHOLD_MS, its profile is written to PERF_PROFILE_DIR, named after the view, for pstats or snakeviz.
+    Profiling slows a request down a lot, so keep the rate low; it's zero, and off, by default.
+
+    This should come first in MIDDLEWARE_CLASSES, so that the total includes the other middleware. """
+
+    def __init__(self, get_response=None):
+        super().__init__(get_response)
+        install()
+
+    def process_request(self, request):
+        request._timings = start_request()
+        request._timed_view = None
+
+        sample_rate = settings.PERF_PROFILE_SAMPLE_RATE
+        if sample_rate and random.random() < sample_rate:
+            request._profile = Profile()
+            request._profile.enable()
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        view_class = getattr(view_func, 'view_class', None)
+        request._timed_view = (view_class or view_func).__name__
+
+    def process_response(self, request, response):
+        timings = getattr(request, '_timings', None)
+        if timings is None:
+            return response
+
+        finish_request()
+        profile = getattr(request, '_profile', None)
+        if profile is not None:
+            profile.disable()
+
+        total = timings.elapsed()
+        if self.send_server_timing(request):
+            response['Server-Timing'] = self.get_server_timing(timings, total)
+
+        view = request._timed_view or 'unresolved'
+        self.log(request, response, view, timings, total)
+
+        if profile is not None and total * 1000 >= settings.PERF_PROFILE_THRESHOLD_MS:
+            self.dump_profile(profile, view, total)
+
+        return response
+
+    @staticmethod
+    def send_server_timing(request):
+        """ Whether the timings go back to the client: always with PERF_SERVER_TIMING, otherwise only to admins. """
+        return settings.PERF_SERVER_TIMING or getattr(getattr(request, 'user', None), 'is_admin', False)
+
+    @staticmethod
+    def get_server_timing(timings, total):
+        """ Return the Server-Timing header value for the timings, with durations in milliseconds. """
+
+        metrics = list()
+        for name in PARTS:
+            if name in timings.durations:
+                metric = '{};dur={:.1f}'.format(name, timings.durations[name] * 1000)
+                if name == 'db':
+                    metric += ';desc="{} queries"'.format(timings.counts[name])
+                metrics.append(metric)
+
+        metrics.append('total;dur={:.1f}'.format(total * 1000))
+        return ', '.join(metrics)
+
+    @staticmethod
+    def log(request, response, view, timings, total):
+        if not logger.isEnabledFor(logging.INFO):
+            return
+
+        record = {
+            'method': request.method,
+            'path': request.path,
+            'view': view,
+            'status': response.status_code,
+            'total_ms': round(total * 1000, 2),
+            'queries': timings.counts.get('db', 0),
+        }
+        for name in PARTS:
+            record[name + '_ms'] = round(timings.durations.get(name, 0) * 1000, 2)
+
+        logger.info(json.dumps(record))
+
+    @staticmethod
+    def dump_profile(profile, view, total):
+        """ Write the profile to the profile directory, named after the view, the time, and how long it took. """
+
+        os.makedirs(settings.PERF_PROFILE_DIR, exist_ok=True)
+        filename = '{}-{}-{:.0f}ms-{}.prof'.format(view, strftime('%Y%m%d%H%M%S'), total * 1000, os.getpid())
+        path = os.path.join(settings.PERF_PROFILE_DIR, filename)
+
+        profile.dump_stats(path)
+        logger.warning('Profiled slow request to %s (%.0fms): %s', view, total * 1000, path)
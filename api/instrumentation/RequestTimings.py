@@ -0,0 +1,33 @@
+from collections import defaultdict
+from time import perf_counter
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class RequestTimings(object):
+    """ The time spent in each part of handling one request, in seconds, and how many times each part ran. Parts can
+    nest inside themselves, such as a serializer serializing another, and only the outermost is timed. """
+
+    def __init__(self):
+        self.start = perf_counter()
+        self.durations = defaultdict(float)
+        self.counts = defaultdict(int)
+        self.depths = defaultdict(int)
+
+    def enter(self, name):
+        """ Start timing a part, returning the start time to hand back to `exit`, or None if it's already running. """
+
+        self.depths[name] += 1
+        return perf_counter() if self.depths[name] == 1 else None
+
+    def exit(self, name, started):
+        self.depths[name] -= 1
+        if started is not None:
+            self.durations[name] += perf_counter() - started
+            self.counts[name] += 1
+
+    def add(self, name, duration):
+        self.durations[name] += duration
+        self.counts[name] += 1
+
+    def elapsed(self):
+        return perf_counter() - self.start
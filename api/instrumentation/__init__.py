@@ -0,0 +1,102 @@
+from contextlib import contextmanager
+from functools import wraps
+from threading import local
+from time import perf_counter
+
+from django.db.backends.utils import CursorWrapper
+from django.template.response import SimpleTemplateResponse
+
+from rest_framework.serializers import Serializer, ListSerializer
+from rest_framework.views import APIView
+
+from .RequestTimings import RequestTimings
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+# The timings of the request being handled on this thread, if it's being instrumented
+_state = local()
+
+
+def start_request():
+    """ Start collecting timings for the request on this thread, returning them. """
+
+    _state.timings = RequestTimings()
+    return _state.timings
+
+
+def finish_request():
+    """ Stop collecting timings for the request on this thread, returning them. """
+
+    timings = getattr(_state, 'timings', None)
+    _state.timings = None
+    return timings
+
+
+@contextmanager
+def measure(name):
+    """ Context manager which adds the time spent inside it to the current request's timings under `name`. Outside of
+    an instrumented request it does nothing, so it's safe to use anywhere. """
+
+    timings = getattr(_state, 'timings', None)
+    if timings is None:
+        yield
+        return
+
+    started = timings.enter(name)
+    try:
+        yield
+    finally:
+        timings.exit(name, started)
+
+
+def _timed(name, function):
+    """ Wrap a function so that each call is measured under `name`. """
+
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        with measure(name):
+            return function(*args, **kwargs)
+
+    wrapper.instrumented = True
+    return wrapper
+
+
+def _timed_query(function):
+    """ Wrap a database cursor method so that each query counts towards the `db` timing. This skips the nesting checks
+    of `measure`, since it runs for every query. """
+
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        timings = getattr(_state, 'timings', None)
+        if timings is None:
+            return function(*args, **kwargs)
+
+        started = perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            timings.add('db', perf_counter() - started)
+
+    wrapper.instrumented = True
+    return wrapper
+
+
+def install():
+    """ Hook the timing into the places Django and DRF spend their time: every database query, DRF authentication,
+    DRF serialization, and rendering template and DRF responses. Only ever installed once, however many times this is
+    called. """
+
+    if getattr(CursorWrapper.execute, 'instrumented', False):
+        return
+
+    CursorWrapper.execute = _timed_query(CursorWrapper.execute)
+    CursorWrapper.executemany = _timed_query(CursorWrapper.executemany)
+
+    APIView.perform_authentication = _timed('auth', APIView.perform_authentication)
+
+    for serializer_class in (Serializer, ListSerializer):
+        serializer_class.data = property(_timed('serialize', serializer_class.data.fget))
+
+    SimpleTemplateResponse.render = _timed('render', SimpleTemplateResponse.render)
+
+from .PerformanceMiddleware import PerformanceMiddleware
@@ -0,0 +1,231 @@
+import json
+from collections import defaultdict
+from uuid import UUID
+
+from django.db import transaction
+
+from rest_framework.status import HTTP_200_OK, HTTP_201_CREATED, HTTP_204_NO_CONTENT, HTTP_400_BAD_REQUEST,\
+    HTTP_404_NOT_FOUND, HTTP_409_CONFLICT
+from rest_framework.utils.encoders import JSONEncoder
+
+from authentication.models import Account
+from cloudcache.models import Note, Checklist, ChecklistItem, Tombstone, ClientOperation
+from cloudcache.ordering import GAP
+
+from ..instrumentation import measure
+from ..patches import apply_patch, PatchConflict
+from ..serializers import NoteSerializer, ChecklistSerializer, ChecklistItemSerializer
+from ..serializers.ClientOperationSerializer import CREATE, DELETE
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+SERIALIZERS = {
+    Tombstone.NOTE: NoteSerializer,
+    Tombstone.CHECKLIST: ChecklistSerializer,
+    Tombstone.CHECKLIST_ITEM: ChecklistItemSerializer,
+}
+
+# The detail given with the result of an operation which couldn't be applied, by status
+ERROR_DETAILS = {
+    HTTP_400_BAD_REQUEST: 'The content patch does not apply to the note.',
+    HTTP_404_NOT_FOUND: 'Not found.',
+    HTTP_409_CONFLICT: PatchConflict.default_detail,
+}
+
+
+def get_querysets(user):
+    """ Return the querysets of the objects each kind of operation may touch, keyed by kind. """
+
+    return {
+        # Notes are locked, so that a content patch is checked against the content it's applied to
+        Tombstone.NOTE: Note.objects.filter(owner=user).select_for_update(),
+        Tombstone.CHECKLIST: Checklist.objects.filter(owner=user),
+        Tombstone.CHECKLIST_ITEM: ChecklistItem.objects.filter(checklist__owner=user).select_related('checklist'),
+    }
+
+
+def get_references(operation):
+    """ Yield every object reference in an operation, as given by the client: an ID, or a client UUID. """
+
+    if 'id' in operation:
+        yield operation['id']
+    if 'client_id' in operation:
+        yield operation['client_id']
+    if 'checklist' in operation['data']:
+        yield operation['data']['checklist']
+
+
+def apply_operations(request, operations):
+    """ Apply a batch of validated client operations for the logged-in user, in order and in a single transaction, and
+    return the result of each.
+
+    An operation whose key has been seen before is not applied again, and gets back the result recorded the first time
+    instead, marked as `replayed`. So does a create whose `client_id` has been seen before, whatever its key. That makes
+    retrying a whole batch safe, however much of it was applied before the client gave up waiting.
+
+    Operations on objects which no longer exist, most likely deleted from another device while this client was offline,
+    get a 404 result rather than failing the batch, since there's nothing the client could do to make a retry succeed.
+    Likewise, a content patch made against a version of a Note it no longer has gets a 409 result, along with the Note
+    as it is, and one which doesn't fit the content gets a 400.
+
+    :param request: The current request, used to build the hyperlinks in the serialized objects.
+    :param operations: The operations validated by ClientOperationSerializer.
+    :return: A list with a result for each operation: its `key`, `status`, `type`, the `id` of its object, and the
+             `object` itself as it stands after the whole batch, unless it was deleted.
+    """
+
+    user = request.user
+
+    with transaction.atomic():
+        # Lock the Account, so that a retry racing the original request waits for it, then finds it already applied
+        Account.objects.select_for_update().only('pk').get(pk=user.pk)
+
+        keys = [operation['key'] for operation in operations]
+        recorded = {record.key: record for record in ClientOperation.objects.filter(owner=user, key__in=keys)}
+
+        client_ids = {ref for operation in operations for ref in get_references(operation) if isinstance(ref, UUID)}
+        created = {record.client_id: record for record in
+                   ClientOperation.objects.filter(owner=user, client_id__in=client_ids)} if client_ids else dict()
+        resolved = {client_id: record.object_id for client_id, record in created.items()}
+
+        objects = load_objects(user, operations, resolved)
+        orders = dict()
+
+        applied = list()
+        for operation in operations:
+            record = recorded.get(operation['key'])
+            if record is None and operation['op'] == CREATE:
+                record = created.get(operation.get('client_id'))
+
+            if record is not None:
+                applied.append((operation, record, None, None))
+                continue
+
+            status, pk = apply_operation(user, operation, objects, resolved, orders)
+            applied.append((operation, None, status, pk))
+
+        with measure('serialize'):
+            results = serialize_results(request, applied, objects)
+
+        ClientOperation.objects.bulk_create([
+            ClientOperation(owner=user, key=operation['key'], client_id=operation.get('client_id'),
+                            kind=operation['type'], object_id=result.get('id'),
+                            result=json.dumps(result, cls=JSONEncoder))
+            for (operation, record, _, _), result in zip(applied, results) if record is None
+        ])
+
+    return results
+
+
+def load_objects(user, operations, resolved):
+    """ Fetch every object the operations refer to which already exists, with one query per kind of object. Returns
+    them keyed by kind, then by ID. """
+
+    ids = defaultdict(set)
+    for operation in operations:
+        if 'id' in operation:
+            ids[operation['type']].add(resolve(operation['id'], resolved))
+        if 'checklist' in operation['data']:
+            ids[Tombstone.CHECKLIST].add(resolve(operation['data']['checklist'], resolved))
+
+    return {kind: queryset.in_bulk([pk for pk in ids[kind] if pk is not None]) if ids[kind] else dict()
+            for kind, queryset in get_querysets(user).items()}
+
+
+def resolve(ref, resolved):
+    """ Return the ID of the object a reference points at, or None for a client UUID which isn't known (yet). """
+    return ref if isinstance(ref, int) else resolved.get(ref)
+
+
+def apply_operation(user, operation, objects, resolved, orders):
+    """ Apply one operation, returning its status and the ID of its object, or None if it doesn't exist. """
+
+    kind, data = operation['type'], dict(operation['data'])
+
+    if operation['op'] == CREATE:
+        if kind == Tombstone.CHECKLIST_ITEM:
+            checklist = objects[Tombstone.CHECKLIST].get(resolve(data.pop('checklist'), resolved))
+            if checklist is None:
+                return HTTP_404_NOT_FOUND, None
+
+            # New items go at the end of their Checklist, which only has to be looked up for the first of them
+            order = orders.get(checklist.pk) or ChecklistItem.objects.next_order(checklist)
+            orders[checklist.pk] = order + GAP
+            obj = ChecklistItem(checklist=checklist, order=order, **data)
+        else:
+            obj = SERIALIZERS[kind].Meta.model(owner=user, **data)
+
+        obj.save()
+        objects[kind][obj.pk] = obj
+        if 'client_id' in operation:
+            resolved[operation['client_id']] = obj.pk
+
+        return HTTP_201_CREATED, obj.pk
+
+    obj = objects[kind].get(resolve(operation['id'], resolved))
+    if obj is None:
+        return HTTP_404_NOT_FOUND, None
+
+    pk = obj.pk
+    if operation['op'] == DELETE:
+        del objects[kind][pk]
+        # A deleted Checklist takes its items with it, which must not be saved again by a later operation
+        if kind == Tombstone.CHECKLIST:
+            objects[Tombstone.CHECKLIST_ITEM] = {item.pk: item for item in objects[Tombstone.CHECKLIST_ITEM].values()
+                                                 if item.checklist_id != pk}
+            orders.pop(pk, None)
+
+        obj.delete()
+        return HTTP_204_NO_CONTENT, pk
+
+    if 'content_patch' in data:
+        if data.pop('base_hash') != obj.content_hash:
+            return HTTP_409_CONFLICT, pk
+        try:
+            data['content'] = apply_patch(obj.content, data.pop('content_patch'))
+        except ValueError:
+            return HTTP_400_BAD_REQUEST, pk
+        if not data['content'].strip():
+            return HTTP_400_BAD_REQUEST, pk
+
+    for field, value in data.items():
+        setattr(obj, field, value)
+    obj.save()
+
+    return HTTP_200_OK, pk
+
+
+def serialize_results(request, applied, objects):
+    """ Build the result of each applied operation. Every object is serialized as it stands after the whole batch, and
+    Checklists are fetched again with their items, which the batch may have changed. """
+
+    checklist_ids = [pk for operation, _, _, pk in applied
+                     if operation['type'] == Tombstone.CHECKLIST and pk in objects[Tombstone.CHECKLIST]]
+    current = dict(objects)
+    current[Tombstone.CHECKLIST] = Checklist.objects.with_items().in_bulk(checklist_ids) if checklist_ids else dict()
+
+    context = {'request': request}
+    results = list()
+
+    for operation, record, status, pk in applied:
+        if record is not None:
+            result = json.loads(record.result)
+            result['replayed'] = True
+            results.append(result)
+            continue
+
+        result = {'key': operation['key'], 'status': status, 'type': operation['type']}
+        if 'client_id' in operation:
+            result['client_id'] = operation['client_id']
+
+        if status in ERROR_DETAILS:
+            result['detail'] = ERROR_DETAILS[status]
+        if pk is not None:
+            result['id'] = pk
+            obj = current[operation['type']].get(pk)
+            if obj is not None:
+                result['object'] = SERIALIZERS[operation['type']](obj, context=context).data
+
+        results.append(result)
+
+    return results
@@ -0,0 +1,37 @@
+from rest_framework.pagination import CursorPagination
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class KeysetPagination(CursorPagination):
+    """ Cursor-based pagination, keyed on the `id` ordering every model already has. Each page is fetched with a
+    `WHERE id > <cursor> ORDER BY id LIMIT <page size>` query, so a deep page costs the same as the first one, unlike
+    offset pagination which has to scan past every earlier row. """
+
+    ordering = 'id'
+    page_size = 100
+    page_size_query_param = 'page_size'
+    max_page_size = 1000
+
+    # Orderings the client may pick with the `ordering` query parameter. The cursor is keyed on the first field.
+    ordering_query_param = 'ordering'
+    orderings = ('id', '-id')
+
+    def get_ordering(self, request, queryset, view):
+        """ Use the ordering requested in the query string if it's one of the supported ones, otherwise `id`. Orderings
+        on fields other than `id` fall back to `id` to break ties, so that pages are stable. """
+
+        ordering = request.query_params.get(self.ordering_query_param, self.ordering)
+        if ordering not in self.orderings:
+            ordering = self.ordering
+
+        if ordering.lstrip('-') == 'id':
+            return (ordering,)
+
+        return (ordering, '-id' if ordering.startswith('-') else 'id')
+
+
+class TrackedKeysetPagination(KeysetPagination):
+    """ Cursor-based pagination for models with the TrackingFieldsMixin, which may also be paged through in order of
+    their `modified` timestamp. """
+
+    orderings = ('id', '-id', 'modified', '-modified')
@@ -0,0 +1,30 @@
+from django.conf import settings
+
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+
+from ..renderers import FastJSONRenderer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class FastJSONParser(JSONParser):
+    """ Parser which decodes JSON with orjson, when it's installed, rather than the standard library's json module.
+    Like JSONParser with the default strict JSON setting, it rejects NaN and Infinity. Requests in an encoding other
+    than UTF-8, or any JSON settings other than the defaults, fall back to JSONParser. """
+
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        encoding = (parser_context or {}).get('encoding', settings.DEFAULT_CHARSET)
+        if orjson is None or not self.strict or encoding.lower().replace('-', '') != 'utf8':
+            return super().parse(stream, media_type, parser_context)
+
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError('JSON parse error - %s' % str(exc))
@@ -0,0 +1 @@
+from .FastJSONParser import FastJSONParser
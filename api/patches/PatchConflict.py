@@ -0,0 +1,13 @@
+from rest_framework.exceptions import APIException
+from rest_framework.status import HTTP_409_CONFLICT
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class PatchConflict(APIException):
+    """ Raised when a content patch was made against a different version of a Note's content than it now has, most
+    likely because it was edited somewhere else in the meantime. The client has to fetch the content again, or send it
+    in full. """
+
+    status_code = HTTP_409_CONFLICT
+    default_detail = 'The note has changed since the base version of this patch.'
+    default_code = 'conflict'
@@ -0,0 +1,42 @@
+# ----------------------------------------------------------------------------------------------------------------------
+
+# Characters beyond this take two UTF-16 code units, so string offsets in Python and JavaScript stop agreeing
+MAX_BMP_CHARACTER = '\uffff'
+
+
+def apply_patch(content, edits):
+    """ Apply a list of edits to a Note's content, returning the new content. Each edit replaces `delete` characters of
+    the original content, starting at offset `at`, with the `insert` text. Edits must be in order and can't overlap.
+
+    Offsets count UTF-16 code units, as JavaScript strings do, rather than Python's code points. The two only differ for
+    characters outside the Basic Multilingual Plane, such as emoji, so the content is only converted to UTF-16 when it
+    has any of those. Raises ValueError for edits which don't fit the content, or which would split a character. """
+
+    if not content or max(content) <= MAX_BMP_CHARACTER:
+        text, width, empty = content, 1, ''
+    else:
+        text, width, empty = content.encode('utf-16-le'), 2, b''
+
+    parts = list()
+    position = 0
+    for edit in edits:
+        start = edit['at'] * width
+        end = start + edit['delete'] * width
+        if start < position or end > len(text):
+            raise ValueError('Edits must be in order, must not overlap, and must be within the content.')
+
+        parts.append(text[position:start])
+        parts.append(edit['insert'] if width == 1 else edit['insert'].encode('utf-16-le'))
+        position = end
+
+    parts.append(text[position:])
+    patched = empty.join(parts)
+    if width == 1:
+        return patched
+
+    try:
+        return patched.decode('utf-16-le')
+    except UnicodeDecodeError:
+        raise ValueError('Edits must not split a character in two.')
+
+from .PatchConflict import PatchConflict
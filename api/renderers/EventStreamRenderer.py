@@ -0,0 +1,16 @@
+import json
+
+from rest_framework.renderers import BaseRenderer
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class EventStreamRenderer(BaseRenderer):
+    """ Renderer which lets a view accept requests for `text/event-stream`, as sent by the browser's EventSource. The
+    stream itself is a StreamingHttpResponse which skips rendering, so this only ever renders errors, as JSON. """
+
+    media_type = 'text/event-stream'
+    format = 'event-stream'
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return json.dumps(data).encode('utf-8')
@@ -0,0 +1,31 @@
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class FastJSONRenderer(JSONRenderer):
+    """ Renderer which encodes JSON with orjson, when it's installed, rather than the standard library's json module.
+    The output is byte for byte what JSONRenderer produces, only several times faster. orjson encodes datetimes its own
+    way, so they're handed to DRF's JSONEncoder along with the other types orjson doesn't know, such as Decimals.
+
+    Anything orjson can't reproduce exactly falls back to JSONRenderer: when orjson isn't installed, when the JSON
+    settings aren't the compact, strict, unicode defaults, when indented output is asked for, as by the browsable API,
+    and when orjson refuses the data, for instance for an integer wider than 64 bits. """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or data is None or self.ensure_ascii or not self.compact or not self.strict or \
+                self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data, default=self.encoder_class().default,
+                               option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Escaped like JSONRenderer does, so the output is also valid JavaScript
+        return ret.replace('\u2028'.encode(), b'\\u2028').replace('\u2029'.encode(), b'\\u2029')
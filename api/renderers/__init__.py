@@ -0,0 +1,2 @@
+from .EventStreamRenderer import EventStreamRenderer
+from .FastJSONRenderer import FastJSONRenderer
@@ -0,0 +1,17 @@
+from authentication.models import ApiToken
+from rest_framework.serializers import HyperlinkedModelSerializer
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class ApiTokenSerializer(HyperlinkedModelSerializer):
+    """ Serializer for the ApiToken list and detail endpoints. Only the name can be chosen; the key is generated, and
+    is added to the response when the token is issued since it's never shown again. """
+
+    class Meta:
+        model = ApiToken
+        fields = ('id', 'name', 'prefix', 'created', 'url')
+
+        extra_kwargs = {
+            'id': {'read_only': True},      # Shouldn't be able to edit ID
+            'prefix': {'read_only': True},  # Comes from the generated key
+        }
@@ -0,0 +1,28 @@
+from rest_framework.serializers import Serializer, IntegerField, CharField, BooleanField, ValidationError
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class ChecklistBulkItemSerializer(Serializer):
+    """ Serializer for validating one entry of the ordered item array in a bulk checklist replace. Entries with an `id`
+    update that existing ChecklistItem, and entries without one are created. """
+
+    id = IntegerField(required=False)
+    text = CharField(max_length=1024)
+    complete = BooleanField(default=False)
+
+
+class ChecklistBulkSerializer(Serializer):
+    """ Serializer for validating the full contents of a Checklist sent to the bulk replace endpoint. The title is
+    optional, so that clients which only want to replace the items don't have to send it. """
+
+    title = CharField(max_length=1024, required=False)
+    items = ChecklistBulkItemSerializer(many=True)
+
+    def validate_items(self, items):
+        """ Make sure no existing ChecklistItem is referenced more than once in the item array. """
+
+        ids = [item['id'] for item in items if 'id' in item]
+        if len(ids) != len(set(ids)):
+            raise ValidationError('Each existing item may only appear once.')
+
+        return items
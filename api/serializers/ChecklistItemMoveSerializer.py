@@ -0,0 +1,17 @@
+from rest_framework.serializers import Serializer, IntegerField, ValidationError
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class ChecklistItemMoveSerializer(Serializer):
+    """ Serializer for validating a request to move a ChecklistItem next to another item in the same Checklist. """
+
+    before = IntegerField(required=False)
+    after = IntegerField(required=False)
+
+    def validate(self, data):
+        """ Make sure exactly one of `before` and `after` is given. """
+
+        if ('before' in data) == ('after' in data):
+            raise ValidationError('Exactly one of `before` or `after` is required.')
+
+        return data
@@ -1,9 +1,11 @@
 from cloudcache.models import ChecklistItem
 from rest_framework.serializers import HyperlinkedModelSerializer
 
+from . import SparseFieldsMixin
+
 # ----------------------------------------------------------------------------------------------------------------------
 
-class ChecklistItemSerializer(HyperlinkedModelSerializer):
+class ChecklistItemSerializer(SparseFieldsMixin, HyperlinkedModelSerializer):
     """ Serializer for read/write actions on the ChecklistItem model list and detail endpoints. """
 
     class Meta:
@@ -11,5 +13,12 @@ class ChecklistItemSerializer(HyperlinkedModelSerializer):
         fields = ('id', 'text', 'complete', 'order', 'checklist', 'created', 'modified', 'url')
 
         extra_kwargs = {
-            'id': {'read_only': True},  # Shouldn't be able to edit ID
+            'id': {'read_only': True},     # Shouldn't be able to edit ID
+            'order': {'read_only': True},  # Owned by the server; items are reordered with the move endpoint
         }
+
+    def create(self, validated_data):
+        """ New items go at the end of their Checklist. """
+
+        validated_data['order'] = ChecklistItem.objects.next_order(validated_data['checklist'])
+        return super().create(validated_data)
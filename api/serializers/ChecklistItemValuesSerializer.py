@@ -0,0 +1,46 @@
+from operator import itemgetter
+
+from . import ValuesSerializer
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class ChecklistItemValuesSerializer(ValuesSerializer):
+    """ Read-only serializer producing the same data as ChecklistItemSerializer, for the list endpoints. """
+
+    fields = ('id', 'text', 'complete', 'order', 'checklist_id', 'created', 'modified')
+    sources = {'checklist': ('checklist_id',), 'url': ('id',)}
+
+    def to_representation(self, rows):
+        if self.selected is not None:
+            return self.to_sparse_representation(rows)
+
+        checklist_prefix, checklist_suffix = self.get_url_template('checklist-detail')
+        url_prefix, url_suffix = self.get_url_template('checklistitem-detail')
+        format_datetime = self.format_datetime
+
+        return [{
+            'id': row['id'],
+            'text': row['text'],
+            'complete': row['complete'],
+            'order': row['order'],
+            'checklist': checklist_prefix + str(row['checklist_id']) + checklist_suffix,
+            'created': format_datetime(row['created']),
+            'modified': format_datetime(row['modified']),
+            'url': url_prefix + str(row['id']) + url_suffix,
+        } for row in rows]
+
+    def get_getters(self, rows):
+        checklist_prefix, checklist_suffix = self.get_url_template('checklist-detail')
+        url_prefix, url_suffix = self.get_url_template('checklistitem-detail')
+        format_datetime = self.format_datetime
+
+        return {
+            'id': itemgetter('id'),
+            'text': itemgetter('text'),
+            'complete': itemgetter('complete'),
+            'order': itemgetter('order'),
+            'checklist': lambda row: checklist_prefix + str(row['checklist_id']) + checklist_suffix,
+            'created': lambda row: format_datetime(row['created']),
+            'modified': lambda row: format_datetime(row['modified']),
+            'url': lambda row: url_prefix + str(row['id']) + url_suffix,
+        }
@@ -1,14 +1,15 @@
 from cloudcache.models import Checklist
 from rest_framework.serializers import HyperlinkedModelSerializer
 
-from . import ChecklistItemSerializer
+from . import SparseFieldsMixin, ChecklistItemSerializer
 
 # ----------------------------------------------------------------------------------------------------------------------
 
-class ChecklistSerializer(HyperlinkedModelSerializer):
+class ChecklistSerializer(SparseFieldsMixin, HyperlinkedModelSerializer):
     """ Serializer for read/write actions on the Checklist model list and detail endpoints. """
 
     items = ChecklistItemSerializer(many=True, read_only=True)
+    expandable_fields = ('items',)
 
     class Meta:
         model = Checklist
@@ -0,0 +1,75 @@
+from collections import defaultdict
+from operator import itemgetter
+
+from cloudcache.models import ChecklistItem
+
+from . import ValuesSerializer, ChecklistItemValuesSerializer
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class ChecklistValuesSerializer(ValuesSerializer):
+    """ Read-only serializer producing the same data as ChecklistSerializer, with the nested items, for the list
+    endpoints. The items of every row are fetched with one extra query, in the same order as Checklist.with_items().
+
+    With a sparse fieldset, the items are only fetched if they're selected, and then only their IDs, unless `items` is
+    expanded. """
+
+    fields = ('id', 'title', 'owner_id', 'created', 'modified')
+    sources = {'owner': ('owner_id',), 'items': (), 'url': ('id',)}
+
+    def get_items(self, rows, collapsed=False):
+        """ Return the serialized items of the Checklists in the rows, or just their IDs if `collapsed`, as lists keyed
+        by Checklist ID. """
+
+        items = defaultdict(list)
+        if not rows:
+            return items
+
+        queryset = ChecklistItem.objects.filter(checklist_id__in=[row['id'] for row in rows]).order_by('order', 'id')
+        if collapsed:
+            for checklist_id, item_id in queryset.values_list('checklist_id', 'id'):
+                items[checklist_id].append(item_id)
+            return items
+
+        item_serializer = ChecklistItemValuesSerializer(self.context)
+        item_rows = list(item_serializer.get_rows(queryset))
+        for row, data in zip(item_rows, item_serializer.to_representation(item_rows)):
+            items[row['checklist_id']].append(data)
+
+        return items
+
+    def to_representation(self, rows):
+        if self.selected is not None:
+            return self.to_sparse_representation(rows)
+
+        rows = list(rows)
+        owner_prefix, owner_suffix = self.get_url_template('account-detail')
+        url_prefix, url_suffix = self.get_url_template('checklist-detail')
+        format_datetime = self.format_datetime
+        items = self.get_items(rows)
+
+        return [{
+            'id': row['id'],
+            'title': row['title'],
+            'owner': owner_prefix + str(row['owner_id']) + owner_suffix,
+            'items': items.get(row['id'], []),
+            'created': format_datetime(row['created']),
+            'modified': format_datetime(row['modified']),
+            'url': url_prefix + str(row['id']) + url_suffix,
+        } for row in rows]
+
+    def get_getters(self, rows):
+        owner_prefix, owner_suffix = self.get_url_template('account-detail')
+        url_prefix, url_suffix = self.get_url_template('checklist-detail')
+        format_datetime = self.format_datetime
+        items = self.get_items(rows, collapsed='items' not in self.expand) if 'items' in self.selected else None
+
+        return {
+            'id': itemgetter('id'),
+            'title': itemgetter('title'),
+            'owner': lambda row: owner_prefix + str(row['owner_id']) + owner_suffix,
+            'items': lambda row: items.get(row['id'], []),
+            'created': lambda row: format_datetime(row['created']),
+            'modified': lambda row: format_datetime(row['modified']),
+            'url': lambda row: url_prefix + str(row['id']) + url_suffix,
+        }
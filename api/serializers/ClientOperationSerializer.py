@@ -0,0 +1,162 @@
+from uuid import UUID
+
+from rest_framework.serializers import Serializer, Field, UUIDField, ChoiceField, CharField, BooleanField, DictField,\
+    ValidationError
+
+from cloudcache.models import Tombstone
+
+from . import TextEditSerializer
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+CREATE = 'create'
+UPDATE = 'update'
+TOGGLE = 'toggle'
+DELETE = 'delete'
+
+OPERATION_CHOICES = (CREATE, UPDATE, TOGGLE, DELETE)
+
+
+class ObjectReferenceField(Field):
+    """ A reference to a Note, Checklist or ChecklistItem, either by its ID, or by the UUID the client gave it when it
+    created the object with an operation, for clients which don't know the ID yet. """
+
+    default_error_messages = {
+        'invalid': 'Must be an object ID, or the client_id of an object created by an earlier operation.',
+    }
+
+    def to_internal_value(self, data):
+        if isinstance(data, int) and not isinstance(data, bool):
+            return data
+
+        try:
+            return int(data) if str(data).isdigit() else UUID(str(data))
+        except ValueError:
+            self.fail('invalid')
+
+    def to_representation(self, value):
+        return value if isinstance(value, int) else str(value)
+
+
+class NoteOperationSerializer(Serializer):
+    """ Serializer for validating the data of an operation on a Note. An update may send a `content_patch` against
+    the content whose hash is `base_hash`, rather than the whole content. """
+
+    title = CharField(max_length=1024)
+    content = CharField()
+    base_hash = CharField(max_length=64, required=False)
+    content_patch = TextEditSerializer(many=True, required=False)
+
+    def validate(self, data):
+        """ Make sure a patch comes with its base, and isn't sent along with the whole content. """
+
+        if 'content_patch' in data:
+            if 'base_hash' not in data:
+                raise ValidationError({'base_hash': ['This field is required with a content_patch.']})
+            if 'content' in data:
+                raise ValidationError('Send either the content or a content_patch, not both.')
+        else:
+            data.pop('base_hash', None)
+
+        return data
+
+
+class ChecklistOperationSerializer(Serializer):
+    """ Serializer for validating the data of an operation on a Checklist. """
+
+    title = CharField(max_length=1024)
+
+
+class ChecklistItemOperationSerializer(Serializer):
+    """ Serializer for validating the data of an operation on a ChecklistItem. Items are only put in a Checklist when
+    they're created, so the `checklist` is ignored by updates. """
+
+    checklist = ObjectReferenceField()
+    text = CharField(max_length=1024)
+    complete = BooleanField(default=False)
+
+
+class ChecklistItemToggleSerializer(Serializer):
+    """ Serializer for validating the data of an operation checking or unchecking a ChecklistItem. The new state is
+    given, rather than flipped, so that applying the operation twice is harmless. """
+
+    complete = BooleanField()
+
+
+DATA_SERIALIZERS = {
+    Tombstone.NOTE: NoteOperationSerializer,
+    Tombstone.CHECKLIST: ChecklistOperationSerializer,
+    Tombstone.CHECKLIST_ITEM: ChecklistItemOperationSerializer,
+}
+
+
+class ClientOperationSerializer(Serializer):
+    """ Serializer for validating one operation sent to the operation log. Every operation carries a `key`, a UUID
+    picked by the client which stays the same however many times the operation is retried. Creates may also carry a
+    `client_id` for the new object, and every other operation names its object with `id`. """
+
+    key = UUIDField()
+    op = ChoiceField(choices=OPERATION_CHOICES)
+    type = ChoiceField(choices=[kind for kind, _ in Tombstone.KIND_CHOICES])
+    id = ObjectReferenceField(required=False)
+    client_id = UUIDField(required=False)
+    data = DictField(required=False, default=dict)
+
+    def validate(self, attrs):
+        """ Make sure the operation names its object unless it's a create, and validate its data for the kind of object
+        and operation. Updates only need the fields which are changing. """
+
+        if attrs['op'] == CREATE:
+            attrs.pop('id', None)
+        elif 'id' not in attrs:
+            raise ValidationError({'id': ['This field is required for {} operations.'.format(attrs['op'])]})
+        else:
+            attrs.pop('client_id', None)
+
+        if attrs['op'] == TOGGLE:
+            if attrs['type'] != Tombstone.CHECKLIST_ITEM:
+                raise ValidationError({'op': ['Only checklist items can be toggled.']})
+            serializer = ChecklistItemToggleSerializer(data=attrs['data'])
+        elif attrs['op'] == DELETE:
+            attrs['data'] = dict()
+            return attrs
+        else:
+            serializer = DATA_SERIALIZERS[attrs['type']](data=attrs['data'], partial=attrs['op'] == UPDATE)
+
+        if not serializer.is_valid():
+            raise ValidationError({'data': serializer.errors})
+
+        attrs['data'] = dict(serializer.validated_data)
+        if attrs['op'] != CREATE:
+            attrs['data'].pop('checklist', None)
+
+        return attrs
+
+
+class ClientOperationBatchSerializer(Serializer):
+    """ Serializer for validating a batch of operations sent to the operation log in one request. """
+
+    ops = ClientOperationSerializer(many=True)
+
+    def __init__(self, *args, max_operations=100, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.max_operations = max_operations
+
+    def validate_ops(self, ops):
+        """ Make sure the batch isn't empty or too big, and that no operation, or object created by one, appears in it
+        twice. """
+
+        if not ops:
+            raise ValidationError('At least one operation is required.')
+        if len(ops) > self.max_operations:
+            raise ValidationError('At most {} operations may be sent at once.'.format(self.max_operations))
+
+        keys = [op['key'] for op in ops]
+        if len(keys) != len(set(keys)):
+            raise ValidationError('Each operation key may only appear once.')
+
+        client_ids = [op['client_id'] for op in ops if 'client_id' in op]
+        if len(client_ids) != len(set(client_ids)):
+            raise ValidationError('Each client_id may only be created once.')
+
+        return ops
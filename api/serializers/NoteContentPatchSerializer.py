@@ -0,0 +1,30 @@
+from rest_framework.serializers import Serializer, CharField, ValidationError
+
+from . import TextEditSerializer
+from ..patches import apply_patch, PatchConflict
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class NoteContentPatchSerializer(Serializer):
+    """ Serializer for validating a patch to a Note's content, made against the version of the content whose hash is
+    `base_hash`, and turning it into the new content. Raises PatchConflict, a 409, if the Note's content is no longer
+    that version. """
+
+    base_hash = CharField(max_length=64)
+    content_patch = TextEditSerializer(many=True)
+
+    def validate(self, data):
+        """ Make sure the patch was made against the Note's current content, and applies to it cleanly. """
+
+        if data['base_hash'] != self.instance.content_hash:
+            raise PatchConflict()
+
+        try:
+            content = apply_patch(self.instance.content, data['content_patch'])
+        except ValueError as e:
+            raise ValidationError({'content_patch': [str(e)]})
+
+        if not content.strip():
+            raise ValidationError({'content_patch': ['The patch would leave the note empty.']})
+
+        return {'content': content}
@@ -1,14 +1,17 @@
 from cloudcache.models import Note
 from rest_framework.serializers import HyperlinkedModelSerializer
 
+from . import SparseFieldsMixin
+
 # ----------------------------------------------------------------------------------------------------------------------
 
-class NoteSerializer(HyperlinkedModelSerializer):
+class NoteSerializer(SparseFieldsMixin, HyperlinkedModelSerializer):
     """ Serializer for read/write actions on the Note model list and detail endpoints. """
 
     class Meta:
         model = Note
-        fields = ('id', 'title', 'content', 'owner', 'created', 'modified', 'url')
+        fields = ('id', 'title', 'content', 'preview', 'content_hash', 'content_size', 'owner', 'created', 'modified',
+                  'url')
 
         extra_kwargs = {
             'id': {'read_only': True},    # Shouldn't be able to edit ID
@@ -0,0 +1,51 @@
+from operator import itemgetter
+
+from . import ValuesSerializer
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class NoteValuesSerializer(ValuesSerializer):
+    """ Read-only serializer producing the same data as NoteSerializer, for the list endpoints, but without the
+    content, which isn't even loaded. The preview stands in for it. """
+
+    fields = ('id', 'title', 'preview', 'content_hash', 'content_size', 'owner_id', 'created', 'modified')
+    deferred_fields = ('content',)
+    sources = {'owner': ('owner_id',), 'url': ('id',)}
+
+    def to_representation(self, rows):
+        if self.selected is not None:
+            return self.to_sparse_representation(rows)
+
+        owner_prefix, owner_suffix = self.get_url_template('account-detail')
+        url_prefix, url_suffix = self.get_url_template('note-detail')
+        format_datetime = self.format_datetime
+
+        return [{
+            'id': row['id'],
+            'title': row['title'],
+            'preview': row['preview'],
+            'content_hash': row['content_hash'],
+            'content_size': row['content_size'],
+            'owner': owner_prefix + str(row['owner_id']) + owner_suffix,
+            'created': format_datetime(row['created']),
+            'modified': format_datetime(row['modified']),
+            'url': url_prefix + str(row['id']) + url_suffix,
+        } for row in rows]
+
+    def get_getters(self, rows):
+        owner_prefix, owner_suffix = self.get_url_template('account-detail')
+        url_prefix, url_suffix = self.get_url_template('note-detail')
+        format_datetime = self.format_datetime
+
+        return {
+            'id': itemgetter('id'),
+            'title': itemgetter('title'),
+            'content': itemgetter('content'),
+            'preview': itemgetter('preview'),
+            'content_hash': itemgetter('content_hash'),
+            'content_size': itemgetter('content_size'),
+            'owner': lambda row: owner_prefix + str(row['owner_id']) + owner_suffix,
+            'created': lambda row: format_datetime(row['created']),
+            'modified': lambda row: format_datetime(row['modified']),
+            'url': lambda row: url_prefix + str(row['id']) + url_suffix,
+        }
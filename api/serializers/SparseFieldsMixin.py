@@ -0,0 +1,24 @@
+from rest_framework.serializers import PrimaryKeyRelatedField
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class SparseFieldsMixin(object):
+    """ Serializer mixin which takes the names of the only `fields` to serialize, leaving out the rest, as chosen by a
+    client with the `fields` and `omit` query parameters. Nested objects named in `expandable_fields` are collapsed to
+    a list of their IDs when they're selected, unless they're also named in `expand`. Without `fields`, everything is
+    serialized in full, as usual. """
+
+    expandable_fields = ()
+
+    def __init__(self, *args, fields=None, expand=(), **kwargs):
+        super().__init__(*args, **kwargs)
+
+        if fields is None:
+            return
+
+        for name in set(self.fields) - set(fields):
+            self.fields.pop(name)
+
+        for name in self.expandable_fields:
+            if name in self.fields and name not in expand:
+                self.fields[name] = PrimaryKeyRelatedField(many=True, read_only=True)
@@ -0,0 +1,11 @@
+from rest_framework.serializers import Serializer, IntegerField, CharField
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class TextEditSerializer(Serializer):
+    """ Serializer for validating one edit in a content patch: replace `delete` characters, starting at offset `at`,
+    with the `insert` text. """
+
+    at = IntegerField(min_value=0)
+    delete = IntegerField(min_value=0, default=0)
+    insert = CharField(allow_blank=True, trim_whitespace=False, default='')
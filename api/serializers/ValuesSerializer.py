@@ -0,0 +1,120 @@
+from django.conf import settings
+from django.utils import timezone
+
+from rest_framework.fields import DateTimeField
+from rest_framework.reverse import reverse
+from rest_framework.settings import api_settings, ISO_8601
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+# Stands in for the primary key when reversing a URL template, so it has to be something no real URL would contain
+URL_PLACEHOLDER = 918273645546372819
+
+
+class ValuesSerializer(object):
+    """ Base class for the read-only serializers used by the list endpoints. They produce exactly the same data as the
+    matching HyperlinkedModelSerializer, but from the dicts of QuerySet.values() rather than model instances, and
+    without any per-field DRF machinery.
+
+    The slow part of a HyperlinkedModelSerializer is reversing a URL for every hyperlink of every row. Here each URL is
+    reversed once per serializer with a placeholder primary key, and each row's URL is made by swapping its key in. """
+
+    # The field names to select with QuerySet.values()
+    fields = ()
+
+    # The columns each serialized field is made from, for the fields not simply made from the column of the same name
+    sources = {}
+
+    # Fields of the regular serializer which are left out, as too big to send for every row, unless chosen with a sparse
+    # fieldset
+    deferred_fields = ()
+
+    def __init__(self, context, fields=None, expand=()):
+        """ Take the same context as a DRF serializer, which must hold the request the hyperlinks are built against.
+        The `format` in the context, if any, is carried through to the hyperlinks, as DRF does.
+
+        Like a serializer with the SparseFieldsMixin, it also takes the names of the only `fields` to serialize, and of
+        the nested fields to `expand`. Only the columns those fields are made from are selected. """
+
+        self.context = context
+        self.selected = fields
+        self.expand = set(expand)
+        self.request = context['request']
+        self.format = context.get('format')
+        self.url_templates = dict()
+
+        self.timezone = timezone.get_current_timezone() if settings.USE_TZ else None
+        self.datetime_field = None if api_settings.DATETIME_FORMAT.lower() == ISO_8601 else DateTimeField()
+
+    def get_columns(self):
+        """ Return the columns to select: every one of `fields`, or only those the selected fields are made from, plus
+        the primary key. """
+
+        if self.selected is None:
+            return self.fields
+
+        columns = ['id']
+        for name in self.selected:
+            columns.extend(column for column in self.sources.get(name, (name,)) if column not in columns)
+
+        return columns
+
+    def get_rows(self, queryset, extra_columns=()):
+        """ Return the queryset as dicts of just the fields this serializer needs, plus any `extra_columns`, such as
+        those a paginator orders by. Prefetches are dropped, since they don't apply to values(), so subclasses with
+        nested data fetch that themselves in `to_representation`. """
+
+        columns = list(self.get_columns())
+        columns.extend(column for column in extra_columns if column not in columns)
+        return queryset.prefetch_related(None).values(*columns)
+
+    def to_representation(self, rows):
+        """ Return the list of serialized dicts for the rows returned by `get_rows`. Subclasses write out every field
+        by hand, as that's the common case and by far the fastest, and hand over to `to_sparse_representation` when only
+        some fields are selected. """
+        raise NotImplementedError('ValuesSerializer subclasses must implement to_representation()')
+
+    def get_getters(self, rows):
+        """ Return a dict of functions making each serialized field from a row, for `to_sparse_representation`. """
+        raise NotImplementedError('ValuesSerializer subclasses must implement get_getters()')
+
+    def to_sparse_representation(self, rows):
+        """ Return the list of serialized dicts with only the selected fields, in the order they're selected. """
+
+        rows = list(rows)
+        getters = self.get_getters(rows)
+        getters = [(name, getters[name]) for name in self.selected]
+
+        return [{name: get(row) for name, get in getters} for row in rows]
+
+    def serialize(self, queryset):
+        """ Shortcut to fetch and serialize a whole queryset. """
+        return self.to_representation(self.get_rows(queryset))
+
+    def get_url_template(self, view_name):
+        """ Return a (prefix, suffix) tuple for the view, such that prefix + str(pk) + suffix is the same absolute URL a
+        HyperlinkedRelatedField would build for that pk. """
+
+        template = self.url_templates.get(view_name)
+        if template is None:
+            url = reverse(view_name, kwargs={'pk': URL_PLACEHOLDER}, request=self.request, format=self.format)
+            template = self.url_templates[view_name] = tuple(url.rsplit(str(URL_PLACEHOLDER), 1))
+
+        return template
+
+    def format_datetime(self, value):
+        """ Format a datetime the same way as the DateTimeField of a DRF serializer. """
+
+        if value is None:
+            return None
+
+        if self.datetime_field is not None:
+            return self.datetime_field.to_representation(value)
+
+        if self.timezone is not None:
+            value = value.astimezone(self.timezone)
+        elif timezone.is_aware(value):
+            value = timezone.make_naive(value, timezone.utc)
+
+        value = value.isoformat()
+        return value[:-6] + 'Z' if value.endswith('+00:00') else value
@@ -1,4 +1,15 @@
+from .SparseFieldsMixin import SparseFieldsMixin
 from .AccountSerializer import AccountSerializer
 from .NoteSerializer import NoteSerializer
+from .TextEditSerializer import TextEditSerializer
+from .NoteContentPatchSerializer import NoteContentPatchSerializer
 from .ChecklistItemSerializer import ChecklistItemSerializer
-from .ChecklistSerializer import ChecklistSerializer
\ No newline at end of file
+from .ChecklistSerializer import ChecklistSerializer
+from .ChecklistBulkSerializer import ChecklistBulkSerializer
+from .ChecklistItemMoveSerializer import ChecklistItemMoveSerializer
+from .ApiTokenSerializer import ApiTokenSerializer
+from .ValuesSerializer import ValuesSerializer
+from .NoteValuesSerializer import NoteValuesSerializer
+from .ChecklistItemValuesSerializer import ChecklistItemValuesSerializer
+from .ChecklistValuesSerializer import ChecklistValuesSerializer
+from .ClientOperationSerializer import ClientOperationSerializer, ClientOperationBatchSerializer
@@ -0,0 +1,65 @@
+from datetime import datetime, timedelta
+from heapq import merge
+
+from django.conf import settings
+from django.utils import timezone
+
+from cloudcache.models import Note, Checklist
+
+from ..instrumentation import measure
+from ..serializers import NoteValuesSerializer, ChecklistValuesSerializer
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def encode_cursor(timestamp):
+    """ Encode a sync cursor, the number of microseconds since the epoch, from a timestamp. """
+    return str((timestamp - EPOCH) // timedelta(microseconds=1))
+
+
+def decode_cursor(cursor):
+    """ Decode a sync cursor back into a timestamp. Raises ValueError for anything that isn't a valid cursor. """
+    return EPOCH + timedelta(microseconds=int(cursor))
+
+
+def get_next_cursor(now):
+    """ Return the cursor to hand to a client which has just been sent everything up to `now`. It lags slightly behind
+    `now`, so that a write which committed after the data was read isn't missed by the client's next sync. """
+    return encode_cursor(now - timedelta(seconds=settings.SYNC_CURSOR_OVERLAP_SECONDS))
+
+
+def get_bootstrap_data(request):
+    """ Build everything the dashboard needs to render for the logged-in user: their Notes and Checklists (with items
+    in order) as a single list sorted by creation time, plus a sync cursor for fetching changes later on.
+
+    Each model is sorted by the database, and the two sorted lists are then merged in one pass.
+
+    :param request: The current request, used to build the hyperlinks in the serialized data.
+    :return: A dict with the sorted `elements` and the sync `cursor`.
+    """
+
+    now = timezone.now()
+    context = {'request': request}
+
+    note_serializer = NoteValuesSerializer(context)
+    checklist_serializer = ChecklistValuesSerializer(context)
+
+    notes = Note.objects.filter(owner=request.user).order_by('created', 'id')
+    checklists = Checklist.objects.filter(owner=request.user).order_by('created', 'id')
+
+    notes = list(note_serializer.get_rows(notes))
+    checklists = list(checklist_serializer.get_rows(checklists))
+
+    with measure('serialize'):
+        notes = zip(notes, note_serializer.to_representation(notes))
+        checklists = zip(checklists, checklist_serializer.to_representation(checklists))
+
+        elements = merge(notes, checklists, key=lambda pair: pair[0]['created'])
+        elements = [data for _, data in elements]
+
+    return {
+        'cursor': get_next_cursor(now),
+        'elements': elements,
+    }
@@ -0,0 +1,57 @@
+from collections import Counter, OrderedDict
+from threading import Lock
+from time import monotonic
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class MemoryThrottleStore(object):
+    """ Throttle store which keeps token buckets in this process only, so with several worker processes, each allows
+    the full rate. That's fine for a single node or the tests; with more, use a store backed by something every process
+    shares, such as Redis, where `take` can be a single atomic script.
+
+    Only the most recently used `max_keys` buckets are kept, so a flood of requests from many addresses can't use up
+    memory. A bucket which is dropped starts out full again. """
+
+    max_keys = 100000
+
+    def __init__(self):
+        self.lock = Lock()
+        self.buckets = OrderedDict()
+        self.throttled = Counter()
+
+    def take(self, key, capacity, refill_rate):
+        """ Take a token from the bucket for `key`, which holds up to `capacity` tokens and gains `refill_rate` tokens
+        per second. Returns 0 if there was a token to take, otherwise the number of seconds until there will be. """
+
+        now = monotonic()
+        with self.lock:
+            tokens, updated = self.buckets.pop(key, (capacity, now))
+            tokens = min(capacity, tokens + (now - updated) * refill_rate)
+
+            wait = 0 if tokens >= 1 else (1 - tokens) / refill_rate
+            self.buckets[key] = (tokens - 1 if not wait else tokens, now)
+
+            if len(self.buckets) > self.max_keys:
+                self.buckets.popitem(last=False)
+
+        return wait
+
+    def record_throttled(self, scope):
+        """ Count a request throttled in the scope, returning how many have been in it so far. """
+
+        with self.lock:
+            self.throttled[scope] += 1
+            return self.throttled[scope]
+
+    def get_throttled_counts(self):
+        """ Return the number of requests throttled so far, by scope. """
+
+        with self.lock:
+            return dict(self.throttled)
+
+    def clear(self):
+        """ Forget every bucket and count. """
+
+        with self.lock:
+            self.buckets.clear()
+            self.throttled.clear()
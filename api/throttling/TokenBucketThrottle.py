@@ -0,0 +1,68 @@
+import json
+import logging
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.throttling import BaseThrottle
+
+from . import get_store, parse_rate
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+logger = logging.getLogger('cloudcache.throttle')
+
+
+class TokenBucketThrottle(BaseThrottle):
+    """ Throttle which gives every account, or every IP address for anonymous requests, a token bucket per scope, with
+    the rates in THROTTLE_RATES. Each request takes a token, and a request which finds the bucket empty is refused with
+    a 429, and a Retry-After header saying when there will be a token again. Buckets refill steadily, so a client may
+    burst up to the whole rate at once, then keep going at the rate.
+
+    The scope is 'read' for safe methods and 'write' for the rest, unless the view maps the request's method to another
+    scope in its `throttle_scopes`. Buckets are kept in the THROTTLE_STORE, and each throttled request is counted there
+    and logged to the `cloudcache.throttle` logger. Throttling is skipped entirely if THROTTLE_ENABLED is off. """
+
+    def __init__(self):
+        self.wait_seconds = None
+
+    def get_scope(self, request, view):
+        """ Return the name of the bucket the request draws from. """
+
+        scope = getattr(view, 'throttle_scopes', {}).get(request.method)
+        return scope or ('read' if request.method in SAFE_METHODS else 'write')
+
+    def get_ident(self, request):
+        """ Identify the client by account if it's logged in, and by address otherwise. The address is only taken from
+        X-Forwarded-For as far as NUM_PROXIES trusted proxies vouch for it, so a client can't get a new bucket by
+        sending a made up header. """
+
+        if request.user and request.user.is_authenticated:
+            return 'account:{}'.format(request.user.pk)
+        return 'ip:{}'.format(super().get_ident(request))
+
+    def allow_request(self, request, view):
+        if not settings.THROTTLE_ENABLED:
+            return True
+
+        scope = self.get_scope(request, view)
+        if scope not in settings.THROTTLE_RATES:
+            raise ImproperlyConfigured('No THROTTLE_RATES entry for the {!r} throttle scope.'.format(scope))
+
+        rate = parse_rate(settings.THROTTLE_RATES[scope])
+        if rate is None:
+            return True
+
+        store = get_store()
+        ident = self.get_ident(request)
+        self.wait_seconds = store.take('{}:{}'.format(scope, ident), *rate)
+        if not self.wait_seconds:
+            return True
+
+        count = store.record_throttled(scope)
+        logger.warning(json.dumps({'scope': scope, 'client': ident, 'path': request.path, 'throttled': count}))
+        return False
+
+    def wait(self):
+        return self.wait_seconds
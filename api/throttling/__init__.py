@@ -0,0 +1,40 @@
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.module_loading import import_string
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+# The number of seconds in each period a rate may be given per
+PERIODS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+_store = None
+
+
+def get_store():
+    """ Return the throttle store instance, picked by dotted path with THROTTLE_STORE. """
+
+    global _store
+    if _store is None:
+        _store = import_string(settings.THROTTLE_STORE)()
+
+    return _store
+
+
+def parse_rate(rate):
+    """ Parse a rate such as '120/min' into a token bucket's (capacity, tokens added per second). The bucket holds the
+    whole number of requests, so they can come in a burst, and refills steadily over the period. Returns None for a
+    rate of None, meaning no limit. """
+
+    if rate is None:
+        return None
+
+    try:
+        count, period = rate.split('/')
+        count, seconds = int(count), PERIODS[period.strip()[0]]
+    except (ValueError, KeyError, IndexError):
+        raise ImproperlyConfigured('Invalid throttle rate {!r}; expected a rate such as "120/min".'.format(rate))
+
+    return count, count / seconds
+
+from .MemoryThrottleStore import MemoryThrottleStore
+from .TokenBucketThrottle import TokenBucketThrottle
@@ -4,8 +4,9 @@ from rest_framework.decorators import api_view
 from rest_framework.response import Response
 from rest_framework.reverse import reverse
 
-from .views.public import AccountList, AccountDetail, NoteList, NoteDetail, ChecklistList, ChecklistDetail,\
-    ChecklistItemList, ChecklistItemDetail, ChecklistItemsList
+from .views.public import AccountList, AccountDetail, ApiTokenList, ApiTokenDetail, NoteList, NoteDetail,\
+    ChecklistList, ChecklistDetail, ChecklistItemList, ChecklistItemDetail, ChecklistItemMove, ChecklistItemsList,\
+    ChecklistItemsBulk, Sync, Operations, Bootstrap, Search, Export, Import, Events
 
 # ----------------------------------------------------------------------------------------------------------------------
 
@@ -15,9 +16,16 @@ def api_root(request, format=None):
 
     return Response({
         'accounts': reverse('account-list', request=request, format=format),
+        'tokens': reverse('apitoken-list', request=request, format=format),
         'notes': reverse('note-list', request=request, format=format),
         'checklists': reverse('checklist-list', request=request, format=format),
         'checklist items': reverse('checklistitem-list', request=request, format=format),
+        'sync': reverse('sync', request=request, format=format),
+        'ops': reverse('ops', request=request, format=format),
+        'bootstrap': reverse('bootstrap', request=request, format=format),
+        'search': reverse('search', request=request, format=format),
+        'export': reverse('export', request=request, format=format),
+        'events': reverse('events', request=request, format=format),
     })
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -30,6 +38,10 @@ urlpatterns = [
     url(r'^accounts/$', AccountList.as_view(), name='account-list'),
     url(r'^accounts/(?P<pk>[0-9]+)/$', AccountDetail.as_view(), name='account-detail'),
 
+    # authentication.models.ApiToken list and detail views, for issuing and revoking API tokens
+    url(r'^tokens/$', ApiTokenList.as_view(), name='apitoken-list'),
+    url(r'^tokens/(?P<pk>[0-9]+)/$', ApiTokenDetail.as_view(), name='apitoken-detail'),
+
     # cloudcache.models.Note list and detail views
     url(r'^notes/$', NoteList.as_view(), name='note-list'),
     url(r'^notes/(?P<pk>[0-9]+)/$', NoteDetail.as_view(), name='note-detail'),
@@ -41,7 +53,29 @@ urlpatterns = [
     # cloudcache.models.ChecklistItem list and detail views
     url(r'^checklistitems/$', ChecklistItemList.as_view(), name='checklistitem-list'),
     url(r'^checklistitems/(?P<pk>[0-9]+)/$', ChecklistItemDetail.as_view(), name='checklistitem-detail'),
+    url(r'^checklistitems/(?P<pk>[0-9]+)/move/$', ChecklistItemMove.as_view(), name='checklistitem-move'),
 
     # cloudcache.models.Checklist nested ChecklistItem list
     url('^checklists/(?P<pk>[0-9]+)/items/$', ChecklistItemsList.as_view(), name='checklist-items-list'),
+    url('^checklists/(?P<pk>[0-9]+)/items/bulk/$', ChecklistItemsBulk.as_view(), name='checklist-items-bulk'),
+
+    # Incremental sync of everything the current user owns
+    url(r'^sync/$', Sync.as_view(), name='sync'),
+
+    # Batches of writes queued by a client, applied once each however often they're retried
+    url(r'^ops/$', Operations.as_view(), name='ops'),
+
+    # Everything the dashboard needs to render, in one request
+    url(r'^bootstrap/$', Bootstrap.as_view(), name='bootstrap'),
+
+    # Full-text search over the current user's notes and checklists
+    url(r'^search/$', Search.as_view(), name='search'),
+
+    # Streaming export of everything the current user owns, and import of such an export
+    url(r'^export/$', Export.as_view(), name='export'),
+    url(r'^export/zip/$', Export.as_view(archive=True), name='export-zip'),
+    url(r'^import/$', Import.as_view(), name='import'),
+
+    # Server-sent events for every change to the current user's data, as it happens
+    url(r'^events/$', Events.as_view(), name='events'),
 ]
@@ -0,0 +1,259 @@
+from calendar import timegm
+from hashlib import md5
+
+from django.db.models import Max, Count
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+
+from django.core.exceptions import FieldDoesNotExist
+
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.response import Response
+
+from ...instrumentation import measure
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class ConditionalListMixin(object):
+    """ View mixin which adds ETag and Last-Modified validators to GET requests, and answers If-None-Match and
+    If-Modified-Since with a 304 before the queryset is ever serialized.
+
+    The validators are built from a cheap aggregate over each of the querysets returned by `get_validator_querysets`:
+    the latest `modified` timestamp, plus the row count. A delete doesn't move the latest timestamp, but it does change
+    the count, so the ETag covers deletes as well. The Last-Modified date can't see deletes though, so If-Modified-Since
+    on its own is only honoured when `last_modified_covers_deletes` is set. """
+
+    last_modified_covers_deletes = False
+
+    def get_validator_querysets(self):
+        """ Return the querysets whose contents make up this resource. Defaults to the view's own queryset. """
+        return [self.get_queryset()]
+
+    def get_validator_scope(self, request):
+        """ Return what tells this resource's ETag apart from others built from the same aggregates, which could
+        describe a different user's data, a different page or a different renderer. """
+        return [request.user.pk, request.get_full_path(), request.accepted_renderer.format]
+
+    def get_validators(self, request):
+        """ Return an (etag, last_modified) tuple for the resource, where last_modified is a timestamp in seconds. Both
+        are None if `validators_require_rows` is set and the first validator queryset, the object itself, is empty. """
+
+        parts = self.get_validator_scope(request)
+        latest = None
+
+        for index, queryset in enumerate(self.get_validator_querysets()):
+            aggregate = queryset.order_by().aggregate(latest=Max('modified'), count=Count('pk'))
+            if not index and not aggregate['count'] and getattr(self, 'validators_require_rows', False):
+                return None, None
+
+            parts.extend((aggregate['latest'] and aggregate['latest'].isoformat(), aggregate['count']))
+            if aggregate['latest'] and (latest is None or aggregate['latest'] > latest):
+                latest = aggregate['latest']
+
+        etag = quote_etag(md5(repr(parts).encode('utf-8')).hexdigest())
+        last_modified = timegm(latest.utctimetuple()) if latest else None
+        return etag, last_modified
+
+    def get_conditional_response(self, request, etag, last_modified):
+        """ Return a 304 or 412 response if the request's preconditions call for one, otherwise None. """
+
+        if not self.last_modified_covers_deletes:
+            last_modified = None
+
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is not None:
+            self.set_validator_headers(response, etag, last_modified)
+
+        return response
+
+    def set_validator_headers(self, response, etag, last_modified):
+        """ Set the ETag and Last-Modified headers on the response, if they aren't already set. The response is also
+        marked `no-cache`, so that browsers always revalidate it instead of guessing at its freshness. """
+
+        patch_cache_control(response, private=True, no_cache=True)
+        if etag and not response.has_header('ETag'):
+            response['ETag'] = etag
+        if last_modified and not response.has_header('Last-Modified'):
+            response['Last-Modified'] = http_date(last_modified)
+
+    def get(self, request, *args, **kwargs):
+        """ Answer conditional GET requests without touching the serializer, and add the validators to full responses
+        so that clients can make conditional requests next time. """
+
+        etag, last_modified = self.get_validators(request)
+
+        response = self.get_conditional_response(request, etag, last_modified)
+        if response is not None:
+            return response
+
+        response = super().get(request, *args, **kwargs)
+        if response.status_code == 200:
+            self.set_validator_headers(response, etag, last_modified)
+
+        return response
+
+
+class ConditionalDetailMixin(ConditionalListMixin):
+    """ View mixin which adds ETag and Last-Modified validators to a single-object resource. Besides conditional GET,
+    If-Match and If-Unmodified-Since are checked on PUT, PATCH and DELETE, so that a client can't overwrite or delete an
+    object which has changed since it last saw it. A missing object gets no validators, so it still returns a 404. """
+
+    validators_require_rows = True
+
+    def get_validator_querysets(self):
+        """ Defaults to the view's own queryset, narrowed down to the requested object. """
+        return [self.get_queryset().filter(pk=self.kwargs['pk'])]
+
+    def get_validator_scope(self, request):
+        """ Leaves out the query string. Whichever fields a GET picks, it's a view of the same object, and If-Match on a
+        PUT, PATCH or DELETE has to accept the ETag from any of them. """
+        return [request.user.pk, request.path, request.accepted_renderer.format]
+
+    def check_write_preconditions(self, request):
+        """ Return a 412 response if the request's If-Match or If-Unmodified-Since precondition fails. The validators
+        are only computed when the client actually sent one of those headers. """
+
+        if 'HTTP_IF_MATCH' not in request.META and 'HTTP_IF_UNMODIFIED_SINCE' not in request.META:
+            return None
+
+        etag, last_modified = self.get_validators(request)
+        if etag is None:
+            return None
+
+        return self.get_conditional_response(request, etag, last_modified)
+
+    def put(self, request, *args, **kwargs):
+        return self.check_write_preconditions(request) or super().put(request, *args, **kwargs)
+
+    def patch(self, request, *args, **kwargs):
+        return self.check_write_preconditions(request) or super().patch(request, *args, **kwargs)
+
+    def delete(self, request, *args, **kwargs):
+        return self.check_write_preconditions(request) or super().delete(request, *args, **kwargs)
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class ValuesListMixin(object):
+    """ View mixin for list endpoints which serializes the page with the view's `values_serializer_class`, working on
+    dicts from QuerySet.values(), rather than instantiating models and running them through the DRF serializer. The
+    output is identical, and the regular `serializer_class` is still used for everything else, such as POST. """
+
+    values_serializer_class = None
+
+    def get_values_serializer(self, **kwargs):
+        """ Return the values serializer, with the same context the regular serializer would get. """
+        return self.values_serializer_class(self.get_serializer_context(), **kwargs)
+
+    def list_values(self, queryset):
+        """ Return the response for a list of the queryset, paginated if the view is. """
+
+        # Keyset pagination reads the fields it orders by from the last row of a page, whether they're serialized or not
+        ordering = self.paginator.get_ordering(self.request, queryset, self) if self.paginator is not None else ()
+
+        serializer = self.get_values_serializer()
+        rows = serializer.get_rows(queryset, [field.lstrip('-') for field in ordering])
+
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            with measure('serialize'):
+                data = serializer.to_representation(page)
+            return self.get_paginated_response(data)
+
+        with measure('serialize'):
+            data = serializer.to_representation(rows)
+        return Response(data)
+
+    def list(self, request, *args, **kwargs):
+        return self.list_values(self.filter_queryset(self.get_queryset()))
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class SparseFieldsetMixin(object):
+    """ View mixin letting a GET request pick the fields of each object it wants back, so that overview screens and
+    scripts don't pay for the bytes and queries of fields they'd throw away. `?fields=id,title` returns only those
+    fields, and `?omit=owner` every field but those. Fields a list leaves out by default, such as a Note's content,
+    can still be chosen with `fields`. Only the columns the chosen fields need are loaded.
+
+    The nested objects in `expandable_fields`, a Checklist's items, are left out entirely unless they're chosen. Once
+    chosen, they're collapsed to a list of their IDs, unless they're also named in `?expand=items`. Without `fields` or
+    `omit`, every field is returned in full, nested objects included. """
+
+    expandable_fields = ()
+
+    def get_field_selection(self):
+        """ Return a (fields, expand) tuple of the names of the fields picked by the request, or None for every field,
+        and of the nested fields to expand. Raises a ValidationError, a 400, for any name which isn't a field. """
+
+        if hasattr(self, '_field_selection'):
+            return self._field_selection
+
+        available = self.get_serializer_class().Meta.fields
+        params = self.request.query_params
+
+        fields = None
+        if self.request.method in SAFE_METHODS and ('fields' in params or 'omit' in params):
+            chosen = self.parse_field_names('fields', available) if 'fields' in params else self.get_default_fields()
+            omitted = self.parse_field_names('omit', available)
+            fields = tuple(name for name in available if name in chosen and name not in omitted)
+
+        expand = self.parse_field_names('expand', self.expandable_fields)
+
+        self._field_selection = fields, expand
+        return self._field_selection
+
+    def get_default_fields(self):
+        """ Return the fields sent when none are chosen: all of them, except those a list endpoint's values serializer
+        defers. """
+
+        deferred = getattr(getattr(self, 'values_serializer_class', None), 'deferred_fields', ())
+        return [name for name in self.get_serializer_class().Meta.fields if name not in deferred]
+
+    def parse_field_names(self, param, choices):
+        """ Return the comma-separated field names in a query parameter, checking each is one of the choices. """
+
+        names = [name.strip() for name in self.request.query_params.get(param, '').split(',') if name.strip()]
+
+        unknown = [name for name in names if name not in choices]
+        if unknown:
+            raise ValidationError({param: ['Unknown field(s): {}. Choose from: {}.'.format(
+                ', '.join(unknown), ', '.join(choices) or 'none')]})
+
+        return names
+
+    def get_serializer(self, *args, **kwargs):
+        fields, expand = self.get_field_selection()
+        if fields is not None:
+            kwargs.update(fields=fields, expand=expand)
+
+        return super().get_serializer(*args, **kwargs)
+
+    def get_values_serializer(self, **kwargs):
+        fields, expand = self.get_field_selection()
+        if fields is not None:
+            kwargs.update(fields=fields, expand=expand)
+
+        return super().get_values_serializer(**kwargs)
+
+    def filter_queryset(self, queryset):
+        """ Only load the columns the chosen fields are made from. """
+
+        queryset = super().filter_queryset(queryset)
+        fields, expand = self.get_field_selection()
+        return queryset if fields is None else self.select_fields(queryset, fields, expand)
+
+    def select_fields(self, queryset, fields, expand):
+        """ Narrow the queryset down to the columns of the chosen fields, and the primary key. Related objects aren't
+        needed, as hyperlinks to them are made from the foreign key, and nested objects are dropped; views with
+        `expandable_fields` prefetch them again if they're chosen. """
+
+        model = queryset.model
+        columns = [model._meta.pk.name]
+        for name in fields:
+            try:
+                if model._meta.get_field(name).concrete:
+                    columns.append(name)
+            except FieldDoesNotExist:
+                pass
+
+        return queryset.select_related(None).prefetch_related(None).only(*columns)
@@ -1,13 +1,35 @@
-from rest_framework.generics import ListCreateAPIView, RetrieveUpdateDestroyAPIView
-from rest_framework.status import HTTP_201_CREATED, HTTP_400_BAD_REQUEST
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.http import StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
+
+from rest_framework.generics import ListCreateAPIView, RetrieveUpdateDestroyAPIView, RetrieveDestroyAPIView
+from rest_framework.views import APIView
+from rest_framework.status import HTTP_201_CREATED, HTTP_204_NO_CONTENT, HTTP_400_BAD_REQUEST
 from rest_framework.response import Response
+from rest_framework.parsers import MultiPartParser
 from rest_framework.permissions import IsAuthenticated
 
-from authentication.models import Account
-from cloudcache.models import Note, ChecklistItem, Checklist
-
-from ...serializers import AccountSerializer, NoteSerializer, ChecklistItemSerializer, ChecklistSerializer
+from authentication.models import Account, ApiToken
+from cloudcache.models import Note, ChecklistItem, Checklist, Tombstone, SearchDocument
+from cloudcache.events import iter_event_stream, publish_change
+from cloudcache.ordering import assign_orders
+from cloudcache.search import search, schedule_index
+from cloudcache.transfer import iter_ndjson, iter_zip, import_records, InvalidImportError
+
+from ...instrumentation import measure
+from ..mixins import ConditionalListMixin, ConditionalDetailMixin, ValuesListMixin, SparseFieldsetMixin
+from ...pagination import TrackedKeysetPagination
+from ...sync import decode_cursor, get_next_cursor, get_bootstrap_data
+from ...operations import apply_operations
+from ...serializers import AccountSerializer, ApiTokenSerializer, NoteSerializer, ChecklistItemSerializer,\
+    ChecklistSerializer, ChecklistBulkSerializer, ChecklistItemMoveSerializer, NoteValuesSerializer,\
+    ChecklistItemValuesSerializer, ChecklistValuesSerializer, ClientOperationBatchSerializer, NoteContentPatchSerializer
 from ...permissions import IsAccountSelfOrReadOnly
+from ...renderers import EventStreamRenderer, FastJSONRenderer
 
 # ----------------------------------------------------------------------------------------------------------------------
 
@@ -16,6 +38,7 @@ class AccountList(ListCreateAPIView):
 
     queryset = Account.objects.all().order_by('id')
     serializer_class = AccountSerializer
+    throttle_scopes = {'POST': 'register'}
 
 
 class AccountDetail(RetrieveUpdateDestroyAPIView):
@@ -27,19 +50,55 @@ class AccountDetail(RetrieveUpdateDestroyAPIView):
 
 # ----------------------------------------------------------------------------------------------------------------------
 
-class ChecklistItemsList(ListCreateAPIView):
+class ApiTokenList(ListCreateAPIView):
+    """ API endpoint for listing the current user's API tokens, or issuing a new one. Requires authentication. """
+
+    serializer_class = ApiTokenSerializer
+    permission_classes = [IsAuthenticated]
+
+    def get_queryset(self):
+        """ Only show ApiTokens which are owned by the currently logged-in user. """
+        return ApiToken.objects.filter(owner=self.request.user)
+
+    def create(self, request, *args, **kwargs):
+        """ Issue a new token for the currently logged-in user. The response is the only time the key is ever shown,
+        as only its hash is stored. """
+
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        token, key = ApiToken.objects.issue(request.user, serializer.validated_data.get('name', ''))
+
+        data = self.get_serializer(token).data
+        data['key'] = key
+        return Response(data, status=HTTP_201_CREATED)
+
+
+class ApiTokenDetail(RetrieveDestroyAPIView):
+    """ API endpoint which allows retrieving details for, or revoking, a specific API token. """
+
+    serializer_class = ApiTokenSerializer
+    permission_classes = [IsAuthenticated]
+
+    def get_queryset(self):
+        """ Only show ApiTokens which are owned by the currently logged-in user. """
+        return ApiToken.objects.filter(owner=self.request.user)
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class ChecklistItemsList(ConditionalListMixin, SparseFieldsetMixin, ValuesListMixin, ListCreateAPIView):
     """ API endpoint for listing only those items under a specific Checklist. Requires authentication. """
 
     serializer_class = ChecklistItemSerializer
+    values_serializer_class = ChecklistItemValuesSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = TrackedKeysetPagination
 
-    def get(self, request, pk):
+    def list(self, request, pk):
         """ Retrieve only those items which are contained within the Checklist whose ID is <pk>
         in the API endpoint. """
 
-        items = self.get_queryset().filter(checklist__id=pk)
-        serializer = ChecklistItemSerializer(items, many=True, context={'request': request})
-        return Response(serializer.data)
+        return self.list_values(self.get_queryset().filter(checklist__id=pk))
 
     def post(self, request, pk):
         """ Create a new ChecklistItem under the Checklist whose ID is <pk> in the API endpoint. """
@@ -58,16 +117,93 @@ class ChecklistItemsList(ListCreateAPIView):
     def get_queryset(self):
         """ Only show ChecklistItems which are in Checklists that are owned by the currently
         logged-in user. """
-        return ChecklistItem.objects.filter(checklist__owner=self.request.user)
+        return ChecklistItem.objects.filter(checklist__owner=self.request.user).select_related('checklist')
+
+    def get_validator_querysets(self):
+        """ The validators only cover the items in the Checklist whose ID is <pk> in the API endpoint. """
+        return [self.get_queryset().filter(checklist__id=self.kwargs['pk'])]
+
+
+class ChecklistItemsBulk(APIView):
+    """ API endpoint for replacing the entire, ordered contents of a specific Checklist in a single request. Requires
+    authentication. """
+
+    permission_classes = [IsAuthenticated]
+
+    def put(self, request, pk):
+        """ Replace the items of the Checklist whose ID is <pk> in the API endpoint with the ordered item array in the
+        request body, and optionally update its title. The body is either the bare item array, or an object with `items`
+        and an optional `title`.
+
+        The array is diffed against the stored ChecklistItems: entries with an `id` update that item, entries without
+        one are created, and stored items missing from the array are deleted. Items keep their `order` value unless
+        they've moved relative to the others, so reordering one item only writes that one. All of the writes happen in
+        a single transaction, and the refreshed Checklist is returned. """
+
+        data = {'items': request.data} if isinstance(request.data, list) else request.data
+
+        serializer = ChecklistBulkSerializer(data=data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=HTTP_400_BAD_REQUEST)
+
+        with transaction.atomic():
+            checklist = get_object_or_404(Checklist.objects.select_for_update(), pk=pk, owner=request.user)
+            existing = {item.id: item for item in checklist.items.all()}
+
+            sequence = list()
+            changed = set()
+            text_changed = False
+
+            for entry in serializer.validated_data['items']:
+                if 'id' not in entry:
+                    sequence.append(ChecklistItem(checklist=checklist, text=entry['text'], complete=entry['complete']))
+                    text_changed = True
+                    continue
 
+                item = existing.pop(entry['id'], None)
+                if item is None:
+                    transaction.set_rollback(True)
+                    return Response({'items': ['Item {} is not in this checklist.'.format(entry['id'])]},
+                                    status=HTTP_400_BAD_REQUEST)
+
+                text_changed = text_changed or item.text != entry['text']
+                if (item.text, item.complete) != (entry['text'], entry['complete']):
+                    item.text, item.complete = entry['text'], entry['complete']
+                    changed.add(item.pk)
+
+                sequence.append(item)
+
+            # Only the items which have actually moved relative to the others get a new order value
+            changed.update(item.pk for item in assign_orders(sequence))
+
+            # Anything left over in `existing` wasn't in the array, so it's been removed from the checklist
+            if existing:
+                checklist.items.filter(pk__in=existing.keys()).delete()
+
+            ChecklistItem.objects.bulk_update([item for item in sequence if item.pk in changed],
+                                              ('text', 'complete', 'order'))
+            ChecklistItem.objects.bulk_create([item for item in sequence if item.pk is None])
+
+            # Always save the checklist, even if the title is unchanged, so its `modified` reflects the new contents
+            checklist.title = serializer.validated_data.get('title', checklist.title)
+            checklist.save()
+
+            # The bulk writes skip the signals which index items as they're saved, but deletions have already done it
+            if text_changed:
+                schedule_index(SearchDocument.CHECKLIST, checklist.pk)
+
+        checklist = Checklist.objects.with_items().get(pk=checklist.pk)
+        return Response(ChecklistSerializer(checklist, context={'request': request}).data)
 
 # ----------------------------------------------------------------------------------------------------------------------
 
-class NoteList(ListCreateAPIView):
+class NoteList(ConditionalListMixin, SparseFieldsetMixin, ValuesListMixin, ListCreateAPIView):
     """ API endpoint for listing and creating Notes. Requires authentication. """
 
     serializer_class = NoteSerializer
+    values_serializer_class = NoteValuesSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = TrackedKeysetPagination
 
     def get_queryset(self):
         """ Only show Notes which are owned by the currently logged-in user. """
@@ -91,27 +227,73 @@ class NoteList(ListCreateAPIView):
         return Response(note_serializer.errors, status=HTTP_400_BAD_REQUEST)
 
 
-class NoteDetail(RetrieveUpdateDestroyAPIView):
-    """ API endpoint which allows retrieving details for, updating, or deleting a specific Note. """
+class NoteDetail(ConditionalDetailMixin, SparseFieldsetMixin, RetrieveUpdateDestroyAPIView):
+    """ API endpoint which allows retrieving details for, updating, or deleting a specific Note.
+
+    Instead of the whole `content`, an update may send a `content_patch`: a list of edits, each replacing `delete`
+    characters from offset `at` with the `insert` text, along with the `content_hash` of the content it was made
+    against as `base_hash`. If the Note's content has changed since, the update is rejected with a 409. """
 
     serializer_class = NoteSerializer
     permission_classes = [IsAuthenticated]
+    last_modified_covers_deletes = True
 
     def get_queryset(self):
         """ Only show Notes which are owned by the currently logged-in user. """
         return Note.objects.filter(owner=self.request.user)
 
+    def filter_queryset(self, queryset):
+        """ Lock the Note being updated until the update commits, so that a content patch is checked against the same
+        content it's applied to. """
+
+        queryset = super().filter_queryset(queryset)
+        return queryset.select_for_update() if self.request.method in ('PUT', 'PATCH') else queryset
+
+    def update(self, request, *args, **kwargs):
+        """ Update the Note in a transaction, turning a content patch into the new content first. """
+
+        with transaction.atomic():
+            if 'content_patch' not in request.data:
+                return super().update(request, *args, **kwargs)
+
+            note = self.get_object()
+            patch = NoteContentPatchSerializer(note, data=request.data)
+            patch.is_valid(raise_exception=True)
+
+            data = {field: value for field, value in request.data.items() if field not in patch.fields}
+            data.update(patch.validated_data)
+
+            serializer = self.get_serializer(note, data=data, partial=True)
+            serializer.is_valid(raise_exception=True)
+            self.perform_update(serializer)
+
+        return Response(serializer.data)
+
 # ----------------------------------------------------------------------------------------------------------------------
 
-class ChecklistList(ListCreateAPIView):
+class ChecklistList(ConditionalListMixin, SparseFieldsetMixin, ValuesListMixin, ListCreateAPIView):
     """ API endpoint for listing and creating Checklists. Requires authentication. """
 
     serializer_class = ChecklistSerializer
+    values_serializer_class = ChecklistValuesSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = TrackedKeysetPagination
+    expandable_fields = ('items',)
 
     def get_queryset(self):
-        """ Only show Checklists which are owned by the currently logged-in user. """
-        return Checklist.objects.filter(owner=self.request.user)
+        """ Only show Checklists which are owned by the currently logged-in user, with their items prefetched. """
+        return Checklist.objects.filter(owner=self.request.user).with_items()
+
+    def select_fields(self, queryset, fields, expand):
+        """ Only fetch the items if they're chosen, and only their IDs unless they're expanded. """
+
+        queryset = super().select_fields(queryset, fields, expand)
+        return queryset.with_items(collapsed='items' not in expand) if 'items' in fields else queryset
+
+    def get_validator_querysets(self):
+        """ The nested items are part of each Checklist's representation, so they're part of the validators too. """
+        return [Checklist.objects.filter(owner=self.request.user),
+                ChecklistItem.objects.filter(checklist__owner=self.request.user)]
 
     def post(self, request, *args, **kwargs):
         """ When creating a new Checklist, only allow the user to create new Checklist for themselves. """
@@ -131,35 +313,302 @@ class ChecklistList(ListCreateAPIView):
         return Response(list_serializer.errors, status=HTTP_400_BAD_REQUEST)
 
 
-class ChecklistDetail(RetrieveUpdateDestroyAPIView):
+class ChecklistDetail(ConditionalDetailMixin, SparseFieldsetMixin, RetrieveUpdateDestroyAPIView):
     """ API endpoint which allows retrieving details for, updating, or deleting a specific Checklist. """
 
     serializer_class = ChecklistSerializer
     permission_classes = [IsAuthenticated]
+    expandable_fields = ('items',)
 
     def get_queryset(self):
-        """ Only show Checklists which are owned by the currently logged-in user. """
-        return Checklist.objects.filter(owner=self.request.user)
+        """ Only show Checklists which are owned by the currently logged-in user, with their items prefetched. """
+        return Checklist.objects.filter(owner=self.request.user).with_items()
+
+    def select_fields(self, queryset, fields, expand):
+        """ Only fetch the items if they're chosen, and only their IDs unless they're expanded. """
+
+        queryset = super().select_fields(queryset, fields, expand)
+        return queryset.with_items(collapsed='items' not in expand) if 'items' in fields else queryset
+
+    def get_validator_querysets(self):
+        """ The nested items are part of the Checklist's representation, so they're part of the validators too. """
+        return [Checklist.objects.filter(owner=self.request.user, pk=self.kwargs['pk']),
+                ChecklistItem.objects.filter(checklist__owner=self.request.user, checklist__id=self.kwargs['pk'])]
 
 # ----------------------------------------------------------------------------------------------------------------------
 
-class ChecklistItemList(ListCreateAPIView):
+class ChecklistItemList(ConditionalListMixin, SparseFieldsetMixin, ValuesListMixin, ListCreateAPIView):
     """ API endpoint for listing and creating ChecklistItems. Requires authentication. """
 
     serializer_class = ChecklistItemSerializer
+    values_serializer_class = ChecklistItemValuesSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = TrackedKeysetPagination
 
     def get_queryset(self):
         """ Only show ChecklistItems which are in Checklists that are owned by the currently logged-in user. """
-        return ChecklistItem.objects.filter(checklist__owner=self.request.user)
+        return ChecklistItem.objects.filter(checklist__owner=self.request.user).select_related('checklist')
 
 
-class ChecklistItemDetail(RetrieveUpdateDestroyAPIView):
+class ChecklistItemDetail(ConditionalDetailMixin, SparseFieldsetMixin, RetrieveUpdateDestroyAPIView):
     """ API endpoint which allows retrieving details for, updating, or deleting a specific ChecklistItem. """
 
     serializer_class = ChecklistItemSerializer
     permission_classes = [IsAuthenticated]
+    last_modified_covers_deletes = True
 
     def get_queryset(self):
         """ Only show ChecklistItems which are in Checklists that are owned by the currently logged-in user. """
-        return ChecklistItem.objects.filter(checklist__owner=self.request.user)
+        return ChecklistItem.objects.filter(checklist__owner=self.request.user).select_related('checklist')
+
+
+class ChecklistItemMove(APIView):
+    """ API endpoint for moving a ChecklistItem to a new position in its Checklist. Requires authentication. """
+
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, pk):
+        """ Move the ChecklistItem whose ID is <pk> in the API endpoint to just `before` or just `after` the item with
+        the given ID, which must be in the same Checklist. Normally only the moved item is written. The moved item is
+        returned with its new `order`. """
+
+        serializer = ChecklistItemMoveSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=HTTP_400_BAD_REQUEST)
+
+        position = 'before' if 'before' in serializer.validated_data else 'after'
+        anchor_id = serializer.validated_data[position]
+
+        with transaction.atomic():
+            item = get_object_or_404(ChecklistItem, pk=pk, checklist__owner=request.user)
+
+            # Lock the Checklist, so that concurrent moves within it can't pick the same free order value
+            Checklist.objects.select_for_update().get(pk=item.checklist_id)
+
+            anchor = ChecklistItem.objects.filter(pk=anchor_id, checklist_id=item.checklist_id).exclude(pk=item.pk)\
+                .first()
+            if anchor is None:
+                return Response({position: ['Item {} is not another item in this checklist.'.format(anchor_id)]},
+                                status=HTTP_400_BAD_REQUEST)
+
+            ChecklistItem.objects.move(item, **{position: anchor})
+
+            # The move is written with bulk_update, which sends no signals. Any other items it renumbered have their
+            # `modified` bumped too, so the sync this event prompts picks them up as well.
+            publish_change(request.user.pk, Tombstone.CHECKLIST_ITEM, 'saved', item.pk, item.checklist_id)
+
+        return Response(ChecklistItemSerializer(item, context={'request': request}).data)
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class Sync(APIView):
+    """ API endpoint for incrementally syncing a client's copy of the current user's Notes, Checklists and
+    ChecklistItems. Requires authentication. """
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        """ Return everything created, modified or deleted since the `since` cursor, along with the cursor to pass next
+        time. Without a cursor, or with one older than the tombstone retention period, everything the user owns is
+        returned instead and `reset` is true, telling the client to replace its copy rather than patch it.
+
+        Changes are found with the (owner, modified) indexes, and deletions from the tombstones, so a sync costs time
+        in proportion to what changed rather than to how much the user owns. The cursor handed back lags slightly behind
+        the current time, so that a write which committed late isn't missed. The next sync may then repeat a change
+        or two, which clients should apply idempotently. """
+
+        now = timezone.now()
+        since = request.query_params.get('since')
+
+        if since is not None:
+            try:
+                since = decode_cursor(since)
+            except (ValueError, OverflowError):
+                return Response({'since': ['Invalid cursor.']}, status=HTTP_400_BAD_REQUEST)
+
+        reset = since is None or since < now - timedelta(days=settings.SYNC_TOMBSTONE_RETENTION_DAYS)
+
+        notes = Note.objects.filter(owner=request.user)
+        checklists = Checklist.objects.filter(owner=request.user)
+        items = ChecklistItem.objects.none()
+        deleted = {'notes': list(), 'checklists': list(), 'checklistitems': list()}
+
+        # On a reset, each Checklist already carries all of its items, so there's no need to send them separately
+        if not reset:
+            notes = notes.filter(modified__gte=since)
+            checklists = checklists.filter(modified__gte=since)
+            items = ChecklistItem.objects.filter(checklist__owner=request.user, modified__gte=since)
+
+            tombstones = Tombstone.objects.filter(owner=request.user, deleted__gte=since)
+            for kind, object_id in tombstones.values_list('kind', 'object_id'):
+                deleted[kind + 's'].append(object_id)
+
+        context = {'request': request}
+        with measure('serialize'):
+            data = {
+                'cursor': get_next_cursor(now),
+                'reset': reset,
+                'notes': NoteValuesSerializer(context).serialize(notes),
+                'checklists': ChecklistValuesSerializer(context).serialize(checklists),
+                'checklistitems': ChecklistItemValuesSerializer(context).serialize(items),
+                'deleted': deleted,
+            }
+
+        return Response(data)
+
+
+class Operations(APIView):
+    """ API endpoint for applying a batch of writes queued up by a client, such as the dashboard's checkbox toggles and
+    edits, in a single request and a single transaction. Requires authentication. """
+
+    permission_classes = [IsAuthenticated]
+    max_operations = 100
+
+    def post(self, request):
+        """ Apply the operations in the request body, in order, and return the result of each. The body is either the
+        bare operation array, or an object with `ops`. Each operation is an object with:
+
+            key         A UUID picked by the client, which it sends again unchanged whenever it retries the operation.
+            op          'create', 'update', 'toggle' (set a checklist item's `complete`) or 'delete'.
+            type        'note', 'checklist' or 'checklistitem'.
+            id          The object, for anything but a create: its ID, or the client_id it was created with.
+            client_id   For a create, an optional UUID for the new object, which later operations can refer to it by.
+            data        The object's fields. A new checklist item names its `checklist`, as an ID or client_id.
+
+        Operations already applied, which a client retrying after a timeout will send again, aren't applied twice, but
+        get back the result they had the first time. An invalid operation fails the whole batch, and nothing is
+        applied. """
+
+        data = {'ops': request.data} if isinstance(request.data, list) else request.data
+
+        serializer = ClientOperationBatchSerializer(data=data, max_operations=self.max_operations)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=HTTP_400_BAD_REQUEST)
+
+        return Response({'results': apply_operations(request, serializer.validated_data['ops'])})
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class Bootstrap(APIView):
+    """ API endpoint returning everything the dashboard needs to render, in the same form the home page embeds it.
+    Requires authentication. """
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        """ Return the current user's Notes and Checklists as one list sorted by creation time, with a sync cursor. """
+        return Response(get_bootstrap_data(request))
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class Search(APIView):
+    """ API endpoint for searching the current user's Notes and Checklists, including the text of Checklist items.
+    Requires authentication. """
+
+    permission_classes = [IsAuthenticated]
+    max_limit = 100
+
+    def get(self, request):
+        """ Return the Notes and Checklists matching every word of the `q` query parameter, best match first, up to
+        `limit` of them, between 1 and 100 and 50 by default. Each result has its `type`, its `rank`, and the serialized
+        `object`. """
+
+        query = request.query_params.get('q', '').strip()
+        if not query:
+            return Response({'q': ['A search query is required.']}, status=HTTP_400_BAD_REQUEST)
+
+        try:
+            limit = min(int(request.query_params.get('limit', 50)), self.max_limit)
+        except ValueError:
+            return Response({'limit': ['A valid integer is required.']}, status=HTTP_400_BAD_REQUEST)
+        if limit < 1:
+            return Response({'limit': ['Ensure this value is greater than or equal to 1.']},
+                            status=HTTP_400_BAD_REQUEST)
+
+        hits = search(request.user, query, limit)
+
+        # Fetch all of the matching objects with one query per model, then put them back in ranked order
+        ids = {kind: [object_id for hit_kind, object_id, _ in hits if hit_kind == kind]
+               for kind, _ in SearchDocument.KIND_CHOICES}
+        objects = {
+            SearchDocument.NOTE: Note.objects.filter(owner=request.user).in_bulk(ids[SearchDocument.NOTE]),
+            SearchDocument.CHECKLIST:
+                Checklist.objects.filter(owner=request.user).with_items().in_bulk(ids[SearchDocument.CHECKLIST]),
+        }
+        serializers = {SearchDocument.NOTE: NoteSerializer, SearchDocument.CHECKLIST: ChecklistSerializer}
+
+        results = list()
+        context = {'request': request}
+        for kind, object_id, rank in hits:
+            obj = objects[kind].get(object_id)
+            if obj is not None:
+                results.append({'type': kind, 'rank': rank, 'object': serializers[kind](obj, context=context).data})
+
+        return Response({'results': results})
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class Export(APIView):
+    """ API endpoint for downloading everything the current user owns, as NDJSON or as a zip archive. Requires
+    authentication. """
+
+    permission_classes = [IsAuthenticated]
+    archive = False
+
+    def get(self, request):
+        """ Stream the export as it's read from the database, so that it never has to be held in memory at once. """
+
+        extension, content_type, chunks = ('zip', 'application/zip', iter_zip(request.user)) if self.archive else\
+            ('ndjson', 'application/x-ndjson', iter_ndjson(request.user))
+
+        response = StreamingHttpResponse(chunks, content_type=content_type)
+        response['Content-Disposition'] = 'attachment; filename="cloudcache-{}-{}.{}"'.format(
+            request.user.username, timezone.now().strftime('%Y%m%d'), extension)
+        return response
+
+
+class Import(APIView):
+    """ API endpoint for uploading an export, from this or another cloudCache account, adding everything in it to the
+    current user's account. Requires authentication. """
+
+    permission_classes = [IsAuthenticated]
+    parser_classes = [MultiPartParser]
+
+    def post(self, request):
+        """ Import the NDJSON or zip export uploaded as `file`, returning how many of each object were created. Django
+        spools large uploads to disk, and the import reads them a line at a time. """
+
+        upload = request.data.get('file')
+        if upload is None:
+            return Response({'file': ['An export file is required.']}, status=HTTP_400_BAD_REQUEST)
+
+        try:
+            counts = import_records(request.user, upload)
+        except InvalidImportError as e:
+            return Response({'file': [str(e)]}, status=HTTP_400_BAD_REQUEST)
+
+        return Response(counts, status=HTTP_201_CREATED)
+
+
+class Events(APIView):
+    """ API endpoint streaming a server-sent event for every change to the current user's Notes, Checklists and
+    ChecklistItems, so that open dashboards can pick up each other's edits as they happen. Requires authentication. """
+
+    permission_classes = [IsAuthenticated]
+    renderer_classes = [FastJSONRenderer, EventStreamRenderer]
+
+    def get(self, request):
+        """ Stream the events. Each is a `change` event whose data is the `type`, `action` and `id` of what changed,
+        after which the client fetches the changes themselves with an incremental sync. Under ASGI, this endpoint is
+        served by api.events.EventStreamApplication instead.
+
+        Under WSGI, a stream ties up a worker thread for as long as it's open, so unless EVENTS_WSGI_STREAM is set, a
+        204 is returned instead, which tells the browser's EventSource to give up rather than reconnect. """
+
+        if not settings.EVENTS_WSGI_STREAM:
+            return Response(status=HTTP_204_NO_CONTENT)
+
+        response = StreamingHttpResponse(iter_event_stream(request.user.pk), content_type='text/event-stream')
+        response['Cache-Control'] = 'no-cache'
+        response['X-Accel-Buffering'] = 'no'
+        return response
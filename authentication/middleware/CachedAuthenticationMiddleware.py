@@ -0,0 +1,14 @@
+from django.contrib.auth.middleware import AuthenticationMiddleware
+from django.utils.functional import SimpleLazyObject
+
+from . import get_cached_user
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class CachedAuthenticationMiddleware(AuthenticationMiddleware):
+    """ Drop-in replacement for Django's AuthenticationMiddleware which resolves `request.user` from the cache, rather
+    than loading the Account row on every request. As with Django's, the user is only resolved when first used. """
+
+    def process_request(self, request):
+        assert hasattr(request, 'session'), 'CachedAuthenticationMiddleware requires the session middleware.'
+        request.user = SimpleLazyObject(lambda: get_cached_user(request))
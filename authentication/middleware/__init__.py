@@ -0,0 +1,52 @@
+from django.conf import settings
+from django.contrib.auth import SESSION_KEY, BACKEND_SESSION_KEY, HASH_SESSION_KEY, get_user_model, load_backend
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.utils.crypto import constant_time_compare
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+def get_user_cache_key(user_id):
+    return 'authentication:account:{}'.format(user_id)
+
+
+def forget_cached_user(user_id):
+    """ Drop an Account from the user cache, so that the next request loads it fresh from the database. """
+    cache.delete(get_user_cache_key(user_id))
+
+
+def get_cached_user(request):
+    """ Return the user logged in to the request's session, or an AnonymousUser. This does the same as
+    django.contrib.auth.get_user, including logging the session out if its password hash no longer matches, except that
+    the Account comes from the cache when it's there.
+
+    The cache may be local to this process, so a cached Account is only trusted while it agrees with the session, which
+    is always read from the database. When they disagree the Account is reloaded before the session is logged out, so a
+    password change made through another process is seen as soon as the session carrying the new hash is used. """
+
+    try:
+        user_id = get_user_model()._meta.pk.to_python(request.session[SESSION_KEY])
+        backend_path = request.session[BACKEND_SESSION_KEY]
+    except KeyError:
+        return AnonymousUser()
+
+    if backend_path not in settings.AUTHENTICATION_BACKENDS:
+        return AnonymousUser()
+
+    session_hash = request.session.get(HASH_SESSION_KEY)
+    cache_key = get_user_cache_key(user_id)
+    user = cache.get(cache_key)
+    if user is None or not session_hash or not constant_time_compare(session_hash, user.get_session_auth_hash()):
+        user = load_backend(backend_path).get_user(user_id)
+        if user is None:
+            cache.delete(cache_key)
+            return AnonymousUser()
+        cache.set(cache_key, user, settings.USER_CACHE_TIMEOUT)
+
+    if not session_hash or not constant_time_compare(session_hash, user.get_session_auth_hash()):
+        request.session.flush()
+        return AnonymousUser()
+
+    return user
+
+from .CachedAuthenticationMiddleware import CachedAuthenticationMiddleware
@@ -0,0 +1,56 @@
+from hashlib import sha256
+
+from django.conf import settings
+from django.db.models import Model, Manager, CharField, DateTimeField, ForeignKey, CASCADE
+from django.utils.crypto import get_random_string
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class ApiTokenManager(Manager):
+    """ Manager for issuing ApiTokens. """
+
+    def issue(self, owner, name=''):
+        """ Create a new ApiToken for an Account. Only the hash of the key is stored, so the key itself is returned here
+        and can never be retrieved again.
+        :param owner: The Account the token authenticates as
+        :param name: A label to help the user tell their tokens apart
+        :return: A tuple of the new ApiToken and its key
+        """
+
+        key = get_random_string(ApiToken.KEY_LENGTH)
+        prefix = key[:ApiToken.PREFIX_LENGTH]
+        token = self.create(owner=owner, name=name, prefix=prefix, key_hash=ApiToken.hash_key(key))
+        return token, key
+
+
+class ApiToken(Model):
+    """ A key for scripted API clients to authenticate with, instead of sending their password on every request.
+
+    Keys are long random strings rather than something a person chooses, so unlike passwords they can't be guessed from
+    a wordlist, and a single fast SHA-256 is enough to keep a leaked database from revealing them. Looking a token up
+    costs one hash and one indexed query, instead of a deliberately slow PBKDF2 password check. """
+
+    KEY_LENGTH = 40
+    PREFIX_LENGTH = 8
+
+    class Meta:
+        ordering = ('id',)
+
+    owner    = ForeignKey(settings.AUTH_USER_MODEL, on_delete=CASCADE, related_name='api_tokens')
+    name     = CharField(max_length=64, blank=True)
+    prefix   = CharField(max_length=PREFIX_LENGTH)
+    key_hash = CharField(max_length=64, unique=True)
+    created  = DateTimeField(auto_now_add=True)
+
+    objects = ApiTokenManager()
+
+    @staticmethod
+    def hash_key(key):
+        """ Return the hex SHA-256 digest stored for a key. """
+        return sha256(key.encode('utf-8')).hexdigest()
+
+    def __repr__(self):
+        return '<ApiToken: {}...>'.format(self.prefix)
+
+    def __str__(self):
+        return self.name or self.prefix
@@ -1 +1,2 @@
 from .Account import Account, AccountManager
+from .ApiToken import ApiToken, ApiTokenManager
@@ -0,0 +1,27 @@
+from django.db.models.signals import post_delete, post_save
+
+from .models import Account, ApiToken
+from .middleware import forget_cached_user
+from .tokens import token_cache
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+def forget_token(sender, instance, **kwargs):
+    """ Stop accepting a revoked ApiToken straight away, at least in this process. """
+    token_cache.discard(token_id=instance.pk)
+
+
+def forget_account(sender, instance, **kwargs):
+    """ Drop every cached copy of an Account which has changed or been deleted: the one used for its sessions, and the
+    ones held by its cached tokens. """
+
+    forget_cached_user(instance.pk)
+    token_cache.discard(owner_id=instance.pk)
+
+
+def connect_signals():
+    """ Connect the signal handlers which keep the user and token caches in sync with the database. """
+
+    post_delete.connect(forget_token, sender=ApiToken)
+    post_save.connect(forget_account, sender=Account)
+    post_delete.connect(forget_account, sender=Account)
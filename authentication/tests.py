@@ -1,3 +1,139 @@
+from base64 import b64encode
+
+from django.contrib.auth import HASH_SESSION_KEY
+from django.contrib.sessions.backends.db import SessionStore
+from django.contrib.sessions.models import Session
+from django.core.cache import cache
 from django.test import TestCase
+from django.test.client import RequestFactory
+from rest_framework.exceptions import AuthenticationFailed
+
+from .middleware import get_user_cache_key
+from .models import Account, ApiToken
+from .tokens import ApiTokenAuthentication, token_cache
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class ApiTokenTests(TestCase):
+    """ Issuing, using and revoking API tokens. """
+
+    def setUp(self):
+        token_cache.clear()
+        self.account = Account.objects.create_user('owner', 'owner@example.com', 'password')
+        self.basic_auth = 'Basic ' + b64encode(b'owner:password').decode()
+
+    def test_issue_and_authenticate(self):
+        """ A token issued with a password authenticates later requests, and only its hash is stored. """
+
+        response = self.client.post('/api/tokens/', {'name': 'script'}, secure=True, HTTP_AUTHORIZATION=self.basic_auth)
+        self.assertEqual(response.status_code, 201)
+
+        key = response.json()['key']
+        token = ApiToken.objects.get()
+        self.assertEqual(token.key_hash, ApiToken.hash_key(key))
+        self.assertNotIn('key', self.client.get('/api/tokens/', secure=True, HTTP_AUTHORIZATION=self.basic_auth).json())
+
+        response = self.client.get('/api/notes/', secure=True, HTTP_AUTHORIZATION='Token ' + key)
+        self.assertEqual(response.status_code, 200)
+
+    def test_cached_token_skips_database(self):
+        """ Once verified, a token is served from the cache without any queries. """
+
+        _, key = ApiToken.objects.issue(self.account)
+        request = RequestFactory().get('/api/', HTTP_AUTHORIZATION='Token ' + key)
+
+        with self.assertNumQueries(1):
+            ApiTokenAuthentication().authenticate(request)
+
+        with self.assertNumQueries(0):
+            user, _ = ApiTokenAuthentication().authenticate(request)
+        self.assertEqual(user, self.account)
+
+    def test_revoked_token_is_rejected(self):
+        """ Deleting a token stops it working straight away, even though it was cached. """
+
+        token, key = ApiToken.objects.issue(self.account)
+        request = RequestFactory().get('/api/', HTTP_AUTHORIZATION='Token ' + key)
+        ApiTokenAuthentication().authenticate(request)
+
+        url = '/api/tokens/{}/'.format(token.pk)
+        response = self.client.delete(url, secure=True, HTTP_AUTHORIZATION='Token ' + key)
+        self.assertEqual(response.status_code, 204)
+
+        with self.assertRaises(AuthenticationFailed):
+            ApiTokenAuthentication().authenticate(request)
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class CachedAuthenticationTests(TestCase):
+    """ The logged-in Account is served from the cache, but never outlives its session. """
+
+    def setUp(self):
+        cache.clear()
+        self.account = Account.objects.create_user('owner', 'owner@example.com', 'password')
+        self.client.login(username='owner', password='password')
+
+    def test_user_is_cached(self):
+        """ Once cached, resolving the user takes only the session's query, where it used to take two. """
+
+        self.client.get('/api/', secure=True)
+
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/', secure=True)
+        self.assertEqual(response.wsgi_request.user, self.account)
+
+        cache.clear()
+        with self.assertNumQueries(2):
+            self.assertEqual(self.client.get('/api/', secure=True).status_code, 200)
+
+    def test_username_change_is_seen(self):
+        self.client.get('/api/', secure=True)
+        self.client.patch('/api/accounts/{}/'.format(self.account.pk), '{"username": "renamed"}',
+                          content_type='application/json', secure=True)
+
+        response = self.client.get('/api/accounts/{}/'.format(self.account.pk), secure=True)
+        self.assertEqual(response.wsgi_request.user.username, 'renamed')
+
+    def test_password_change_logs_out(self):
+        """ Changing the password through the API invalidates existing sessions, as it does without the cache. """
+
+        self.client.get('/api/', secure=True)
+        self.client.patch('/api/accounts/{}/'.format(self.account.pk), '{"password": "changed"}',
+                          content_type='application/json', secure=True)
+
+        response = self.client.get('/api/', secure=True)
+        self.assertFalse(response.wsgi_request.user.is_authenticated)
+
+    def test_logout_in_another_process(self):
+        """ A session deleted by another process is logged out here too, even though this process still caches its
+        Account. """
+
+        self.client.get('/api/', secure=True)
+        Session.objects.all().delete()
+
+        response = self.client.get('/api/', secure=True)
+        self.assertFalse(response.wsgi_request.user.is_authenticated)
+
+    def test_password_change_in_another_process(self):
+        """ Another process changing the password doesn't evict this process's cached Account, which is left holding
+        the old hash. The session which made the change carries the new hash, so it reloads the Account rather than
+        being logged out, while other sessions are logged out once the stale copy is gone. """
+
+        self.client.get('/api/', secure=True)
+        other = self.client_class()
+        other.login(username='owner', password='password')
+        stale = cache.get(get_user_cache_key(self.account.pk))
+
+        self.account.set_password('changed')
+        Account.objects.filter(pk=self.account.pk).update(password=self.account.password)
+        session = SessionStore(session_key=self.client.session.session_key)
+        session[HASH_SESSION_KEY] = self.account.get_session_auth_hash()
+        session.save()
+        self.assertEqual(cache.get(get_user_cache_key(self.account.pk)), stale)
+
+        response = self.client.get('/api/', secure=True)
+        self.assertTrue(response.wsgi_request.user.is_authenticated)
+        self.assertEqual(response.wsgi_request.user.password, self.account.password)
 
-# Create your tests here.
+        response = other.get('/api/', secure=True)
+        self.assertFalse(response.wsgi_request.user.is_authenticated)
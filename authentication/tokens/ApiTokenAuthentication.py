@@ -0,0 +1,53 @@
+from copy import copy
+
+from rest_framework.authentication import BaseAuthentication, get_authorization_header
+from rest_framework.exceptions import AuthenticationFailed
+
+from ..models import ApiToken
+from . import token_cache
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class ApiTokenAuthentication(BaseAuthentication):
+    """ DRF authentication class for ApiTokens, sent as `Authorization: Token <key>`. Verified tokens are kept in the
+    in-process token cache, so repeat requests cost a SHA-256 and a dictionary lookup rather than a query. """
+
+    keyword = 'Token'
+
+    def authenticate(self, request):
+        auth = get_authorization_header(request).split()
+        if not auth or auth[0].lower() != self.keyword.lower().encode():
+            return None
+
+        if len(auth) != 2:
+            raise AuthenticationFailed('Invalid token header. The token should be a single string without spaces.')
+
+        try:
+            key = auth[1].decode()
+        except UnicodeError:
+            raise AuthenticationFailed('Invalid token header. The token should only contain valid characters.')
+
+        return self.authenticate_credentials(key)
+
+    def authenticate_credentials(self, key):
+        """ Return a (user, token) tuple for the key, or raise AuthenticationFailed. """
+
+        key_hash = ApiToken.hash_key(key)
+
+        token = token_cache.get(key_hash)
+        if token is None:
+            try:
+                token = ApiToken.objects.select_related('owner').get(key_hash=key_hash)
+            except ApiToken.DoesNotExist:
+                raise AuthenticationFailed('Invalid token.')
+
+            if not token.owner.is_active:
+                raise AuthenticationFailed('User inactive or deleted.')
+
+            token_cache.set(token)
+
+        # The cached Account is shared between requests and threads, so each request gets its own copy to work with
+        return copy(token.owner), token
+
+    def authenticate_header(self, request):
+        return self.keyword
@@ -0,0 +1,55 @@
+from collections import OrderedDict, namedtuple
+from threading import Lock
+from time import monotonic
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+CachedToken = namedtuple('CachedToken', ('token', 'expires'))
+
+
+class TokenCache(object):
+    """ In-process LRU cache of verified ApiTokens, keyed by the hash of their key, so that a client making a run of
+    requests with the same token only hits the database for the first one. Entries expire after `ttl` seconds, which
+    bounds how long a token revoked in another process stays usable in this one. Safe to share between threads. """
+
+    def __init__(self, max_size, ttl):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.entries = OrderedDict()
+        self.lock = Lock()
+
+    def get(self, key_hash):
+        """ Return the cached ApiToken for the key hash, with its owner loaded, or None if it isn't cached. """
+
+        with self.lock:
+            entry = self.entries.get(key_hash)
+            if entry is None:
+                return None
+
+            if entry.expires < monotonic():
+                del self.entries[key_hash]
+                return None
+
+            self.entries.move_to_end(key_hash)
+            return entry.token
+
+    def set(self, token):
+        """ Cache a verified ApiToken, which must have its owner loaded, evicting the least recently used if full. """
+
+        with self.lock:
+            self.entries[token.key_hash] = CachedToken(token, monotonic() + self.ttl)
+            self.entries.move_to_end(token.key_hash)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    def discard(self, token_id=None, owner_id=None):
+        """ Drop the cached token with the given ID, or every cached token belonging to the given Account. """
+
+        with self.lock:
+            for key_hash, entry in list(self.entries.items()):
+                if entry.token.pk == token_id or entry.token.owner_id == owner_id:
+                    del self.entries[key_hash]
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
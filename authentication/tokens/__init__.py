@@ -0,0 +1,9 @@
+from django.conf import settings
+
+from .TokenCache import TokenCache
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+token_cache = TokenCache(settings.API_TOKEN_CACHE_SIZE, settings.API_TOKEN_CACHE_TTL)
+
+from .ApiTokenAuthentication import ApiTokenAuthentication
@@ -5,20 +5,32 @@ $(function(){
     var util = {
 
         /**
-         * Handlebars.js helper function to render note body contents into the note template. Takes each line break in
-         * note contents, replaces it with an HTML line break element, and puts the line itself with the <br> into a
-         * <div>. When complete, returns the div's inner html.
+         * Handlebars.js helper function to render a note's plain text preview into the note template. Takes each line
+         * break in the preview, replaces it with an HTML line break element, and puts the line itself, escaped, with
+         * the <br> into a <div>. When complete, returns the div's inner html.
          **/
         renderContents: function(contents) {
             var $tmp = $('<div>');
             $.each(contents.split('\r\n'), function(i, line){
                 $tmp
-                    .append(line)
+                    .append(document.createTextNode(line))
                     .append($('<br>'));
             });
             return new Handlebars.SafeString($tmp.html());
         },
 
+        /**
+         * Turn a note's full content, as stored, back into the HTML edited in the note modal, with a <br> after each
+         * line.
+         **/
+        contentsToHtml: function(contents) {
+            var html = '';
+            $.each(contents.split('\r\n'), function(i, line){
+                html += line + '<br>';
+            });
+            return html;
+        },
+
         hasOwnProperty: function(obj, prop) {
             var proto = obj.__proto__ || obj.constructor.prototype;
             return (prop in obj) &&
@@ -68,6 +80,45 @@ $(function(){
             };
         },
 
+        /**
+         * Work out the edit which turns one text into another, as a content patch for the API: everything between the
+         * longest common prefix and suffix is replaced. Offsets count UTF-16 code units, the way the server expects,
+         * and are moved back rather than split a surrogate pair.
+         **/
+        diffText: function(before, after) {
+            var max = Math.min(before.length, after.length);
+
+            var start = 0;
+            while (start < max && before.charCodeAt(start) == after.charCodeAt(start)) start++;
+            if (start > 0 && /[\ud800-\udbff]/.test(before.charAt(start - 1))) start--;
+
+            var end = 0;
+            while (end < max - start &&
+                   before.charCodeAt(before.length - end - 1) == after.charCodeAt(after.length - end - 1)) end++;
+            if (end > 0 && /[\udc00-\udfff]/.test(before.charAt(before.length - end))) end--;
+
+            return [{
+                'at'     : start,
+                'delete' : before.length - start - end,
+                'insert' : after.substring(start, after.length - end),
+            }];
+        },
+
+        /**
+         * Generate a random (version 4) UUID, for the idempotency keys and client IDs of queued operations.
+         **/
+        uuid: function() {
+            var bytes = new Uint8Array(16);
+            window.crypto.getRandomValues(bytes);
+            bytes[6] = (bytes[6] & 0x0f) | 0x40;
+            bytes[8] = (bytes[8] & 0x3f) | 0x80;
+
+            var hex = Array.prototype.map.call(bytes, function(byte){
+                return (byte + 0x100).toString(16).substr(1);
+            }).join('');
+            return [hex.substr(0, 8), hex.substr(8, 4), hex.substr(12, 4), hex.substr(16, 4), hex.substr(20)].join('-');
+        },
+
         /**
          * Helper function to determine the shortest child column/container (in terms of DOM height in pixels) in a
          * parent container. At the moment, just used to get the shortest notes column inside the notes wrapper.
@@ -126,6 +177,21 @@ $(function(){
                 cancelButton: 'Cancel',
                 confirm: onConfirm,
             });
+        },
+
+        /**
+         * Convenience wrapper around jquery-confirm's alert function, styled like the confirm dialog. Only need to pass
+         * the title and content.
+         **/
+        alert: function(title, content) {
+            $.alert({
+                title: title,
+                content: content,
+                animation: 'top',
+                closeAnimation: 'bottom',
+                columnClass: 'col-md-8 col-md-offset-6 col-sm-20',
+                confirmButton: 'OK',
+            });
         }
     };
 
@@ -136,8 +202,18 @@ $(function(){
 
         tree: null,
 
-        notes: [],
-        checklists: [],
+        syncCursor: null,
+
+        // Writes waiting to be sent to the operation log, how many of them at the front have already been sent at least
+        // once, whether a batch is on its way, the callbacks for their results by key, and how long to wait before
+        // retrying after a failed send
+        operations: [],
+        operationsSent: 0,
+        operationsSending: false,
+        operationCallbacks: {},
+        operationBases: {},
+        operationRetryDelay: 0,
+        flushTimeout: null,
 
         noteTemplate: null,
         checklistTemplate: null,
@@ -148,20 +224,51 @@ $(function(){
          * Initialize the app controller, perform all the setup stuff necessary.
          **/
         init: function() {
-
-            // Register the renderContents helper function with Handlebars.js and compile the templates.
+            // Register the renderContents helper function with Handlebars.js, and use the templates from the bundle
             Handlebars.registerHelper('render', util.renderContents);
-            this.noteTemplate = Handlebars.compile($('#note-template').html());
-            this.checklistTemplate = Handlebars.compile($('#checklist-template').html());
-            this.newListItemTemplate = Handlebars.compile($('#list-item-new-template').html());
-            this.listItemTemplate = Handlebars.compile($('#list-item-template').html());
+            this.noteTemplate = Handlebars.templates['note'];
+            this.checklistTemplate = Handlebars.templates['checklist'];
+            this.newListItemTemplate = Handlebars.templates['list-item-new'];
+            this.listItemTemplate = Handlebars.templates['list-item'];
 
             this.wireEvents();
 
-            // Do an initial load of the notes and checklists
-            $.when(this.async_loadChecklists(), this.async_loadNotes()).done(function(){
-                this.buildNotes.bind(this)();
+            // Send anything still queued as soon as the connection comes back, and warn before leaving it unsent
+            $(window).on('online', this.flushOperations.bind(this));
+            $(window).on('beforeunload', function(){
+                if (this.operations.length) return 'Some changes haven\'t been saved yet.';
             }.bind(this));
+
+            // Render the notes and checklists embedded in the page if they're there, otherwise fetch them from the API
+            var $bootstrap = $('#bootstrap-data');
+            if ($bootstrap.length) {
+                this.buildNotes(JSON.parse($bootstrap.text()));
+                this.listenForChanges();
+            } else {
+                this.loadBootstrap(0);
+            }
+        },
+
+        /**
+         * Fetch the bootstrap data from the API and build the notes and checklists from it. A failed request is retried
+         * after a delay which doubles each time, up to 30 seconds, unless the API refused it outright, such as when the
+         * session has expired, in which case the user is told to reload the page instead.
+         **/
+        loadBootstrap: function(retryDelay) {
+            this.async_loadBootstrap()
+                .done(function(bootstrap){
+                    this.buildNotes(bootstrap);
+                    this.listenForChanges();
+                }.bind(this))
+                .fail(function(xhr){
+                    if (xhr.status >= 400 && xhr.status < 500 && xhr.status != 429) {
+                        util.alert('Couldn\'t load your notes', 'Reload the page to try again.');
+                        return;
+                    }
+
+                    retryDelay = Math.min(Math.max(retryDelay * 2, 1000), 30000);
+                    setTimeout(this.loadBootstrap.bind(this, retryDelay), retryDelay);
+                }.bind(this));
         },
 
         /**
@@ -198,13 +305,15 @@ $(function(){
          * Handle the edit note modal being clicked out by doing the following:
          *      1) Get the whitespace-trimmed content of the note title
          *      2) Get the content of the note body, where <br> are replaced by \r\n
-         *      3) Make an async PUT call to update the new note. Upon success, do the following:
-         *          a) Update the note div's title with the new title
-         *          b) Update the note div's content with the new content
-         *          c) Hide the note modal
+         *      3) If either note title or content are empty, return early
+         *      4) Update the note div's title with the new one
+         *      5) Queue the update to be sent with the next batch of operations, leaving out the content if it never
+         *         finished loading or hasn't changed, and re-render the note with its new preview once it's been saved.
+         *         The content it was loaded with goes along as the base for sending just the changes
          **/
-        handleEditNoteSave: function($note) {
+        handleEditNoteSave: function($note, base) {
             var editTitle = $('#editNoteTitle').text().trim();
+            var data = {'title': editTitle};
 
             var editContent = '';
             $.each($('#editNoteContents').html().split('<br>'), function(i, line){
@@ -212,124 +321,112 @@ $(function(){
             });
             editContent = editContent.trim();
 
-            $.ajax({
-                url: $note.data('url'),
-                type: 'PUT',
-                timeout: 1000,
-                data: {
-                    'title'    : editTitle,
-                    'content'  : editContent,
-                    'owner'    : $note.data('owner-url'),
-                },
-                success: function(data){
-                    $note.children('.title').text(editTitle);
-                    $note.children('.contents').html($('#editNoteContents').html());
-                },
-            });
+            // An invalid operation would fail the whole batch, along with everything else queued
+            if (editTitle == '' || editContent == '') {
+                return;
+            }
+
+            $note.children('.title').text(editTitle);
+            if ($('#editNoteContents').attr('contenteditable') == 'true' && !(base && base.content == editContent)) {
+                data.content = editContent;
+            }
+
+            this.queueOperation({
+                'op'   : 'update',
+                'type' : 'note',
+                'id'   : $note.data('id'),
+                'data' : data,
+            }, function(note){
+                this.patchElement('.note', note, this.noteTemplate(note));
+            }.bind(this), base);
         },
 
         /**
-         * Handle the edit list modal being clicked out by doing the following:
+         * Return the content of the latest update to a note which the server may not have applied yet, or undefined
+         * if there isn't one.
          **/
-        handleEditListSave: function($list) {
-
-            var deferreds = Array();
+        getPendingNoteContent: function(id) {
+            for (var i = this.operations.length - 1; i >= 0; i--) {
+                var operation = this.operations[i];
+                if (operation.type != 'note' || operation.op != 'update' || operation.id != id) continue;
+
+                var base = this.operationBases[operation.key];
+                if (operation.data.content !== undefined) return operation.data.content;
+                if (base && base.edited !== undefined) return base.edited;
+            }
+        },
 
-            var count = 0;
+        /**
+         * Gather the items in the list modal into the ordered item array expected by the bulk checklist endpoint.
+         * Unchecked items come first and checked items are moved to the bottom, each group keeping its on-screen
+         * order. Items without any text are left out, which removes them from the checklist when saved.
+         **/
+        getEditListItems: function() {
+            var unchecked = Array();
+            var checked = Array();
 
             $('#editListContents')
                 .find('.item')
                 .each(function(){
-                    if(!$(this).find('input').prop('checked') && $(this).find('span').text()){
-                        count += 1;
-                        if($(this).get(0).hasAttribute('data-isnew')){
-                            deferreds.push($.ajax({
-                                url: '/api/checklistitems/',
-                                type: 'POST',
-                                timeout: 1000,
-                                data: {
-                                    'text'      : $(this).find('span').text(),
-                                    'checklist' : $list.data('url'),
-                                    'complete'  : $(this).find('input').prop('checked'),
-                                    'order'     : count,
-                                },
-                            }));
-                        } else {
-                            deferreds.push($.ajax({
-                                url: $(this).data('url'),
-                                type: 'PUT',
-                                timeout: 1000,
-                                data: {
-                                    'text'      : $(this).find('span').text(),
-                                    'checklist' : $list.data('url'),
-                                    'complete'  : $(this).find('input').prop('checked'),
-                                    'order'     : count,
-                                },
-                            }));
-                        }
+                    var text = $(this).find('span').text();
+                    if (!text) return;
+
+                    var item = {
+                        'text'     : text,
+                        'complete' : $(this).find('input').prop('checked'),
+                    };
+                    if (!$(this).get(0).hasAttribute('data-isnew')) {
+                        item.id = $(this).data('id');
                     }
-                });
 
-            $('#editListContents')
-                .find('.item')
-                .each(function(){
-                    if($(this).find('input').prop('checked') && $(this).find('span').text()){
-                        count += 1;
-                        if($(this).get(0).hasAttribute('data-isnew')){
-                            deferreds.push($.ajax({
-                                url: '/api/checklistitems/',
-                                type: 'POST',
-                                timeout: 1000,
-                                data: {
-                                    'text'      : $(this).find('span').text(),
-                                    'checklist' : $list.data('url'),
-                                    'complete'  : $(this).find('input').prop('checked'),
-                                    'order'     : count,
-                                },
-                            }));
-                        } else {
-                            deferreds.push($.ajax({
-                                url: $(this).data('url'),
-                                type: 'PUT',
-                                timeout: 1000,
-                                data: {
-                                    'text'      : $(this).find('span').text(),
-                                    'checklist' : $list.data('url'),
-                                    'complete'  : $(this).find('input').prop('checked'),
-                                    'order'     : count,
-                                },
-                            }));
-                        }
-                    }
+                    (item.complete ? checked : unchecked).push(item);
                 });
 
-            var editTitle = $('#editListTitle').text().trim();
+            return unchecked.concat(checked);
+        },
+
+        /**
+         * Replace the title and entire contents of a checklist in one request to the bulk checklist endpoint, and call
+         * the callback with the refreshed checklist.
+         **/
+        saveListContents: function(listUrl, title, items, callback) {
+            $.ajax({
+                url: listUrl + 'items/bulk/',
+                type: 'PUT',
+                timeout: 10000,
+                contentType: 'application/json',
+                data: JSON.stringify({
+                    'title' : title,
+                    'items' : items,
+                }),
+                success: function(data){
+                    if (callback) callback(data);
+                },
+            });
+        },
+
+        /**
+         * Handle the edit list modal being clicked out by doing the following:
+         *      1) Gather the ordered items from the list modal
+         *      2) Save the list title and items in a single bulk request. Upon success, do the following:
+         *          a) Render the refreshed checklist, whose items come back already sorted, replacing the old one
+         *          b) Re-apply the fancy checkboxes and their events, and zoom the checklist back in
+         **/
+        handleEditListSave: function($list) {
 
             var renderChecklist = this.checklistTemplate;
             var rebindChecklistCheckboxEvents = this.rebindChecklistCheckboxEvents.bind(this);
 
-            $.when.apply($, deferreds).done(function(){
-                $.ajax({
-                    url: $list.data('url'),
-                    type: 'PUT',
-                    timeout: 1000,
-                    data: {
-                        'title'    : editTitle,
-                        'owner'    : $list.data('owner-url'),
-                    },
-                    success: function(data){
-                        data.items = data.items.sort(function(a,b){
-                            return a.order - b.order;
-                        });
-                        var $newList = $(renderChecklist(data));
-                        $list.replaceWith($newList);
+            var editTitle = $('#editListTitle').text().trim();
 
-                        util.refreshFancyCheckboxes();
-                        rebindChecklistCheckboxEvents();
+            this.saveListContents($list.data('url'), editTitle, this.getEditListItems(), function(data){
+                var $newList = $(renderChecklist(data));
+                $list.replaceWith($newList);
 
-                        $newList.showThenAnimateCss('zoomIn');
-                    },
-                });
+                util.refreshFancyCheckboxes();
+                rebindChecklistCheckboxEvents();
+
+                $newList.showThenAnimateCss('zoomIn');
             });
         },
 
@@ -337,14 +434,18 @@ $(function(){
          * Handle a note being clicked by doing the following:
          *      1) Make sure we have a ref to the actual note itself, in case an internal element click triggered this
          *      2) Set the note modal title to the title of the note being clicked, trigger change to erase placeholder
-         *      3) Set the note modal content to that of the note being clicked, trigger change to erase placeholder
+         *      3) Set the note modal content to the preview of the note being clicked, read-only, while the full
+         *         content and its hash are fetched from the note's detail endpoint, then let it be edited once it's
+         *         loaded. If this client has changes to the content the server may not have yet, those are shown
+         *         instead, and the whole content is sent again
          *      4) Attach a click handler to the note modal's save button to perform saving the note
          *      5) Attach a click handler to the note modal's delete button to perform deleting the note
          *      6) Attach misc handlers to the note modal itself:
          *          a) After being shown, put the cursor at the end of the title div
          *          b) When hiding/closing the modal, do the following:
          *              i) Animate/zoom the note being edited back in
-         *              ii) Disconnect all event handlers on the modal itself, save button, delete button, and title
+         *              ii) Disconnect all event handlers on the modal itself, save button, delete button, and title,
+         *                  and give up on the content if it's still loading
          *      7) Attach a keypress handler on the note modal title to capture enter key and trigger a save btn click
          *      8) Hide/zoom out the note being edited
          *      9) Show the modal
@@ -360,9 +461,29 @@ $(function(){
                 .trigger('change');
 
             $('#editNoteContents')
+                .attr('contenteditable', 'false')
                 .html($note.children('.contents').html())
                 .trigger('change');
 
+            var base = null;
+            var request = $.ajax({
+                url: $note.data('url'),
+                type: 'GET',
+                data: {'fields': 'content,content_hash'},
+                timeout: 10000,
+            }).done(function(note){
+                var content = this.getPendingNoteContent($note.data('id'));
+                if (content === undefined) {
+                    content = note.content;
+                    base = {'content': note.content, 'hash': note.content_hash};
+                }
+
+                $('#editNoteContents')
+                    .html(util.contentsToHtml(content))
+                    .attr('contenteditable', 'true')
+                    .trigger('change');
+            }.bind(this));
+
             $('#editNoteDelete').click(function(){
                 this.handleNoteModalNoteDelete($note);
             }.bind(this));
@@ -372,7 +493,8 @@ $(function(){
                     util.setEndOfContenteditable($('#editNoteTitle'));
                 })
                 .on('hide.bs.modal', function(){
-                    this.handleEditNoteSave($note);
+                    request.abort();
+                    this.handleEditNoteSave($note, base);
                     $note.showThenAnimateCss('zoomIn');
                     $('#editNote, #editNoteTitle, #editNoteDelete').off();
                 }.bind(this));
@@ -416,44 +538,34 @@ $(function(){
         },
 
         /**
-         * Perform an ajax call to delete the provided note (a jQuery object of a note div). When the async call is
-         * done, do the following:
-         *      1) Animate the note div with a zoom-out animation to make it visually disappear
-         *      2) Remove the note div from the DOM
-         *      3) If a callback function was supplied, call it
+         * Delete the provided note (a jQuery object of a note div) by doing the following:
+         *      1) Queue the delete to be sent with the next batch of operations
+         *      2) Animate the note div with a zoom-out animation to make it visually disappear
+         *      3) Remove the note div from the DOM
+         *      4) If a callback function was supplied, call it
          **/
         deleteNote: function($note, callback) {
-            $.ajax({
-                url: $note.data('url'),
-                type: 'DELETE',
-                timeout: 1000,
-                success: function() {
-                    $note.animateCss('zoomOut', function() {
-                        $note.remove();
-                        if (callback) callback();
-                    });
-                },
+            this.queueOperation({'op': 'delete', 'type': 'note', 'id': $note.data('id')});
+
+            $note.animateCss('zoomOut', function() {
+                $note.remove();
+                if (callback) callback();
             });
         },
 
         /**
-         * Perform an ajax call to delete the provided list (a jQuery object of a list div). When the async call is
-         * done, do the following:
-         *      1) Animate the list div with a zoom-out animation to make it visually disappear
-         *      2) Remove the list div from the DOM
-         *      3) If a callback function was supplied, call it
+         * Delete the provided list (a jQuery object of a list div) by doing the following:
+         *      1) Queue the delete to be sent with the next batch of operations
+         *      2) Animate the list div with a zoom-out animation to make it visually disappear
+         *      3) Remove the list div from the DOM
+         *      4) If a callback function was supplied, call it
          **/
         deleteList: function($list, callback) {
-            $.ajax({
-                url: $list.data('url'),
-                type: 'DELETE',
-                timeout: 1000,
-                success: function() {
-                    $list.animateCss('zoomOut', function() {
-                        $list.remove();
-                        if (callback) callback();
-                    });
-                },
+            this.queueOperation({'op': 'delete', 'type': 'checklist', 'id': $list.data('id')});
+
+            $list.animateCss('zoomOut', function() {
+                $list.remove();
+                if (callback) callback();
             });
         },
 
@@ -462,11 +574,8 @@ $(function(){
          *      1) Get the whitespace-trimmed content of the note title
          *      2) Get the content of the note body, where <br> are replaced by \r\n
          *      3) If either note title or content are empty, alert the user and return early
-         *      4) Make an async POST call to create the new note. Upon success, do the following:
-         *          a) Render the note with the note template
-         *          b) Append it to the shortest column in the notes wrapper
-         *          c) Animate the note and fade it in
-         *          d) Hide the note modal
+         *      4) Queue the new note to be created with the next batch of operations. Once it has been, render it with
+         *         the note template, append it to the shortest column in the notes wrapper, and fade it in
          **/
         handleNewNoteSave: function() {
 
@@ -482,108 +591,50 @@ $(function(){
                 return;
             }
 
-            // Make POST call to create new note
-            $.ajax({
-                url: '/api/notes/',
-                type: 'POST',
-                timeout: 1000,
-                contentType: 'application/json',
-                data: JSON.stringify({
-                    'title'  : editTitle,
-                    'content': editContent,
-                }),
-                success: function(note){
-                    $(this.noteTemplate(note))
-                        .appendTo(util.getShortestColumn())
-                        .animateCss('fadeIn');
-                }.bind(this),
-            });
+            this.queueOperation({
+                'op'        : 'create',
+                'type'      : 'note',
+                'client_id' : util.uuid(),
+                'data'      : {'title': editTitle, 'content': editContent},
+            }, function(note){
+                this.patchElement('.note', note, this.noteTemplate(note));
+            }.bind(this));
         },
 
         /**
          * Handle the new list modal being clicked out by doing the following:
+         *      1) Gather the ordered items from the list modal
+         *      2) Queue the new checklist to be created, followed by each of its items, which refer to the checklist by
+         *         the ID given to it here, since its real ID isn't known yet. They're all sent in the same batch, and
+         *         once they've been created, the checklist and its items are rendered in place
          **/
         handleNewListSave: function() {
 
-            var renderChecklist = this.checklistTemplate;
-            var rebindChecklistCheckboxEvents = this.rebindChecklistCheckboxEvents.bind(this);
-
-            var getCompleteNewNoteAndRender = function(listUrl){
-                $.ajax({
-                    url: listUrl,
-                    type: 'GET',
-                    timeout: 1000,
-                    success: function(data){
-                        var $newList = $(renderChecklist(data));
-                        $newList.appendTo(util.getShortestColumn());
-
-                        util.refreshFancyCheckboxes();
-                        rebindChecklistCheckboxEvents();
-
-                        $newList.showThenAnimateCss('zoomIn');
-                    },
-                });
-            };
-
-            var saveItems = function(listUrl){
-                var count = 0;
-                var deferreds = Array();
-
-                $('#editListContents')
-                    .find('.item')
-                    .each(function(){
-                        if(!$(this).find('input').prop('checked') && $(this).find('span').text()){
-                            count += 1;
-                            deferreds.push($.ajax({
-                                url: '/api/checklistitems/',
-                                type: 'POST',
-                                timeout: 1000,
-                                data: {
-                                    'text'      : $(this).find('span').text(),
-                                    'checklist' : listUrl,
-                                    'complete'  : false,
-                                    'order'     : count,
-                                },
-                            }));
-                        }
-                    });
+            var editTitle = $('#editListTitle').text().trim();
+            var checklistId = util.uuid();
 
-                $('#editListContents')
-                    .find('.item')
-                    .each(function(){
-                        if($(this).find('input').prop('checked') && $(this).find('span').text()){
-                            count += 1;
-                            deferreds.push($.ajax({
-                                url: '/api/checklistitems/',
-                                type: 'POST',
-                                timeout: 1000,
-                                data: {
-                                    'text'      : $(this).find('span').text(),
-                                    'checklist' : listUrl,
-                                    'complete'  : true,
-                                    'order'     : count,
-                                },
-                            }));
-                        }
-                    });
+            if (editTitle == '') {
+                return;
+            }
 
-                $.when.apply($, deferreds).done(function(){
-                    getCompleteNewNoteAndRender(listUrl);
-                });
-            };
+            this.queueOperation({
+                'op'        : 'create',
+                'type'      : 'checklist',
+                'client_id' : checklistId,
+                'data'      : {'title': editTitle},
+            }, function(checklist){
+                this.patchElement('.checklist', checklist, this.checklistTemplate(checklist));
+            }.bind(this));
 
-            $.ajax({
-                url: '/api/checklists/',
-                type: 'POST',
-                timeout: 1000,
-                contentType: 'application/json',
-                data: JSON.stringify({
-                    'title' : $('#editListTitle').text().trim(),
-                }),
-                success: function(data){
-                    saveItems(data.url);
-                },
-            });
+            $.each(this.getEditListItems(), function(i, item){
+                this.queueOperation({
+                    'op'   : 'create',
+                    'type' : 'checklistitem',
+                    'data' : {'checklist': checklistId, 'text': item.text, 'complete': item.complete},
+                }, function(item){
+                    this.patchChecklistItem(i, item);
+                }.bind(this));
+            }.bind(this));
         },
 
         /**
@@ -605,7 +656,7 @@ $(function(){
             $('#editNoteTitle').text('')
                 .trigger('change');
 
-            $('#editNoteContents').html('')
+            $('#editNoteContents').attr('contenteditable', 'true').html('')
                 .trigger('change');
 
             $('#editNote')
@@ -704,6 +755,7 @@ $(function(){
 
         getListElement: function($listItem) {
             return $(this.listItemTemplate({
+                id: $listItem.data('id'),
                 url: $listItem.data('url'),
                 text: $listItem.find('span').text(),
                 complete: $listItem.find('span').hasClass('complete'),
@@ -822,21 +874,130 @@ $(function(){
         },
 
         /**
-         * Perform an async ajax call to update a checklist item with the parameters sent in the function.
+         * Queue a write to be sent to the operation log, with a new idempotency key, and call the callback with the
+         * object it creates or changes once it's been applied. A toggle or update of something which already has one
+         * queued, and not yet sent, is merged into that one, so a burst of checkbox clicks is a single operation.
+         *
+         * A note update may come with the base it was edited from: the note's content as the server has it, and its
+         * hash. If the changes are smaller than the content, only they are sent.
+         **/
+        queueOperation: function(operation, callback, base) {
+            var queued = this.operations.slice(this.operationsSent).filter(function(other){
+                return other.op == operation.op && other.type == operation.type && other.id == operation.id &&
+                    (operation.op == 'toggle' || operation.op == 'update');
+            })[0];
+
+            if (queued) {
+                // Once a queued update has content, its base still holds, since the server hasn't seen that content
+                if (base && queued.data.content === undefined) this.operationBases[queued.key] = base;
+                $.extend(queued.data, operation.data);
+                operation = queued;
+            } else {
+                operation.key = util.uuid();
+                if (base) this.operationBases[operation.key] = base;
+                this.operations.push(operation);
+            }
+
+            if (callback) this.operationCallbacks[operation.key] = callback;
+            this.scheduleFlush();
+        },
+
+        /**
+         * Replace the content of a note update with a patch against its base, when the patch is smaller. This is done
+         * just before the update is first sent, once no more edits can be merged into it. Whatever is sent then is
+         * sent again, unchanged, if the request has to be retried.
          **/
-        updateChecklistItem: function(url, text, complete, checklistUrl, callback) {
+        compressOperation: function(operation) {
+            var base = this.operationBases[operation.key];
+            if (!base || operation.data.content === undefined) return;
+
+            var patch = util.diffText(base.content, operation.data.content);
+            if (JSON.stringify(patch).length >= operation.data.content.length) return;
+
+            base.edited = operation.data.content;
+            operation.data.content_patch = patch;
+            operation.data.base_hash = base.hash;
+            delete operation.data.content;
+        },
+
+        /**
+         * Send the queued operations shortly, so that the writes made in the meantime go along in the same batch.
+         **/
+        scheduleFlush: function() {
+            clearTimeout(this.flushTimeout);
+            this.flushTimeout = setTimeout(this.flushOperations.bind(this), 250);
+        },
+
+        /**
+         * Send the queued operations to the operation log in one request, unless a batch is already on its way, and
+         * pass each result to its callback. If the request fails or times out, the same batch is sent again, with the
+         * same keys, after a growing delay; the server only applies each operation once, however many times it's sent.
+         * A batch the server rejects as invalid would never succeed, so it's dropped instead.
+         *
+         * A note patch made against content which has since changed elsewhere is rejected with a 409, and sent again
+         * as the whole content.
+         **/
+        flushOperations: function() {
+            if (this.operationsSending || !this.operations.length) return;
+
+            clearTimeout(this.flushTimeout);
+            var batch = this.operations.slice(0, 100);
+            for (var i = this.operationsSent; i < batch.length; i++) {
+                this.compressOperation(batch[i]);
+            }
+            this.operationsSent = Math.max(this.operationsSent, batch.length);
+            this.operationsSending = true;
+
             $.ajax({
-                url: url,
-                type: 'PUT',
-                timeout: 1000,
-                data: {
-                    'text'      : text,
-                    'complete'  : complete,
-                    'checklist' : checklistUrl,
-                },
-                success: function(data){
-                    if (callback) callback(data);
-                },
+                url: '/api/ops/',
+                type: 'POST',
+                timeout: 10000,
+                contentType: 'application/json',
+                data: JSON.stringify({'ops': batch}),
+                success: function(response){
+                    this.operationRetryDelay = 0;
+                    this.operations.splice(0, batch.length);
+                    this.operationsSent = 0;
+
+                    $.each(response.results, function(i, result){
+                        var callback = this.operationCallbacks[result.key];
+                        var base = this.operationBases[result.key];
+                        delete this.operationCallbacks[result.key];
+                        delete this.operationBases[result.key];
+
+                        if (result.status == 409 && base && base.edited !== undefined) {
+                            this.queueOperation({
+                                'op'   : 'update',
+                                'type' : 'note',
+                                'id'   : result.id,
+                                'data' : {'content': base.edited},
+                            }, callback);
+                        } else if (callback && result.object) {
+                            callback(result.object);
+                        }
+                    }.bind(this));
+
+                    util.refreshFancyCheckboxes();
+                    this.rebindChecklistCheckboxEvents();
+                }.bind(this),
+                error: function(xhr){
+                    if (xhr.status >= 400 && xhr.status < 500 && xhr.status != 429) {
+                        this.operations.splice(0, batch.length);
+                        this.operationsSent = 0;
+                        $.each(batch, function(i, operation){
+                            delete this.operationCallbacks[operation.key];
+                            delete this.operationBases[operation.key];
+                        }.bind(this));
+                        return;
+                    }
+
+                    this.operationRetryDelay = Math.min(Math.max(this.operationRetryDelay * 2, 1000), 30000);
+                    this.flushTimeout = setTimeout(this.flushOperations.bind(this), this.operationRetryDelay);
+                }.bind(this),
+                complete: function(){
+                    this.operationsSending = false;
+                    if (!this.operationRetryDelay && this.operations.length) this.flushOperations();
+                }.bind(this),
             });
         },
 
@@ -846,7 +1007,6 @@ $(function(){
         rebindChecklistCheckboxEvents: function() {
             $('.checklist .item input').off().on('ifToggled', function(e) {
                 var checked = $(e.target).is(':checked');
-                var $list   = $(e.target).parents('.checklist');
                 var $item   = $(e.target).parents('.item');
 
                 if (checked)
@@ -854,23 +1014,24 @@ $(function(){
                 else
                     $item.find('span').removeClass('complete');
 
-                this.updateChecklistItem($item.data('url'), $item.find('span').text(), checked, $list.data('url'));
+                this.queueOperation({
+                    'op'   : 'toggle',
+                    'type' : 'checklistitem',
+                    'id'   : $item.data('id'),
+                    'data' : {'complete': checked},
+                });
             }.bind(this));
         },
 
         /**
-         * Iterate through the arrays of notes and checklists, running each through the appropriate template and then
-         * appending it to the shortest column in the notes wrapper.
+         * Iterate through the bootstrap data's notes and checklists, which are already sorted by creation time, running
+         * each through the appropriate template and then appending it to the shortest column in the notes wrapper.
          **/
-        buildNotes: function() {
+        buildNotes: function(bootstrap) {
 
-            var both = this.notes.concat(this.checklists).sort(function(a,b){
-                var keyA = new Date(a.created),
-                    keyB = new Date(b.created);
-                return keyA - keyB;
-            });
+            this.syncCursor = bootstrap.cursor;
 
-            $.each(both, function(i, item){
+            $.each(bootstrap.elements, function(i, item){
                 if (util.hasOwnProperty(item, "items")){
                     $(this.checklistTemplate(item))
                         .appendTo(util.getShortestColumn())
@@ -887,36 +1048,119 @@ $(function(){
         },
 
         /**
-         * Kick off the async process for retrieving all notes for the current notebook. Return an async promise to the
-         * caller so they can do whatever they want whenever this is ready.
+         * Kick off the async process for retrieving the bootstrap data, all of the notes and checklists sorted by
+         * creation time along with a sync cursor, in a single request. Return an async promise to the caller so they
+         * can do whatever they want with the data whenever it's ready.
          **/
-        async_loadNotes: function() {
+        async_loadBootstrap: function() {
             return $.ajax({
-                url: '/api/notes/',
+                url: '/api/bootstrap/',
                 type: 'GET',
-                timeout: 1000,
-            }).then(function(notes){
-                this.notes = notes;
-            }.bind(this));
+                timeout: 10000,
+            });
         },
 
         /**
-         * Kick off the async process for retrieving all checklists for the current notebook. Return an async promise
-         * to the caller so they can do whatever they want whenever this is ready.
+         * Open the server-sent event stream of changes made elsewhere, in another tab or on another device. Each event
+         * only says what changed, so a burst of them is collected into a single incremental sync, which fetches just
+         * the changes. The browser reconnects the stream by itself whenever it drops, and anything published while it
+         * was down is picked up by syncing again as soon as it's back.
          **/
-        async_loadChecklists: function() {
-            return $.ajax({
-                url: '/api/checklists/',
+        listenForChanges: function() {
+            if (!window.EventSource) return;
+
+            var sync = util.debounce(this.syncChanges.bind(this), 100);
+            var source = new EventSource('/api/events/');
+            var connected = false;
+
+            source.addEventListener('change', sync);
+            source.addEventListener('resync', sync);
+            source.addEventListener('open', function() {
+                if (connected) sync();
+                connected = true;
+            });
+        },
+
+        /**
+         * Fetch everything which has changed since the last sync, and patch it into the page in place. A reset means
+         * the cursor was too old to sync from, so the page is rebuilt from what came back instead.
+         **/
+        syncChanges: function() {
+            $.ajax({
+                url: '/api/sync/',
                 type: 'GET',
-                timeout: 1000,
-            }).then(function(checklists){
-                this.checklists = checklists;
-                $.each(this.checklists, function(i, list){
-                    list.items = list.items.sort(function(a,b){
-                        return a.order - b.order;
+                data: {'since': this.syncCursor},
+                success: function(changes){
+                    this.syncCursor = changes.cursor;
+
+                    if (changes.reset) {
+                        var elements = changes.notes.concat(changes.checklists).sort(function(a, b){
+                            return a.created < b.created ? -1 : 1;
+                        });
+
+                        $('.note-col').empty();
+                        this.buildNotes({'cursor': changes.cursor, 'elements': elements});
+                        return;
+                    }
+
+                    $.each(changes.notes, function(i, note){
+                        this.patchElement('.note', note, this.noteTemplate(note));
+                    }.bind(this));
+                    $.each(changes.checklists, function(i, checklist){
+                        this.patchElement('.checklist', checklist, this.checklistTemplate(checklist));
+                    }.bind(this));
+                    $.each(changes.checklistitems, this.patchChecklistItem.bind(this));
+
+                    $.each(changes.deleted.notes, function(i, id){
+                        $('.note[data-id="' + id + '"]').remove();
                     });
-                });
-            }.bind(this));
+                    $.each(changes.deleted.checklists, function(i, id){
+                        $('.checklist[data-id="' + id + '"]').remove();
+                    });
+                    $.each(changes.deleted.checklistitems, function(i, id){
+                        $('.checklist .item[data-id="' + id + '"]').remove();
+                    });
+
+                    util.refreshFancyCheckboxes();
+                    this.rebindChecklistCheckboxEvents();
+                }.bind(this),
+            });
+        },
+
+        /**
+         * Replace the note or checklist element for the object with newly rendered HTML, where it is on the page, or
+         * add it to the shortest column if it's new.
+         **/
+        patchElement: function(selector, object, html) {
+            var $existing = $(selector + '[data-id="' + object.id + '"]');
+            if ($existing.length) {
+                $existing.replaceWith(html);
+            } else {
+                $(html).appendTo(util.getShortestColumn()).animateCss('fadeIn');
+            }
+        },
+
+        /**
+         * Update a checklist item in place, or insert it into its checklist according to its order if it's new.
+         **/
+        patchChecklistItem: function(i, item) {
+            var $list = $('.checklist[data-url="' + item.checklist + '"]');
+            var $item = $(this.checklistTemplate({'items': [item]})).find('.item');
+
+            var $existing = $list.find('.item[data-id="' + item.id + '"]');
+            if ($existing.length) {
+                $existing.replaceWith($item);
+                return;
+            }
+
+            var $next = $list.find('.item').filter(function(){
+                return $(this).data('order') > item.order;
+            }).first();
+
+            if ($next.length)
+                $item.insertBefore($next);
+            else
+                $item.appendTo($list.find('.contents'));
         },
     };
 
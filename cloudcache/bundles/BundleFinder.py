@@ -0,0 +1,28 @@
+from django.conf import settings
+from django.contrib.staticfiles.finders import BaseFinder
+from django.core.files.storage import FileSystemStorage
+
+from . import BUNDLES, build_bundle
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class BundleFinder(BaseFinder):
+    """ Static files finder which builds the JS and CSS bundles on demand. collectstatic builds every bundle through
+    this, so the storage gives them content-hashed names and compressed copies like any other file, and the dev server
+    rebuilds a bundle whenever one of its assets has changed. """
+
+    def __init__(self, app_names=None, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.storage = FileSystemStorage(location=settings.BUNDLE_ROOT)
+
+    def find(self, path, all=False):
+        if path not in BUNDLES:
+            return []
+
+        match = build_bundle(path)
+        return [match] if all else match
+
+    def list(self, ignore_patterns):
+        for name in sorted(BUNDLES):
+            build_bundle(name)
+            yield name, self.storage
@@ -0,0 +1,100 @@
+import json
+import os
+
+import lesscpy
+from rcssmin import cssmin
+from rjsmin import jsmin
+
+from django.conf import settings
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'assets')
+
+# The static files built from the assets, and the assets each is built from, in order. Vendor code is kept apart from
+# the app's own, so that the vendor bundles stay cached across deploys which only change the app.
+BUNDLES = {
+    'js/vendor.js': [
+        'js/jquery-2.1.0.min.js',
+        'js/jquery-ui.min.js',
+        'js/bootstrap.min.js',
+        'js/jquery-confirm.min.js',
+        'js/icheck.min.js',
+        'js/handlebars.js',
+        'js/jquery.mCustomScrollbar.concat.min.js',
+    ],
+    'js/app.js': [
+        'templates/note.handlebars',
+        'templates/checklist.handlebars',
+        'templates/list-item.handlebars',
+        'templates/list-item-new.handlebars',
+        'js/cloudcache/app.js',
+    ],
+    'css/vendor.css': [
+        'css/bootstrap.min.css',
+        'css/grey.css',
+        'css/icono.min.css',
+        'css/jquery-confirm.min.css',
+        'css/jquery-ui.min.css',
+        'css/jquery.mCustomScrollbar.min.css',
+    ],
+    'css/app.css': [
+        'less/build.less',
+    ],
+}
+
+
+def get_sources(name):
+    """ Return the paths of every asset the bundle is built from, including the LESS files imported by build.less. """
+
+    sources = [os.path.join(ASSETS_DIR, source) for source in BUNDLES[name]]
+    if any(source.endswith('.less') for source in sources):
+        less_dir = os.path.join(ASSETS_DIR, 'less')
+        sources.extend(os.path.join(less_dir, filename) for filename in os.listdir(less_dir))
+
+    return sources
+
+
+def read_source(path):
+    """ Return the minified contents of one asset. Handlebars templates are turned into a script which registers them
+    as Handlebars.templates[<name>], the same place the Handlebars precompiler puts them. """
+
+    extension = os.path.splitext(path)[1]
+    with open(path, encoding='utf-8') as f:
+        # lesscpy resolves imports relative to the name of the file it's given
+        if extension == '.less':
+            return cssmin(lesscpy.compile(f, minify=True))
+        source = f.read()
+
+    if extension == '.handlebars':
+        name = os.path.splitext(os.path.basename(path))[0]
+        template = 'Handlebars.templates=Handlebars.templates||{{}};Handlebars.templates[{}]=Handlebars.compile({});'
+        return template.format(json.dumps(name), json.dumps(source.strip()))
+    if extension == '.css':
+        return cssmin(source)
+
+    return jsmin(source)
+
+
+def build_bundle(name, force=False):
+    """ Build the bundle into BUNDLE_ROOT, unless it's already newer than everything it's built from, returning its
+    path. Content hashing and compression are left to the static files storage, as for every other static file. """
+
+    path = os.path.join(settings.BUNDLE_ROOT, name)
+    if not force and os.path.exists(path):
+        built = os.path.getmtime(path)
+        if all(os.path.getmtime(source) <= built for source in get_sources(name)):
+            return path
+
+    # Each file is ended with a semicolon or newline, as not every minified library is
+    separator = ';\n' if name.endswith('.js') else '\n'
+    content = separator.join(read_source(os.path.join(ASSETS_DIR, source)) for source in BUNDLES[name])
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path + '.tmp', 'w', encoding='utf-8') as f:
+        f.write(content + '\n')
+    os.replace(path + '.tmp', path)
+
+    return path
+
+from .BundleFinder import BundleFinder
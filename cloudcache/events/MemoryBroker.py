@@ -0,0 +1,47 @@
+from collections import defaultdict
+from threading import Lock
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class MemoryBroker(object):
+    """ Event broker which fans events out to the subscribers in this process only. That's all a single-process
+    deployment or the tests need; with more than one process, use a broker backed by something they all share, such as
+    Redis pub/sub or PostgreSQL LISTEN/NOTIFY, so that a change handled by one process reaches the dashboards connected
+    to the others. It refuses to start when WEB_WORKERS says there's more than one process, rather than silently lose
+    events. """
+
+    def __init__(self):
+        if settings.WEB_WORKERS > 1:
+            raise ImproperlyConfigured('MemoryBroker only reaches event streams in its own process, but WEB_WORKERS is '
+                                       '{}. Run one worker, or set EVENTS_BROKER to a shared broker.'
+                                       .format(settings.WEB_WORKERS))
+
+        self.lock = Lock()
+        self.subscribers = defaultdict(set)
+
+    def subscribe(self, owner_id, deliver):
+        """ Call `deliver` with every event published for the owner from now on, until unsubscribed. `deliver` is
+        called on the publishing thread, so it must not block. """
+
+        with self.lock:
+            self.subscribers[owner_id].add(deliver)
+
+    def unsubscribe(self, owner_id, deliver):
+        with self.lock:
+            subscribers = self.subscribers.get(owner_id)
+            if subscribers is not None:
+                subscribers.discard(deliver)
+                if not subscribers:
+                    del self.subscribers[owner_id]
+
+    def publish(self, owner_id, event):
+        """ Deliver the event to everyone subscribed to the owner's events. """
+
+        with self.lock:
+            subscribers = list(self.subscribers.get(owner_id, ()))
+
+        for deliver in subscribers:
+            deliver(event)
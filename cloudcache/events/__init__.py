@@ -0,0 +1,169 @@
+import asyncio
+import json
+from itertools import count
+from queue import Queue, Empty, Full
+from time import monotonic
+
+from django.conf import settings
+from django.db import transaction
+from django.utils.module_loading import import_string
+
+from ..pending import get_pending
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+# Sent when a subscriber fell so far behind that events were dropped, so the client knows to sync everything it missed
+RESYNC = {'type': 'resync'}
+
+# The start of every stream: how long the browser should wait before reconnecting, and a comment to flush any proxy
+STREAM_PREAMBLE = b'retry: 5000\n: connected\n\n'
+
+KEEPALIVE_MESSAGE = b': keepalive\n\n'
+
+_broker = None
+_event_ids = count(1)
+
+
+def get_broker():
+    """ Return the event broker instance, picked by dotted path with EVENTS_BROKER. """
+
+    global _broker
+    if _broker is None:
+        _broker = import_string(settings.EVENTS_BROKER)()
+
+    return _broker
+
+
+def _publish_pending(pending):
+    broker = get_broker()
+    for owner_id, event in pending.values():
+        broker.publish(owner_id, event)
+
+
+def publish_change(owner_id, kind, action, object_id, checklist_id=None):
+    """ Publish a change to one of the owner's objects once the current transaction commits, or right away outside of
+    a transaction, so that subscribers never hear about a change they can't see yet. The event is just what changed,
+    not the new data, which the client fetches with an incremental sync. The same change is only published once per
+    transaction, however many times the object is saved in it.
+
+    :param owner_id: The ID of the Account owning the object.
+    :param kind: 'note', 'checklist' or 'checklistitem'.
+    :param action: 'saved' or 'deleted'.
+    :param object_id: The ID of the object.
+    :param checklist_id: For a ChecklistItem, the ID of its Checklist.
+    """
+
+    event = {'type': kind, 'action': action, 'id': object_id}
+    if checklist_id is not None:
+        event['checklist'] = checklist_id
+
+    if not transaction.get_connection().in_atomic_block:
+        get_broker().publish(owner_id, event)
+        return
+
+    get_pending('events', _publish_pending)[(owner_id, kind, action, object_id)] = (owner_id, event)
+
+
+def format_event(event):
+    """ Return the event as a server-sent event message, as bytes. """
+
+    name = 'resync' if event is RESYNC else 'change'
+    return 'id: {}\nevent: {}\ndata: {}\n\n'.format(
+        next(_event_ids), name, json.dumps(event, separators=(',', ':'))).encode('utf-8')
+
+
+def iter_event_stream(owner_id):
+    """ Yield the owner's events as a server-sent event stream, for as long as EVENTS_STREAM_TIMEOUT. When the stream
+    ends, the browser's EventSource reconnects on its own, so a stream never ties up a worker thread for good. A
+    keepalive comment is sent whenever there's been nothing to send for EVENTS_KEEPALIVE seconds, which is also how a
+    disconnected client is noticed.
+
+    Events are queued for the stream as they're published. If the client can't keep up and the queue fills, the
+    overflow is dropped and the client is told to resync instead. This blocks a thread for the life of the stream, so
+    under ASGI, `aiter_event_stream` is used instead. """
+
+    events = Queue(maxsize=settings.EVENTS_QUEUE_SIZE)
+
+    def deliver(event):
+        try:
+            events.put_nowait(event)
+        except Full:
+            deliver.overflowed = True
+
+    deliver.overflowed = False
+    broker = get_broker()
+    broker.subscribe(owner_id, deliver)
+
+    try:
+        yield STREAM_PREAMBLE
+
+        end = monotonic() + settings.EVENTS_STREAM_TIMEOUT
+        while True:
+            remaining = end - monotonic()
+            if remaining <= 0:
+                return
+
+            try:
+                event = events.get(timeout=min(remaining, settings.EVENTS_KEEPALIVE))
+            except Empty:
+                yield KEEPALIVE_MESSAGE
+                continue
+
+            if deliver.overflowed:
+                deliver.overflowed = False
+                event = RESYNC
+                while not events.empty():
+                    events.get_nowait()
+
+            yield format_event(event)
+    finally:
+        broker.unsubscribe(owner_id, deliver)
+
+
+async def aiter_event_stream(owner_id):
+    """ The asyncio version of `iter_event_stream`, which waits for events on the event loop rather than blocking a
+    thread, so any number of streams can be open at once. Events are published on other threads, so they're handed
+    over to the loop thread-safely. """
+
+    loop = asyncio.get_event_loop()
+    events = asyncio.Queue(maxsize=settings.EVENTS_QUEUE_SIZE)
+
+    def put(event):
+        try:
+            events.put_nowait(event)
+        except asyncio.QueueFull:
+            deliver.overflowed = True
+
+    def deliver(event):
+        loop.call_soon_threadsafe(put, event)
+
+    deliver.overflowed = False
+    broker = get_broker()
+    broker.subscribe(owner_id, deliver)
+
+    try:
+        yield STREAM_PREAMBLE
+
+        end = loop.time() + settings.EVENTS_STREAM_TIMEOUT
+        while True:
+            remaining = end - loop.time()
+            if remaining <= 0:
+                return
+
+            try:
+                event = await asyncio.wait_for(events.get(), timeout=min(remaining, settings.EVENTS_KEEPALIVE))
+            except asyncio.TimeoutError:
+                yield KEEPALIVE_MESSAGE
+                continue
+
+            if deliver.overflowed:
+                deliver.overflowed = False
+                event = RESYNC
+                while not events.empty():
+                    events.get_nowait()
+
+            yield format_event(event)
+    finally:
+        broker.unsubscribe(owner_id, deliver)
+
+from .MemoryBroker import MemoryBroker
@@ -0,0 +1,146 @@
+import re
+from datetime import timedelta
+from urllib.parse import urlsplit
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.urls import resolve, reverse
+from django.utils import timezone
+
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from api.sync import encode_cursor
+from cloudcache.models import Note, Checklist, ChecklistItem
+
+from ..seeding import seed_account
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+# Matches the plan lines for a full scan of a table, capturing the table name
+SEQ_SCAN_PATTERNS = {
+    'postgresql': re.compile(r'Seq Scan on (\w+)'),
+    'sqlite': re.compile(r'^SCAN (?:TABLE )?(\w+)(?: AS \w+)?$'),
+}
+
+EXPLAIN_PREFIXES = {
+    'postgresql': 'EXPLAIN ',
+    'sqlite': 'EXPLAIN QUERY PLAN ',
+}
+
+# Only scans of these tables are flagged; the session and Account lookups are by primary key anyway
+AUDITED_TABLE_PREFIX = 'cloudcache_'
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class Command(BaseCommand):
+    """ Management command to check that the queries run by the owner-scoped API views are served by an index. A few
+    users' worth of data is seeded inside a transaction which is rolled back afterwards, each endpoint is requested as
+    one of those users, and every query it runs is EXPLAINed. Any sequential scan of a cloudCache table is reported,
+    and the command fails, so that a new view or filter without a supporting index doesn't go unnoticed.
+
+    On PostgreSQL, sequential scans are disabled for the audit. The planner rightly prefers them for small tables, so
+    one which still shows up means there was no usable index at all. SQLite can't be told the same, so keep the --size
+    realistic there, as with only a handful of rows per user a scan really is the cheapest plan. """
+
+    help = 'EXPLAIN the queries of each API view against seeded data, and fail on any sequential scan.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--size', type=int, default=200,
+                            help='Number of notes and checklists to seed for each user (default 200).')
+
+    def handle(self, *args, **options):
+        vendor = connection.vendor
+        if vendor not in SEQ_SCAN_PATTERNS:
+            raise CommandError('Query plans can only be audited on PostgreSQL or SQLite, not {}.'.format(vendor))
+
+        with transaction.atomic():
+            failures = self.audit(vendor, options['size'], options['verbosity'])
+            transaction.set_rollback(True)
+
+        if failures:
+            raise CommandError('{} endpoint(s) ran a sequential scan: {}'.format(len(failures), ', '.join(failures)))
+
+        self.stdout.write('No sequential scans found.')
+
+    def audit(self, vendor, size, verbosity):
+        """ Seed the data, then EXPLAIN the queries of every endpoint. Returns the endpoints with sequential scans. """
+
+        # Other users' data is what makes filtering by owner worthwhile
+        account = seed_account('audit', notes=size, checklists=size)
+        for i in range(2):
+            seed_account('audit{}'.format(i), notes=size, checklists=size)
+
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
+            if vendor == 'postgresql':
+                cursor.execute('SET LOCAL enable_seqscan = off')
+
+        failures = list()
+        for path in self.get_paths(account):
+            scans = set()
+            queries = self.capture_queries(account, path)
+
+            for sql in queries:
+                plan = self.explain(vendor, sql)
+                if verbosity >= 2:
+                    self.stdout.write('{}\n{}\n'.format(sql, '\n'.join(plan)))
+                for line in plan:
+                    match = SEQ_SCAN_PATTERNS[vendor].search(line.strip())
+                    if match and match.group(1).startswith(AUDITED_TABLE_PREFIX):
+                        scans.add(match.group(1))
+
+            if scans:
+                failures.append(path)
+                self.stdout.write('GET {}: sequential scan of {}'.format(path, ', '.join(sorted(scans))))
+            else:
+                self.stdout.write('GET {}: {} queries, OK'.format(path, len(queries)))
+
+        return failures
+
+    def get_paths(self, account):
+        """ Return the path of each owner-scoped API endpoint to audit, pointing at some of the account's objects. """
+
+        note = Note.objects.filter(owner=account).last()
+        checklist = Checklist.objects.filter(owner=account).last()
+        item = ChecklistItem.objects.filter(checklist=checklist).last()
+        since = encode_cursor(timezone.now() - timedelta(hours=1))
+
+        return [
+            reverse('note-list'),
+            reverse('note-list') + '?ordering=-modified',
+            reverse('note-detail', kwargs={'pk': note.pk}),
+            reverse('checklist-list'),
+            reverse('checklist-list') + '?ordering=-modified',
+            reverse('checklist-detail', kwargs={'pk': checklist.pk}),
+            reverse('checklist-items-list', kwargs={'pk': checklist.pk}),
+            reverse('checklistitem-list'),
+            reverse('checklistitem-detail', kwargs={'pk': item.pk}),
+            reverse('sync') + '?since=' + since,
+            reverse('bootstrap'),
+            reverse('search') + '?q=item',
+        ]
+
+    def capture_queries(self, account, path):
+        """ Request the path as the account, and return the SQL of each query it ran against a cloudCache table. """
+
+        request = APIRequestFactory().get(path, HTTP_HOST='localhost')
+        force_authenticate(request, user=account)
+        match = resolve(urlsplit(path).path)
+
+        with override_settings(ALLOWED_HOSTS=['localhost']), CaptureQueriesContext(connection) as context:
+            response = match.func(request, *match.args, **match.kwargs)
+            response.render()
+
+        if response.status_code != 200:
+            raise CommandError('GET {} returned {}.'.format(path, response.status_code))
+
+        return [query['sql'] for query in context.captured_queries
+                if query['sql'].startswith('SELECT') and AUDITED_TABLE_PREFIX in query['sql']]
+
+    def explain(self, vendor, sql):
+        """ Return the lines of the query plan for the SQL. """
+
+        with connection.cursor() as cursor:
+            cursor.execute(EXPLAIN_PREFIXES[vendor] + sql)
+            return [row[-1] for row in cursor.fetchall()]
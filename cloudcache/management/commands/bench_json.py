@@ -0,0 +1,86 @@
+from io import BytesIO
+from timeit import default_timer
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.test.utils import override_settings
+
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIRequestFactory
+
+from api.parsers import FastJSONParser
+from api.renderers import FastJSONRenderer
+from api.renderers.FastJSONRenderer import orjson
+from api.serializers import ChecklistSerializer
+from cloudcache.models import Checklist
+
+from ..seeding import seed_account
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class Command(BaseCommand):
+    """ Management command to compare the speed of the standard library's JSON encoding and decoding against the fast
+    renderer and parser the API uses, on a page of Checklists serialized by ChecklistSerializer, as the checklist list
+    endpoint sends them. Data is seeded inside a transaction which is rolled back afterwards. The payload is serialized
+    once, then rendered and parsed by each, the best of several runs is reported, and the command fails if the rendered
+    JSON differs by even a byte, or doesn't parse back to the same data. """
+
+    help = 'Benchmark the fast JSON renderer and parser against the standard library on checklist payloads.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--size', type=int, default=1000,
+                            help='Number of checklists in the payload (default 1000).')
+        parser.add_argument('--items', type=int, default=20,
+                            help='Number of items in each checklist (default 20).')
+        parser.add_argument('--repeat', type=int, default=10,
+                            help='Number of runs of each, of which the fastest is reported (default 10).')
+
+    def handle(self, *args, **options):
+        if orjson is None:
+            self.stdout.write('orjson is not installed, so the fast renderer and parser fall back to the standard '
+                              'library.')
+
+        with transaction.atomic(), override_settings(ALLOWED_HOSTS=['localhost']):
+            self.benchmark(options['size'], options['items'], options['repeat'])
+            transaction.set_rollback(True)
+
+    def benchmark(self, size, items, repeat):
+        """ Seed the checklists, serialize them, and compare rendering and parsing them each way. """
+
+        account = seed_account('benchmark', notes=0, checklists=size, items=items)
+        request = APIRequestFactory().get('/api/', HTTP_HOST='localhost')
+        request.user = account
+
+        checklists = Checklist.objects.filter(owner=account).with_items()
+        data = ChecklistSerializer(checklists, many=True, context={'request': request}).data
+        payload = {'count': size, 'next': None, 'previous': None, 'results': data}
+
+        standard_time, rendered = self.time(repeat, lambda: JSONRenderer().render(payload))
+        fast_time, fast = self.time(repeat, lambda: FastJSONRenderer().render(payload))
+        if rendered != fast:
+            raise CommandError('The fast renderer output differs from the standard one.')
+        self.report('render', len(rendered), standard_time, fast_time)
+
+        standard_time, standard = self.time(repeat, lambda: JSONParser().parse(BytesIO(rendered)))
+        fast_time, fast = self.time(repeat, lambda: FastJSONParser().parse(BytesIO(rendered)))
+        if standard != fast:
+            raise CommandError('The fast parser output differs from the standard one.')
+        self.report('parse', len(rendered), standard_time, fast_time)
+
+    def report(self, name, size, standard_time, fast_time):
+        """ Write one line comparing the standard and fast times for `size` bytes of JSON. """
+        self.stdout.write('{:<8}{:>10} bytes  standard {:>8.1f}ms  fast {:>8.1f}ms  {:>5.1f}x faster'.format(
+            name, size, standard_time * 1000, fast_time * 1000, standard_time / fast_time))
+
+    def time(self, repeat, run):
+        """ Return the fastest time of `repeat` calls to `run`, and what it returned. """
+
+        best = None
+        for _ in range(repeat):
+            start = default_timer()
+            output = run()
+            elapsed = default_timer() - start
+            best = elapsed if best is None else min(best, elapsed)
+
+        return best, output
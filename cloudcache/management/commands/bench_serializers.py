@@ -0,0 +1,78 @@
+from timeit import default_timer
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.test.utils import override_settings
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIRequestFactory
+
+from api.serializers import NoteSerializer, ChecklistSerializer, ChecklistItemSerializer, NoteValuesSerializer,\
+    ChecklistValuesSerializer, ChecklistItemValuesSerializer
+from cloudcache.models import Note, Checklist, ChecklistItem
+
+from ..seeding import seed_account
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class Command(BaseCommand):
+    """ Management command to compare the speed of the regular serializers against the values() serializers used by
+    the list endpoints. Data is seeded inside a transaction which is rolled back afterwards. Each serializer fetches and
+    renders the same queryset to JSON, the best of several runs is reported, and the command fails if the two outputs
+    differ by even a byte. """
+
+    help = 'Benchmark the values() serializers against the regular ones, and check their output is identical.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--size', type=int, default=500,
+                            help='Number of notes and checklists to seed, with 10 items each (default 500).')
+        parser.add_argument('--repeat', type=int, default=5,
+                            help='Number of runs of each serializer, of which the fastest is reported (default 5).')
+
+    def handle(self, *args, **options):
+        with transaction.atomic(), override_settings(ALLOWED_HOSTS=['localhost']):
+            self.benchmark(options['size'], options['repeat'])
+            transaction.set_rollback(True)
+
+    def benchmark(self, size, repeat):
+        account = seed_account('benchmark', notes=size, checklists=size)
+        request = APIRequestFactory().get('/api/', HTTP_HOST='localhost')
+        request.user = account
+        context = {'request': request}
+
+        cases = (
+            ('notes', Note.objects.filter(owner=account), NoteSerializer, NoteValuesSerializer),
+            ('checklists', Checklist.objects.filter(owner=account).with_items(), ChecklistSerializer,
+             ChecklistValuesSerializer),
+            ('checklistitems', ChecklistItem.objects.filter(checklist__owner=account).select_related('checklist'),
+             ChecklistItemSerializer, ChecklistItemValuesSerializer),
+        )
+
+        renderer = JSONRenderer()
+        for name, queryset, serializer_class, values_serializer_class in cases:
+            # The list endpoints leave out the deferred fields, and so does the regular serializer they're compared with
+            deferred = values_serializer_class.deferred_fields
+            kwargs = {'fields': [field for field in serializer_class.Meta.fields if field not in deferred]} \
+                if deferred else {}
+            regular_time, regular = self.time(repeat, lambda: renderer.render(
+                serializer_class(queryset.all(), many=True, context=context, **kwargs).data))
+            values_time, values = self.time(repeat, lambda: renderer.render(
+                values_serializer_class(context).serialize(queryset.all())))
+
+            if regular != values:
+                raise CommandError('The values() serializer output for {} differs from the regular one.'.format(name))
+
+            self.stdout.write('{:<16}{:>8} rows  regular {:>8.1f}ms  values {:>8.1f}ms  {:>5.1f}x faster'.format(
+                name, queryset.count(), regular_time * 1000, values_time * 1000, regular_time / values_time))
+
+    def time(self, repeat, render):
+        """ Return the fastest time of `repeat` calls to `render`, and what it rendered. """
+
+        best = None
+        for _ in range(repeat):
+            start = default_timer()
+            output = render()
+            elapsed = default_timer() - start
+            best = elapsed if best is None else min(best, elapsed)
+
+        return best, output
@@ -0,0 +1,297 @@
+import json
+import logging
+import platform
+import tracemalloc
+from itertools import islice
+from timeit import default_timer
+from uuid import uuid4
+
+import django
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management.base import BaseCommand, CommandError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection, transaction
+from django.db.models import Count
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from api.sync import encode_cursor
+from cloudcache.models import Note, Checklist, ChecklistItem
+from cloudcache.transfer import iter_records
+
+from ..seeding import seed_account, index_account, delete_account
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+# The metrics compared against a baseline. Latency and memory are allowed to grow by the threshold, queries not at all.
+COMPARED_METRICS = ('p50_ms', 'p95_ms', 'peak_kb')
+
+
+class Command(BaseCommand):
+    """ Management command to benchmark every API endpoint against synthetic accounts of different sizes, and record
+    the results as a baseline which later runs can be compared against.
+
+    An account is seeded for each --scales size, owning that many Notes and Checklists, each Checklist with between 1
+    and --max-items items, and indexed for search. The item counts are random, but seeded, so every run against the
+    same arguments sees the same data. Each endpoint is then requested --repeat times through the Django test client,
+    logged in as that account, and its median and 95th percentile latency, number of queries and peak Python memory
+    are reported. Memory is measured on a separate request, since tracing allocations slows everything else down.
+
+    The accounts are committed, and every request commits its own changes just as it would when served, so the work
+    done once a transaction commits, such as indexing and publishing change events, is timed too. The accounts and
+    everything they own are deleted again at the end.
+
+    The full default run seeds over twelve million ChecklistItems, which is realistic for PostgreSQL but slow
+    elsewhere, so pick smaller --scales for a quick check. For example:
+
+        python manage.py benchmark_api --output baseline.json
+        python manage.py benchmark_api --compare baseline.json --threshold 20
+
+    With --compare, any endpoint that now runs more queries, or whose latency or peak memory grew by more than the
+    --threshold percentage, is reported as a regression, and the command fails. """
+
+    help = 'Benchmark every API endpoint against seeded accounts, and optionally compare against a saved baseline.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--scales', default='10,1000,50000',
+                            help='Comma-separated numbers of notes and checklists to seed an account with, one account '
+                                 'for each (default 10,1000,50000).')
+        parser.add_argument('--max-items', type=int, default=500,
+                            help='The most items in any one checklist; each has at least one (default 500).')
+        parser.add_argument('--repeat', type=int, default=20,
+                            help='Number of timed requests to each endpoint (default 20).')
+        parser.add_argument('--seed', type=int, default=0, help='Seed for the random item counts (default 0).')
+        parser.add_argument('-o', '--output', help='Write the results to this file as JSON.')
+        parser.add_argument('--compare', help='A JSON file from an earlier --output to compare the results against.')
+        parser.add_argument('--threshold', type=float, default=20,
+                            help='Percentage growth in latency or memory counted as a regression (default 20).')
+        parser.add_argument('--min-delta-ms', type=float, default=1,
+                            help='Latency changes smaller than this many milliseconds are never regressions, as they '
+                                 'are within the noise (default 1).')
+
+    def handle(self, *args, **options):
+        try:
+            scales = [int(scale) for scale in options['scales'].split(',')]
+        except ValueError:
+            raise CommandError('--scales must be a comma-separated list of numbers.')
+        if options['max_items'] < 2:
+            raise CommandError('--max-items must be at least 2, so there are items to move.')
+        if options['repeat'] < 1:
+            raise CommandError('--repeat must be at least 1.')
+
+        baseline = None
+        if options['compare']:
+            with open(options['compare']) as f:
+                baseline = json.load(f)
+
+        # The per-request performance log would drown out the report
+        perf_logger = logging.getLogger('cloudcache.perf')
+        log_level = perf_logger.level
+        perf_logger.setLevel(logging.WARNING)
+
+        try:
+            # Every endpoint is requested far faster than any client is allowed to
+            with override_settings(ALLOWED_HOSTS=['testserver'], THROTTLE_ENABLED=False):
+                results = self.benchmark(scales, options['max_items'], options['repeat'], options['seed'])
+        finally:
+            perf_logger.setLevel(log_level)
+
+        report = {
+            'environment': {
+                'database': connection.vendor,
+                'python': platform.python_version(),
+                'django': django.get_version(),
+                'scales': scales,
+                'max_items': options['max_items'],
+                'repeat': options['repeat'],
+                'seed': options['seed'],
+                'date': timezone.now().isoformat(),
+            },
+            'results': results,
+        }
+
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                json.dump(report, f, indent=2, sort_keys=True)
+
+        if baseline is not None:
+            regressions = self.compare(baseline, report, options['threshold'], options['min_delta_ms'])
+            if regressions:
+                raise CommandError('{} regression(s) against {}.'.format(regressions, options['compare']))
+            self.stdout.write('No regressions against {}.'.format(options['compare']))
+
+    def benchmark(self, scales, max_items, repeat, seed):
+        """ Seed an account for each scale, benchmark every endpoint as each account, then delete the accounts again.
+        Returns the results keyed by scale, then by endpoint. """
+
+        accounts = list()
+        try:
+            for scale in scales:
+                with transaction.atomic():
+                    account = seed_account('benchmark{}'.format(scale), notes=scale, checklists=scale,
+                                           items=(1, max_items), seed=seed)
+                accounts.append((scale, account))
+                index_account(account)
+
+            with connection.cursor() as cursor:
+                cursor.execute('ANALYZE')
+
+            results = dict()
+            for scale, account in accounts:
+                client = Client()
+                client.force_login(account)
+
+                results[str(scale)] = scale_results = dict()
+                for name, make_request in self.get_cases(account):
+                    scale_results[name] = self.measure(client, make_request, repeat)
+
+                    self.stdout.write('{:>6} {:<24} p50 {p50_ms:>8.1f}ms  p95 {p95_ms:>8.1f}ms  {queries:>4} queries  '
+                                      '{peak_kb:>9.0f}KB'.format(scale, name, **scale_results[name]))
+
+                client.logout()
+        finally:
+            for _, account in accounts:
+                delete_account(account)
+
+        return results
+
+    def get_cases(self, account):
+        """ Return a list of (name, make_request) pairs, one for each endpoint and method to benchmark. Each call to
+        `make_request` does any untimed setup, such as creating an object to delete, and returns the (method, path,
+        kwargs) of the request to time. """
+
+        note = Note.objects.filter(owner=account).last()
+        # The biggest checklist is the worst case for the item endpoints, and has enough items to move one
+        checklist = Checklist.objects.filter(owner=account).annotate(count=Count('items')).order_by('-count').first()
+        items = list(checklist.items.order_by('order', 'id'))
+        since = encode_cursor(timezone.now())
+        as_json = {'content_type': 'application/json'}
+
+        def get(view_name, query='', **kwargs):
+            return lambda: ('get', reverse(view_name, kwargs=kwargs or None) + query, {})
+
+        def new_note():
+            note = Note.objects.create(owner=account, title='Benchmark', content='content')
+            return 'delete', reverse('note-detail', kwargs={'pk': note.pk}), {}
+
+        # The import uploads the start of the account's own export, which is just its header and first few notes
+        export = list(islice(iter_records(account), 10))
+        export = '\n'.join(json.dumps(record, cls=DjangoJSONEncoder) for record in export).encode()
+
+        def upload():
+            return 'post', reverse('import'), {'data': {'file': SimpleUploadedFile('export.ndjson', export)}}
+
+        # A one character edit to the start of the note, against whatever its content is by then
+        def patch_note():
+            base_hash = Note.objects.values_list('content_hash', flat=True).get(pk=note.pk)
+            data = {'base_hash': base_hash, 'content_patch': [{'at': 0, 'delete': 1, 'insert': 'S'}]}
+            return 'patch', reverse('note-detail', kwargs={'pk': note.pk}), dict(data=json.dumps(data), **as_json)
+
+        bulk = json.dumps([{'id': item.pk, 'text': item.text, 'complete': item.complete} for item in items])
+
+        # A burst of checkbox clicks, as the dashboard sends them, with new keys each time so that none are replayed
+        def toggle():
+            ops = [{'key': str(uuid4()), 'op': 'toggle', 'type': 'checklistitem', 'id': item.pk,
+                    'data': {'complete': not item.complete}} for item in items[:10]]
+            return 'post', reverse('ops'), dict(data=json.dumps({'ops': ops}), **as_json)
+
+        return [
+            ('api-root', lambda: ('get', '/api/', {})),
+            ('account-list', get('account-list')),
+            ('account-detail', get('account-detail', pk=account.pk)),
+            ('apitoken-list', get('apitoken-list')),
+            ('note-list', get('note-list')),
+            ('note-list-modified', get('note-list', '?ordering=-modified')),
+            ('note-create', lambda: ('post', reverse('note-list'),
+                                     dict(data=json.dumps({'title': 'New', 'content': 'content'}), **as_json))),
+            ('note-detail', get('note-detail', pk=note.pk)),
+            ('note-update', lambda: ('patch', reverse('note-detail', kwargs={'pk': note.pk}),
+                                     dict(data=json.dumps({'content': 'updated'}), **as_json))),
+            ('note-patch', patch_note),
+            ('note-delete', new_note),
+            ('checklist-list', get('checklist-list')),
+            ('checklist-detail', get('checklist-detail', pk=checklist.pk)),
+            ('checklist-items-list', get('checklist-items-list', pk=checklist.pk)),
+            ('checklist-items-bulk', lambda: ('put', reverse('checklist-items-bulk', kwargs={'pk': checklist.pk}),
+                                              dict(data=bulk, **as_json))),
+            ('checklistitem-list', get('checklistitem-list')),
+            ('checklistitem-detail', get('checklistitem-detail', pk=items[0].pk)),
+            ('checklistitem-move', lambda: ('post', reverse('checklistitem-move', kwargs={'pk': items[-1].pk}),
+                                            dict(data=json.dumps({'before': items[0].pk}), **as_json))),
+            ('sync', get('sync', '?since=' + since)),
+            ('ops-toggle', toggle),
+            ('bootstrap', get('bootstrap')),
+            ('search', get('search', '?q=note')),
+            ('export', get('export')),
+            ('export-zip', get('export-zip')),
+            ('import', upload),
+        ]
+
+    def measure(self, client, make_request, repeat):
+        """ Time `repeat` requests made by `make_request`, after one to warm up, then measure the peak memory of one
+        more. Returns the metrics. """
+
+        def send():
+            method, path, kwargs = make_request()
+            with CaptureQueriesContext(connection) as queries:
+                start = default_timer()
+                response = getattr(client, method)(path, secure=True, **kwargs)
+                # Streaming responses only do their work as they're read
+                if response.streaming:
+                    b''.join(response.streaming_content)
+                elapsed = default_timer() - start
+
+            if response.status_code >= 400:
+                raise CommandError('{} {} returned {}.'.format(method.upper(), path, response.status_code))
+            return elapsed, len(queries)
+
+        send()
+        latencies, queries = zip(*(send() for _ in range(repeat)))
+        latencies = sorted(latencies)
+
+        tracemalloc.start()
+        try:
+            send()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        def percentile(p):
+            return round(latencies[min(len(latencies) - 1, int(len(latencies) * p / 100))] * 1000, 2)
+
+        return {
+            'p50_ms': percentile(50),
+            'p95_ms': percentile(95),
+            'queries': max(queries),
+            'peak_kb': round(peak / 1024, 1),
+        }
+
+    def compare(self, baseline, report, threshold, min_delta_ms):
+        """ Report every metric which has regressed from the baseline, returning how many have. """
+
+        regressions = 0
+        for scale, endpoints in report['results'].items():
+            for name, metrics in endpoints.items():
+                before = baseline['results'].get(scale, {}).get(name)
+                if before is None:
+                    continue
+
+                problems = list()
+                if metrics['queries'] > before['queries']:
+                    problems.append('queries {} -> {}'.format(before['queries'], metrics['queries']))
+
+                for metric in COMPARED_METRICS:
+                    old, new = before[metric], metrics[metric]
+                    if metric.endswith('_ms') and new - old < min_delta_ms:
+                        continue
+                    if new > old * (1 + threshold / 100):
+                        problems.append('{} {} -> {} (+{:.0f}%)'.format(
+                            metric, old, new, (new / old - 1) * 100 if old else float('inf')))
+
+                if problems:
+                    regressions += len(problems)
+                    self.stdout.write('REGRESSION {:>6} {:<24} {}'.format(scale, name, ', '.join(problems)))
+
+        return regressions
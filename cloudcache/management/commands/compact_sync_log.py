@@ -0,0 +1,27 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from cloudcache.models import Tombstone, ClientOperation
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class Command(BaseCommand):
+    """ Management command to delete sync tombstones which are older than the retention period. Clients whose cursor
+    predates the retention period are told to reset rather than sync incrementally, so these are no longer needed. The
+    operation log is compacted the same way, as no client still retries operations that old. Meant to be run
+    periodically, e.g. daily from a scheduler. """
+
+    help = 'Delete sync tombstones older than SYNC_TOMBSTONE_RETENTION_DAYS, and client operations older than ' \
+           'CLIENT_OPERATION_RETENTION_DAYS.'
+
+    def handle(self, *args, **options):
+        horizon = timezone.now() - timedelta(days=settings.SYNC_TOMBSTONE_RETENTION_DAYS)
+        count, _ = Tombstone.objects.filter(deleted__lt=horizon).delete()
+        self.stdout.write('Deleted {} tombstone(s) older than {}.'.format(count, horizon.isoformat()))
+
+        horizon = timezone.now() - timedelta(days=settings.CLIENT_OPERATION_RETENTION_DAYS)
+        count, _ = ClientOperation.objects.filter(created__lt=horizon).delete()
+        self.stdout.write('Deleted {} client operation(s) older than {}.'.format(count, horizon.isoformat()))
@@ -0,0 +1,35 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from authentication.models import Account
+from cloudcache.transfer import iter_ndjson, iter_zip
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class Command(BaseCommand):
+    """ Management command to export everything an Account owns, in the same NDJSON or zip format as the export API
+    endpoints. The export is streamed out as it's read, so memory use stays flat however large the account. """
+
+    help = 'Export everything an account owns, as NDJSON or a zip archive.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('username', help='The username of the account to export.')
+        parser.add_argument('--output', '-o', help='File to write to. Defaults to standard output.')
+        parser.add_argument('--zip', action='store_true', help='Write a zip archive rather than NDJSON.')
+
+    def handle(self, *args, **options):
+        try:
+            owner = Account.objects.get(username=options['username'])
+        except Account.DoesNotExist:
+            raise CommandError('No account named {}.'.format(options['username']))
+
+        chunks = iter_zip(owner) if options['zip'] else iter_ndjson(owner)
+
+        output = open(options['output'], 'wb') if options['output'] else sys.stdout.buffer
+        try:
+            for chunk in chunks:
+                output.write(chunk)
+        finally:
+            if options['output']:
+                output.close()
@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from authentication.models import Account
+from cloudcache.transfer import import_records, InvalidImportError
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class Command(BaseCommand):
+    """ Management command to import an NDJSON or zip export into an Account, adding everything in it as new objects.
+    The file is checked in full before anything is written, then imported in batches with one transaction each. """
+
+    help = 'Import an NDJSON or zip export into an account.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('username', help='The username of the account to import into.')
+        parser.add_argument('path', help='The export file to import.')
+        parser.add_argument('--batch-size', type=int, default=500,
+                            help='Maximum number of objects written per transaction (default 500).')
+
+    def handle(self, *args, **options):
+        try:
+            owner = Account.objects.get(username=options['username'])
+        except Account.DoesNotExist:
+            raise CommandError('No account named {}.'.format(options['username']))
+
+        with open(options['path'], 'rb') as upload:
+            try:
+                counts = import_records(owner, upload, options['batch_size'])
+            except InvalidImportError as e:
+                raise CommandError(str(e))
+
+        self.stdout.write('Imported {notes} note(s), {checklists} checklist(s) and {checklistitems} item(s).'.format(
+            **counts))
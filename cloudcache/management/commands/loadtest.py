@@ -0,0 +1,86 @@
+from concurrent.futures import ThreadPoolExecutor
+from http.client import HTTPConnection, HTTPSConnection, HTTPException
+from threading import local
+from timeit import default_timer
+from urllib.parse import urlsplit
+
+from django.core.management.base import BaseCommand, CommandError
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class Command(BaseCommand):
+    """ Management command to load test a running server, by requesting a URL from many threads at once and reporting
+    the throughput and latency. Each thread keeps its connection alive, as a browser would.
+
+    Run it against the same URL with each deployment mode to compare them, for example:
+
+        gunicorn web.wsgi
+        gunicorn web.wsgi --worker-class gthread --threads 8
+        uvicorn web.asgi:application --timeout-keep-alive 75
+
+        python manage.py loadtest http://localhost:8000/api/notes/ --header "Authorization: Token <key>" \\
+            --concurrency 100 --requests 5000
+
+    Every request comes from the same client, so start the server with THROTTLE_ENABLED=false, or most of them will
+    be throttled. Without the TLS proxy in front of it, the server redirects every request to HTTPS, so also pass
+    --header "X-Forwarded-Proto: https". """
+
+    help = 'Request a URL from many threads at once, and report the throughput and latency.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('url', help='The URL to request.')
+        parser.add_argument('--concurrency', type=int, default=50, help='Number of concurrent clients (default 50).')
+        parser.add_argument('--requests', type=int, default=2000, help='Total number of requests (default 2000).')
+        parser.add_argument('--header', action='append', default=[],
+                            help='A "Name: value" header to send, such as Authorization. May be repeated.')
+
+    def handle(self, *args, **options):
+        url = urlsplit(options['url'])
+        if url.scheme not in ('http', 'https'):
+            raise CommandError('Only http and https URLs can be load tested.')
+
+        try:
+            headers = dict((part.strip() for part in header.split(':', 1)) for header in options['header'])
+        except ValueError:
+            raise CommandError('Headers must look like "Name: value".')
+
+        connection_class = HTTPSConnection if url.scheme == 'https' else HTTPConnection
+        path = url.path + ('?' + url.query if url.query else '')
+        connections = local()
+
+        def fetch(_):
+            """ Make one request on this thread's connection, returning its status and how long it took. """
+
+            start = default_timer()
+            try:
+                if not hasattr(connections, 'connection'):
+                    connections.connection = connection_class(url.netloc, timeout=30)
+                connections.connection.request('GET', path, headers=headers)
+                response = connections.connection.getresponse()
+                response.read()
+                status = response.status
+            except (OSError, HTTPException):
+                # A dropped connection or a truncated response fails the request, and the next one reconnects
+                connections.__dict__.pop('connection', None)
+                status = None
+
+            return status, default_timer() - start
+
+        start = default_timer()
+        with ThreadPoolExecutor(max_workers=options['concurrency']) as executor:
+            results = list(executor.map(fetch, range(options['requests'])))
+        elapsed = default_timer() - start
+
+        self.report(results, elapsed)
+
+    def report(self, results, elapsed):
+        latencies = sorted(latency for _, latency in results)
+        errors = sum(1 for status, _ in results if status is None or status >= 400)
+
+        def percentile(p):
+            return latencies[min(len(latencies) - 1, int(len(latencies) * p / 100))] * 1000
+
+        self.stdout.write('Requests:    {} in {:.2f}s, {} failed'.format(len(results), elapsed, errors))
+        self.stdout.write('Throughput:  {:.1f} requests/s'.format(len(results) / elapsed))
+        self.stdout.write('Latency:     p50 {:.1f}ms  p95 {:.1f}ms  p99 {:.1f}ms  max {:.1f}ms'.format(
+            percentile(50), percentile(95), percentile(99), latencies[-1] * 1000))
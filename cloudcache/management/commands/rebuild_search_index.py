@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from cloudcache.models import Note, Checklist, SearchDocument
+from cloudcache.search import index_objects
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class Command(BaseCommand):
+    """ Management command to index every Note and Checklist for search. The index is kept up to date incrementally as
+    objects are saved, so this is only needed to fill it for data which predates it, or after changing backends. """
+
+    help = 'Index every Note and Checklist for search.'
+
+    # The number of objects indexed together
+    batch_size = 500
+
+    def handle(self, *args, **options):
+        count = 0
+
+        for kind, model in ((SearchDocument.NOTE, Note), (SearchDocument.CHECKLIST, Checklist)):
+            object_ids = list(model.objects.values_list('id', flat=True))
+            for start in range(0, len(object_ids), self.batch_size):
+                index_objects(kind, object_ids[start:start + self.batch_size])
+            count += len(object_ids)
+
+        self.stdout.write('Indexed {} object(s).'.format(count))
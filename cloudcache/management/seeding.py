@@ -0,0 +1,98 @@
+from itertools import islice
+from random import Random
+
+from django.db import connection, transaction
+
+from authentication.models import Account
+from cloudcache.models import Note, Checklist, ChecklistItem, ClientOperation, SearchDocument, SearchTerm, Tombstone
+from cloudcache.ordering import GAP
+from cloudcache.search import index_objects
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+# The number of rows handed to each bulk_create. This bounds memory when seeding millions of ChecklistItems, and keeps
+# each INSERT within PostgreSQL's limit on parameters; Django makes smaller batches still for SQLite.
+BATCH_SIZE = 1000
+
+# The number of Notes or Checklists indexed for search together
+INDEX_BATCH_SIZE = 500
+
+
+def bulk_create(model, objects):
+    """ Insert the objects, from any iterable, BATCH_SIZE at a time. """
+
+    objects = iter(objects)
+    batch = list(islice(objects, BATCH_SIZE))
+    while batch:
+        model.objects.bulk_create(batch)
+        batch = list(islice(objects, BATCH_SIZE))
+
+
+def seed_account(username, notes=100, checklists=100, items=10, seed=0):
+    """ Create an Account owning `notes` Notes, and `checklists` Checklists with `items` ChecklistItems each, for
+    management commands which need a realistic dataset to measure queries against. Every row is written with
+    bulk_create, so nothing is indexed for search until `index_account` is called.
+
+    :param username: The username of the new Account.
+    :param notes: The number of Notes to create.
+    :param checklists: The number of Checklists to create.
+    :param items: The number of ChecklistItems to create in each Checklist, or a (minimum, maximum) tuple to pick a
+                  number at random for each one.
+    :param seed: The seed for the random item counts, so that the same arguments always create the same data.
+    :return: The new Account.
+    """
+
+    account = Account.objects.create_user(username, '{}@example.com'.format(username), username)
+    random = Random(seed)
+
+    def make_note(i):
+        note = Note(owner=account, title='Note {}'.format(i), content='Some <b>content</b> for note {}'.format(i))
+        note.update_preview()
+        return note
+
+    bulk_create(Note, (make_note(i) for i in range(notes)))
+    bulk_create(Checklist, (Checklist(owner=account, title='Checklist {}'.format(i)) for i in range(checklists)))
+
+    # Not every database returns the IDs from bulk_create, but the Account is new, so its Checklists are all of these
+    checklist_ids = list(Checklist.objects.filter(owner=account).order_by('id').values_list('id', flat=True))
+
+    bulk_create(ChecklistItem, (
+        ChecklistItem(checklist_id=checklist_id, text='Item {}'.format(j), complete=bool(j % 2), order=(j + 1) * GAP)
+        for checklist_id in checklist_ids
+        for j in range(random.randint(*items) if isinstance(items, tuple) else items)
+    ))
+
+    return account
+
+
+def index_account(account):
+    """ Index every Note and Checklist of an Account made by seed_account for search, INDEX_BATCH_SIZE at a time. """
+
+    for kind, model in ((SearchDocument.NOTE, Note), (SearchDocument.CHECKLIST, Checklist)):
+        object_ids = list(model.objects.filter(owner=account).values_list('id', flat=True))
+        for start in range(0, len(object_ids), INDEX_BATCH_SIZE):
+            index_objects(kind, object_ids[start:start + INDEX_BATCH_SIZE])
+
+
+def delete_account(account):
+    """ Delete an Account made by seed_account, along with everything it owns. Deleting it the usual way would load
+    every one of its rows to send their signals, and write a tombstone and update the search index for each, so what it
+    owns is deleted with one statement per table instead. """
+
+    checklists = 'SELECT id FROM {} WHERE owner_id = %s'.format(connection.ops.quote_name(Checklist._meta.db_table))
+    conditions = [
+        (ChecklistItem, 'checklist_id IN ({})'.format(checklists)),
+        (Checklist, 'owner_id = %s'),
+        (Note, 'owner_id = %s'),
+        (SearchTerm, 'owner_id = %s'),
+        (SearchDocument, 'owner_id = %s'),
+        (Tombstone, 'owner_id = %s'),
+        (ClientOperation, 'owner_id = %s'),
+    ]
+
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            for model, condition in conditions:
+                table = connection.ops.quote_name(model._meta.db_table)
+                cursor.execute('DELETE FROM {} WHERE {}'.format(table, condition), [account.pk])
+        account.delete()
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.29 on 2026-10-18 11:42
+from __future__ import unicode_literals
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cloudcache', '0007_search_index'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='checklistitem',
+            name='cloudcache__modifie_b5bfc6_idx',
+        ),
+        migrations.AlterField(
+            model_name='checklist',
+            name='owner',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='lists', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='checklistitem',
+            name='checklist',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='items', to='cloudcache.Checklist'),
+        ),
+        migrations.AlterField(
+            model_name='note',
+            name='owner',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='notes', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='checklist',
+            index=models.Index(fields=['owner', 'id'], name='cloudcache__owner_i_27d6f5_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='checklist',
+            index=models.Index(fields=['owner', 'created'], name='cloudcache__owner_i_e15a89_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='checklistitem',
+            index=models.Index(fields=['checklist', 'order', 'id'], name='cloudcache__checkli_2f795a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='checklistitem',
+            index=models.Index(fields=['checklist', 'modified'], name='cloudcache__checkli_435dcd_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='note',
+            index=models.Index(fields=['owner', 'id'], name='cloudcache__owner_i_c7cda2_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='note',
+            index=models.Index(fields=['owner', 'created'], name='cloudcache__owner_i_b69bb9_idx'),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations
+
+# Matches cloudcache.ordering.GAP at the time of writing; migrations shouldn't depend on code which may change later
+GAP = 1024
+
+
+def spread_orders(apps, schema_editor):
+    """ Lay out each Checklist's items with gaps between their order values, keeping their current order, so that an
+    item can later be moved or inserted by writing only that item. """
+
+    ChecklistItem = apps.get_model('cloudcache', 'ChecklistItem')
+
+    checklist_id = None
+    position = 0
+    for item in ChecklistItem.objects.order_by('checklist_id', 'order', 'id').only('checklist_id', 'order').iterator():
+        if item.checklist_id != checklist_id:
+            checklist_id, position = item.checklist_id, 0
+
+        position += 1
+        ChecklistItem.objects.filter(pk=item.pk).update(order=position * GAP)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cloudcache', '0008_owner_scoped_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(spread_orders, migrations.RunPython.noop),
+    ]
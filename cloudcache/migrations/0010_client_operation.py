@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.29 on 2026-10-18 12:09
+from __future__ import unicode_literals
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('cloudcache', '0009_spread_checklistitem_order'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ClientOperation',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.UUIDField()),
+                ('client_id', models.UUIDField(blank=True, null=True)),
+                ('kind', models.CharField(choices=[('note', 'Note'), ('checklist', 'Checklist'), ('checklistitem', 'Checklist item')], max_length=16)),
+                ('object_id', models.IntegerField(blank=True, null=True)),
+                ('result', models.TextField()),
+                ('created', models.DateTimeField(auto_now_add=True)),
+                ('owner', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ('id',),
+            },
+        ),
+        migrations.AddIndex(
+            model_name='clientoperation',
+            index=models.Index(fields=['owner', 'client_id'], name='cloudcache__owner_i_a55df5_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='clientoperation',
+            index=models.Index(fields=['created'], name='cloudcache__created_00eace_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='clientoperation',
+            unique_together=set([('owner', 'key')]),
+        ),
+    ]
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.29 on 2026-10-18 12:17
+from __future__ import unicode_literals
+
+import re
+from hashlib import sha256
+from html import unescape
+
+from django.db import migrations, models
+from django.utils.html import strip_tags
+from django.utils.text import Truncator
+
+# Matches PREVIEW_LENGTH, cut_markup and make_preview in cloudcache.models.Note at the time of writing; migrations
+# shouldn't depend on code which may change later
+PREVIEW_LENGTH = 500
+PARTIAL_ENTITY = re.compile(r'&#?\w*')
+
+
+def cut_markup(content, length):
+    markup = content[:length]
+    if len(markup) == len(content):
+        return markup
+
+    start = markup.rfind('<')
+    if start > markup.rfind('>'):
+        markup = markup[:start]
+
+    start = markup.rfind('&')
+    if start >= 0 and PARTIAL_ENTITY.fullmatch(markup, start):
+        markup = markup[:start]
+
+    return markup
+
+
+def fill_previews(apps, schema_editor):
+    """ Store the preview, hash and size of every existing Note's content. """
+
+    Note = apps.get_model('cloudcache', 'Note')
+
+    for note in Note.objects.only('content').iterator():
+        encoded = note.content.encode('utf-8')
+        text = unescape(strip_tags(cut_markup(note.content, PREVIEW_LENGTH * 8))).replace('\xa0', ' ').strip()
+
+        Note.objects.filter(pk=note.pk).update(preview=Truncator(text).chars(PREVIEW_LENGTH),
+                                               content_hash=sha256(encoded).hexdigest(), content_size=len(encoded))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cloudcache', '0010_client_operation'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='note',
+            name='content_hash',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+        migrations.AddField(
+            model_name='note',
+            name='content_size',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='note',
+            name='preview',
+            field=models.CharField(blank=True, editable=False, max_length=500),
+        ),
+        migrations.RunPython(fill_previews, migrations.RunPython.noop),
+    ]
@@ -1,16 +1,46 @@
-from django.db.models import Model, CharField, ForeignKey
+from django.db.models import Model, Index, QuerySet, CharField, ForeignKey, Prefetch
 from django.conf import settings
-from .mixins import TrackingFieldsMixin
+from .mixins import IndexedFieldsMixin, TrackingFieldsMixin
 
-class Checklist(TrackingFieldsMixin, Model):
+
+class ChecklistQuerySet(QuerySet):
+    """ Custom QuerySet for Checklists. """
+
+    def with_items(self, collapsed=False):
+        """ Prefetch each Checklist's items, ordered by their position in the list, so that serializing any number of
+        Checklists with their nested items costs exactly two queries. If `collapsed`, only the items' IDs are loaded,
+        for listing them by ID. """
+
+        # Imported here, since ChecklistItem itself depends on Checklist
+        from .ChecklistItem import ChecklistItem
+
+        items = ChecklistItem.objects.order_by('order', 'id')
+        if collapsed:
+            items = items.only('id', 'checklist')
+
+        return self.prefetch_related(Prefetch('items', queryset=items))
+
+
+class Checklist(IndexedFieldsMixin, TrackingFieldsMixin, Model):
     """ A cloudCache checklist. """
 
     class Meta:
         ordering = ('id',)
+        # Every query is scoped to one owner, so each index leads with it, standing in for a plain index on the FK
+        indexes = [
+            Index(fields=['owner', 'id']),
+            Index(fields=['owner', 'modified']),
+            Index(fields=['owner', 'created']),
+        ]
 
-    owner = ForeignKey(settings.AUTH_USER_MODEL, related_name='lists')
+    owner = ForeignKey(settings.AUTH_USER_MODEL, related_name='lists', db_index=False)
     title = CharField(max_length=1024, blank=False)
 
+    objects = ChecklistQuerySet.as_manager()
+
+    # The fields whose values end up in the search index
+    indexed_fields = ('title',)
+
     def __repr__(self):
         return '<Checklist: {}>'.format(self.title)
 
@@ -1,20 +1,95 @@
-from django.db.models import Model, CharField, IntegerField, BooleanField, ForeignKey, CASCADE
+from django.db.models import Model, Index, QuerySet, CharField, IntegerField, BooleanField, ForeignKey, CASCADE, Case,\
+    When, Value, Max
+from django.utils import timezone
 
 from . import Checklist
-from .mixins import TrackingFieldsMixin
+from .mixins import IndexedFieldsMixin, TrackingFieldsMixin
+from ..ordering import GAP, assign_orders
 
 
-class ChecklistItem(TrackingFieldsMixin, Model):
+class ChecklistItemQuerySet(QuerySet):
+    """ Custom QuerySet for ChecklistItems, providing the bulk write helpers used by the API. """
+
+    def bulk_update(self, items, fields, batch_size=500):
+        """ Update the supplied fields of many ChecklistItems with one UPDATE statement per batch, rather than one per
+        item. Django 1.11 has no QuerySet.bulk_update, so this builds a CASE WHEN id=... THEN ... expression for each
+        field instead. Each item's `modified` timestamp is bumped, since .update() skips the auto_now machinery.
+
+        :param items: The ChecklistItem instances to write, already holding their new field values.
+        :param fields: The names of the fields to write.
+        :param batch_size: The maximum number of items written by a single UPDATE statement.
+        :return: The number of rows updated.
+        """
+
+        items = list(items)
+        if not items:
+            return 0
+
+        now = timezone.now()
+        updated = 0
+
+        for start in range(0, len(items), batch_size):
+            batch = items[start:start + batch_size]
+            cases = {}
+            for field in fields:
+                whens = [When(pk=item.pk, then=Value(getattr(item, field))) for item in batch]
+                cases[field] = Case(*whens, output_field=self.model._meta.get_field(field))
+
+            updated += self.filter(pk__in=[item.pk for item in batch]).update(modified=now, **cases)
+
+            for item in batch:
+                item.modified = now
+
+        return updated
+
+    def next_order(self, checklist):
+        """ Return the order value for a new item at the end of a Checklist. """
+
+        last = self.filter(checklist=checklist).aggregate(last=Max('order'))['last']
+        return GAP if last is None else last + GAP
+
+    def move(self, item, before=None, after=None):
+        """ Move an item to just before or just after another item in the same Checklist. Only the moved item is
+        written, unless there's no room left between its new neighbours, in which case the Checklist is laid out again.
+
+        :param item: The ChecklistItem to move.
+        :param before: The ChecklistItem to move it in front of, or None.
+        :param after: The ChecklistItem to move it behind, or None.
+        :return: The number of rows updated.
+        """
+
+        anchor = before or after
+        items = [other for other in self.filter(checklist_id=item.checklist_id).order_by('order', 'id').only('order')
+                 if other.pk != item.pk]
+
+        index = next(index for index, other in enumerate(items) if other.pk == anchor.pk)
+        items.insert(index + 1 if after is not None else index, item)
+
+        return self.bulk_update(assign_orders(items), ('order',))
+
+
+class ChecklistItem(IndexedFieldsMixin, TrackingFieldsMixin, Model):
     """ A cloudCache checklist item. """
 
     class Meta:
         ordering = ('id',)
+        # Items are always read a checklist at a time, so each index leads with it, standing in for a plain index on
+        # the FK
+        indexes = [
+            Index(fields=['checklist', 'order', 'id']),
+            Index(fields=['checklist', 'modified']),
+        ]
 
     text = CharField(max_length=1024, blank=False)
     complete = BooleanField(default=False)
-    checklist = ForeignKey(Checklist, on_delete=CASCADE, related_name='items')
+    checklist = ForeignKey(Checklist, on_delete=CASCADE, related_name='items', db_index=False)
     order = IntegerField(default=1)
 
+    objects = ChecklistItemQuerySet.as_manager()
+
+    # The fields whose values end up in the search index
+    indexed_fields = ('text', 'checklist_id')
+
     def __repr__(self):
         return '<ChecklistItem: {}>'.format(self.text)
 
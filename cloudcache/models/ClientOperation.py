@@ -0,0 +1,35 @@
+from django.db.models import Model, CharField, IntegerField, TextField, UUIDField, DateTimeField, ForeignKey, Index,\
+    CASCADE
+from django.conf import settings
+
+from . import Tombstone
+
+
+class ClientOperation(Model):
+    """ A write which a client sent to the operation log, recorded under the idempotency key the client gave it, so that
+    a retry of the same operation is answered with the original result rather than applied twice. Operations which
+    created an object also map the client's own UUID for it to the real ID, so that later operations, written before
+    the client knew the real ID, can refer to it. Like tombstones, operations are compacted away once they're older than
+    the retention period. """
+
+    class Meta:
+        ordering = ('id',)
+        unique_together = (('owner', 'key'),)
+        indexes = [
+            Index(fields=['owner', 'client_id']),
+            Index(fields=['created']),
+        ]
+
+    owner = ForeignKey(settings.AUTH_USER_MODEL, on_delete=CASCADE, related_name='+', db_index=False)
+    key = UUIDField()
+    client_id = UUIDField(null=True, blank=True)
+    kind = CharField(max_length=16, choices=Tombstone.KIND_CHOICES)
+    object_id = IntegerField(null=True, blank=True)
+    result = TextField()
+    created = DateTimeField(auto_now_add=True)
+
+    def __repr__(self):
+        return '<ClientOperation: {}>'.format(self.key)
+
+    def __str__(self):
+        return str(self.key)
@@ -1,18 +1,94 @@
-from django.db.models import Model, CharField, ForeignKey, TextField, CASCADE
+import re
+from hashlib import sha256
+from html import unescape
+
+from django.db.models import Model, Index, CharField, ForeignKey, PositiveIntegerField, TextField, CASCADE
 from django.conf import settings
-from .mixins import TrackingFieldsMixin
+from django.utils.html import strip_tags
+from django.utils.text import Truncator
+
+from .mixins import IndexedFieldsMixin, TrackingFieldsMixin
+
+# The most characters of plain text kept as a Note's preview
+PREVIEW_LENGTH = 500
+
+# A character entity cut short at the very end of some markup
+PARTIAL_ENTITY = re.compile(r'&#?\w*')
+
+
+def cut_markup(content, length):
+    """ Return the first `length` characters of some markup, less any tag or entity which that cuts in half, so that
+    stripping the tags doesn't leave part of one behind. """
+
+    markup = content[:length]
+    if len(markup) == len(content):
+        return markup
+
+    start = markup.rfind('<')
+    if start > markup.rfind('>'):
+        markup = markup[:start]
+
+    start = markup.rfind('&')
+    if start >= 0 and PARTIAL_ENTITY.fullmatch(markup, start):
+        markup = markup[:start]
+
+    return markup
 
 
-class Note(TrackingFieldsMixin, Model):
-    """ A cloudCache note. """
+def make_preview(content):
+    """ Return the plain text preview of a Note's content: the markup the note editor leaves is stripped, and the text
+    cut down to PREVIEW_LENGTH characters. Only the start of the content is looked at, however long it is, leaving
+    plenty of room for markup. """
+
+    text = unescape(strip_tags(cut_markup(content, PREVIEW_LENGTH * 8))).replace('\xa0', ' ').strip()
+    return Truncator(text).chars(PREVIEW_LENGTH)
+
+
+class Note(IndexedFieldsMixin, TrackingFieldsMixin, Model):
+    """ A cloudCache note. Alongside its content, each Note stores a short plain text preview of it, and its hash and
+    size, so that lists of Notes can be sent without their content, which may be hundreds of kilobytes. """
 
     class Meta:
         ordering = ('id',)
+        # Every query is scoped to one owner, so each index leads with it, standing in for a plain index on the FK
+        indexes = [
+            Index(fields=['owner', 'id']),
+            Index(fields=['owner', 'modified']),
+            Index(fields=['owner', 'created']),
+        ]
 
-    owner = ForeignKey(settings.AUTH_USER_MODEL, related_name='notes')
+    owner = ForeignKey(settings.AUTH_USER_MODEL, related_name='notes', db_index=False)
     title = CharField(max_length=1024, blank=False)
     content = TextField(blank=False)
 
+    # Kept up to date with the content by save()
+    preview = CharField(max_length=PREVIEW_LENGTH, blank=True, editable=False)
+    content_hash = CharField(max_length=64, blank=True, editable=False)
+    content_size = PositiveIntegerField(default=0, editable=False)
+
+    # The fields whose values end up in the search index
+    indexed_fields = ('title', 'content')
+
+    def update_preview(self):
+        """ Bring the preview, and the SHA-256 hash and size in bytes of the UTF-8 content, up to date with the content.
+        save() does this, so only code which writes Notes some other way, such as bulk_create, has to call it. """
+
+        encoded = self.content.encode('utf-8')
+        self.preview = make_preview(self.content)
+        self.content_hash = sha256(encoded).hexdigest()
+        self.content_size = len(encoded)
+
+    def save(self, *args, **kwargs):
+        """ Update the preview along with the content, unless the content wasn't loaded or isn't being saved. """
+
+        update_fields = kwargs.get('update_fields')
+        if 'content' not in self.get_deferred_fields() and (update_fields is None or 'content' in update_fields):
+            self.update_preview()
+            if update_fields is not None:
+                kwargs['update_fields'] = set(update_fields) | {'preview', 'content_hash', 'content_size'}
+
+        super().save(*args, **kwargs)
+
     def __repr__(self):
         return '<Note: {}>'.format(self.title)
 
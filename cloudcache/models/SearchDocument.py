@@ -0,0 +1,36 @@
+from django.contrib.postgres.search import SearchVectorField
+from django.db.models import Model, CharField, IntegerField, TextField, ForeignKey, CASCADE
+from django.conf import settings
+
+
+class SearchDocument(Model):
+    """ The searchable text of a single Note or Checklist, kept up to date as they're saved. A Checklist's document
+    includes the text of all its items.
+
+    On PostgreSQL, `vector` holds the weighted tsvector of the text, behind a GIN index. Other databases leave it empty,
+    and use the SearchTerm inverted index instead. """
+
+    NOTE = 'note'
+    CHECKLIST = 'checklist'
+
+    KIND_CHOICES = (
+        (NOTE, 'Note'),
+        (CHECKLIST, 'Checklist'),
+    )
+
+    class Meta:
+        ordering = ('id',)
+        unique_together = (('kind', 'object_id'),)
+
+    owner = ForeignKey(settings.AUTH_USER_MODEL, on_delete=CASCADE, related_name='+')
+    kind = CharField(max_length=16, choices=KIND_CHOICES)
+    object_id = IntegerField()
+    title = TextField(blank=True)
+    body = TextField(blank=True)
+    vector = SearchVectorField(null=True)
+
+    def __repr__(self):
+        return '<SearchDocument: {} {}>'.format(self.kind, self.object_id)
+
+    def __str__(self):
+        return '{} {}'.format(self.kind, self.object_id)
@@ -0,0 +1,25 @@
+from django.db.models import Model, CharField, IntegerField, ForeignKey, Index, CASCADE
+from django.conf import settings
+
+from .SearchDocument import SearchDocument
+
+
+class SearchTerm(Model):
+    """ One entry in the pure-Python inverted index used for search on databases without full-text search: a term
+    appearing in a SearchDocument, weighted by how often and where it appears. The owner is copied from the document so
+    that looking up a user's terms doesn't need a join. """
+
+    class Meta:
+        ordering = ('id',)
+        indexes = [Index(fields=['owner', 'term'])]
+
+    owner = ForeignKey(settings.AUTH_USER_MODEL, on_delete=CASCADE, related_name='+')
+    document = ForeignKey(SearchDocument, on_delete=CASCADE, related_name='terms')
+    term = CharField(max_length=64)
+    weight = IntegerField()
+
+    def __repr__(self):
+        return '<SearchTerm: {}>'.format(self.term)
+
+    def __str__(self):
+        return self.term
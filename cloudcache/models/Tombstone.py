@@ -0,0 +1,33 @@
+from django.db.models import Model, CharField, IntegerField, DateTimeField, ForeignKey, Index, DO_NOTHING
+from django.conf import settings
+
+
+class Tombstone(Model):
+    """ A record of a deleted Note, Checklist or ChecklistItem, so that clients syncing incrementally can find out about
+    objects which no longer exist. Tombstones are compacted away once they're older than the sync retention period. """
+
+    NOTE = 'note'
+    CHECKLIST = 'checklist'
+    CHECKLIST_ITEM = 'checklistitem'
+
+    KIND_CHOICES = (
+        (NOTE, 'Note'),
+        (CHECKLIST, 'Checklist'),
+        (CHECKLIST_ITEM, 'Checklist item'),
+    )
+
+    class Meta:
+        ordering = ('id',)
+        indexes = [Index(fields=['owner', 'deleted'])]
+
+    # Not a real foreign key constraint, since deleting an Account writes tombstones for everything it owned
+    owner = ForeignKey(settings.AUTH_USER_MODEL, on_delete=DO_NOTHING, db_constraint=False, related_name='+')
+    kind = CharField(max_length=16, choices=KIND_CHOICES)
+    object_id = IntegerField()
+    deleted = DateTimeField(auto_now_add=True)
+
+    def __repr__(self):
+        return '<Tombstone: {} {}>'.format(self.kind, self.object_id)
+
+    def __str__(self):
+        return '{} {}'.format(self.kind, self.object_id)
@@ -1,3 +1,7 @@
 from .Note import Note
 from .Checklist import Checklist
 from .ChecklistItem import ChecklistItem
+from .Tombstone import Tombstone
+from .SearchDocument import SearchDocument
+from .SearchTerm import SearchTerm
+from .ClientOperation import ClientOperation
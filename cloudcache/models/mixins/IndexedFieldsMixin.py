@@ -0,0 +1,43 @@
+class IndexedFieldsMixin:
+    """ A Django model mixin which remembers the values of the fields named by `indexed_fields` as they were loaded or
+    last saved, so that signal handlers can tell whether a save changed any of them. """
+
+    indexed_fields = ()
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance.remember_indexed_values()
+        return instance
+
+    def remember_indexed_values(self):
+        """ Remember the current values of the loaded indexed fields. """
+
+        deferred = self.get_deferred_fields()
+        self._indexed_values = {name: getattr(self, name) for name in self.indexed_fields if name not in deferred}
+
+    def get_indexed_value(self, name):
+        """ Return the value an indexed field had when it was loaded or last saved, or None if it wasn't loaded. """
+        return getattr(self, '_indexed_values', {}).get(name)
+
+    def indexed_fields_changed(self, update_fields=None):
+        """ Return whether saving this instance with the given `update_fields` writes a new value to any indexed field.
+        An instance which wasn't loaded from the database is always taken to have changed. """
+
+        names = set(self.indexed_fields)
+        if update_fields is not None:
+            names &= {self._meta.get_field(name).attname for name in update_fields}
+
+        remembered = getattr(self, '_indexed_values', None)
+        if remembered is None:
+            return bool(names)
+
+        deferred = self.get_deferred_fields()
+        return any(name not in deferred and (name not in remembered or getattr(self, name) != remembered[name])
+                   for name in names)
+
+    def save(self, *args, **kwargs):
+        """ Save as usual, then remember the indexed values written, once the post_save handlers have compared them. """
+
+        super().save(*args, **kwargs)
+        self.remember_indexed_values()
@@ -1 +1,2 @@
 from .TrackingFieldsMixin import TrackingFieldsMixin
+from .IndexedFieldsMixin import IndexedFieldsMixin
@@ -0,0 +1,124 @@
+from bisect import bisect_left
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+# The spacing between neighbouring items when a list is laid out from scratch. Halving it leaves room for about ten
+# inserts or moves into the same spot before that stretch of the list has to be laid out again.
+GAP = 1024
+
+
+def order_between(lower, upper):
+    """ Return an order value strictly between two neighbours, either of which may be None at the ends of the list, or
+    None if they're adjacent and there's no room left between them. """
+
+    if lower is None and upper is None:
+        return GAP
+    if lower is None:
+        return upper - GAP
+    if upper is None:
+        return lower + GAP
+    if upper - lower < 2:
+        return None
+
+    return lower + (upper - lower) // 2
+
+
+def spread(count, lower=None, upper=None):
+    """ Return `count` increasing order values strictly between two neighbours, either of which may be None, spaced as
+    evenly as possible. Returns None if there isn't room for them all. """
+
+    if lower is None and upper is None:
+        return [GAP * (i + 1) for i in range(count)]
+    if lower is None:
+        return [upper - GAP * (count - i) for i in range(count)]
+    if upper is None:
+        return [lower + GAP * (i + 1) for i in range(count)]
+    if upper - lower <= count:
+        return None
+
+    step = (upper - lower) / (count + 1)
+    return [lower + int(step * (i + 1)) for i in range(count)]
+
+
+def longest_increasing(values):
+    """ Return the indexes of a longest strictly increasing subsequence of the values, skipping any which are None. """
+
+    # tails[k] is the index of the smallest value ending an increasing run of length k + 1, and previous links each
+    # index back to the one before it in its run
+    tails = list()
+    tail_values = list()
+    previous = dict()
+
+    for index, value in enumerate(values):
+        if value is None:
+            continue
+
+        position = bisect_left(tail_values, value)
+        previous[index] = tails[position - 1] if position else None
+
+        if position == len(tails):
+            tails.append(index)
+            tail_values.append(value)
+        else:
+            tails[position] = index
+            tail_values[position] = value
+
+    result = list()
+    index = tails[-1] if tails else None
+    while index is not None:
+        result.append(index)
+        index = previous[index]
+
+    return result[::-1]
+
+
+def plan_orders(current):
+    """ Work out new order values for a list of items, given in their desired order, changing as few of them as
+    possible. Each entry of `current` is an existing item's order value, or None for a new item.
+
+    The longest run of existing items which are already in increasing order keep their values, and everything else is
+    spread into the gaps between them. So moving one item, or inserting one, only changes that one item. If a gap is too
+    small for what has to go in it, the whole list is laid out afresh instead.
+
+    :param current: The current order value of each item, or None, in the desired order.
+    :return: The new order value of each item, in the same order.
+    """
+
+    orders = list(current)
+    kept = longest_increasing(orders)
+    bounds = [-1] + kept + [len(orders)]
+
+    for start, end in zip(bounds, bounds[1:]):
+        count = end - start - 1
+        if not count:
+            continue
+
+        lower = orders[start] if start >= 0 else None
+        upper = orders[end] if end < len(orders) else None
+
+        values = spread(count, lower, upper)
+        if values is None:
+            return spread(len(orders))
+
+        orders[start + 1:end] = values
+
+    return orders
+
+
+def assign_orders(items):
+    """ Set the `order` of each item, given in the desired order, using `plan_orders`. Items which haven't been saved
+    yet count as new, whatever their current `order`.
+
+    :param items: The items, in the desired order.
+    :return: The saved items whose order value changed, which need writing back.
+    """
+
+    orders = plan_orders([item.order if item.pk is not None else None for item in items])
+
+    changed = list()
+    for item, order in zip(items, orders):
+        if item.pk is not None and item.order != order:
+            changed.append(item)
+        item.order = order
+
+    return changed
@@ -0,0 +1,54 @@
+from functools import partial
+from threading import local
+from weakref import ref
+
+from django.db import transaction
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+# Weak references to the work queued in this thread's current transaction, by name
+_pending = local()
+
+
+class Pending(dict):
+    """ Work queued in one transaction, keyed so that the same work is only queued once. A plain dict can't be weakly
+    referenced, but a subclass of one can. """
+
+
+def _run_flush(name, pending, flush):
+    current = getattr(_pending, name, None)
+    if current is not None and current() is pending:
+        delattr(_pending, name)
+    if flush is not None:
+        flush(pending)
+
+
+def get_pending(name, flush=None):
+    """ Return the Pending dict of work queued under `name` in the current transaction, starting an empty one the first
+    time it's asked for in the transaction. Once the transaction commits, `flush` is called with it.
+
+    Only the transaction's on-commit callback holds on to the dict, and this module just keeps a weak reference to it.
+    So when the transaction, or the savepoint the dict was started in, is rolled back, Django drops the callback, the
+    dict goes with it, and the next caller starts afresh without ever seeing the work that was rolled back. Outside of
+    a transaction there's nothing to queue work in, so an empty dict is returned and `flush` is never called; callers
+    which queue work should do it right away instead. """
+
+    if not transaction.get_connection().in_atomic_block:
+        return Pending()
+
+    pending = getattr(_pending, name, None)
+    pending = pending() if pending is not None else None
+    if pending is None:
+        pending = Pending()
+        setattr(_pending, name, ref(pending))
+        transaction.on_commit(partial(_run_flush, name, pending, flush))
+
+    return pending
+
+
+def forget_pending(name):
+    """ Stop queueing work under `name` in the current transaction, so that the next get_pending starts a new Pending
+    dict. Work already queued is still flushed once the transaction commits. """
+
+    if hasattr(_pending, name):
+        delattr(_pending, name)
@@ -0,0 +1,60 @@
+from collections import Counter, defaultdict
+
+from django.db import transaction
+
+from ..models import SearchTerm
+from . import tokenize
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class InvertedIndexSearchBackend(object):
+    """ Pure-Python search backend for databases without full-text search, such as SQLite in tests. Each document's
+    terms are stored as SearchTerm rows, weighted by how often they appear, with title words counting extra. """
+
+    title_weight = 3
+
+    def index(self, document):
+        """ Replace the SearchTerms of a single SearchDocument. """
+        self.index_many([document])
+
+    def index_many(self, documents):
+        """ Replace the SearchTerms of many SearchDocuments, with one DELETE and one bulk INSERT. """
+
+        terms = list()
+        for document in documents:
+            weights = Counter()
+            for term in tokenize(document.title):
+                weights[term] += self.title_weight
+            for term in tokenize(document.body):
+                weights[term] += 1
+
+            terms.extend(SearchTerm(owner_id=document.owner_id, document=document, term=term, weight=weight)
+                         for term, weight in weights.items())
+
+        with transaction.atomic():
+            SearchTerm.objects.filter(document__in=documents).delete()
+            SearchTerm.objects.bulk_create(terms)
+
+    def search(self, owner, query, limit):
+        """ Return the owner's documents containing every word of the query, ranked by the total weight of the matching
+        terms. """
+
+        terms = set(tokenize(query))
+        if not terms:
+            return list()
+
+        matched = defaultdict(set)
+        ranks = Counter()
+        rows = SearchTerm.objects.filter(owner=owner, term__in=terms)\
+            .values_list('document__kind', 'document__object_id', 'document_id', 'term', 'weight')
+
+        for kind, object_id, document_id, term, weight in rows:
+            key = (kind, object_id, document_id)
+            matched[key].add(term)
+            ranks[key] += weight
+
+        hits = [key for key, found in matched.items() if found == terms]
+        hits.sort(key=lambda key: (-ranks[key], key[2]))
+
+        return [(kind, object_id, float(ranks[kind, object_id, document_id]))
+                for kind, object_id, document_id in hits[:limit]]
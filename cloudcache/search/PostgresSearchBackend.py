@@ -0,0 +1,35 @@
+from django.conf import settings
+from django.contrib.postgres.search import SearchVector, SearchQuery, SearchRank
+from django.db.models import F
+
+from ..models import SearchDocument
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class PostgresSearchBackend(object):
+    """ Search backend using PostgreSQL full-text search, over the GIN-indexed tsvector column of each SearchDocument.
+    Titles are weighted above body text when ranking. """
+
+    def __init__(self):
+        self.config = getattr(settings, 'SEARCH_CONFIG', 'english')
+
+    def index(self, document):
+        """ Recompute the tsvector of a single SearchDocument from its title and body. """
+        self.index_many([document])
+
+    def index_many(self, documents):
+        """ Recompute the tsvectors of many SearchDocuments, with a single UPDATE. """
+
+        vector = SearchVector('title', weight='A', config=self.config) + \
+            SearchVector('body', weight='B', config=self.config)
+        SearchDocument.objects.filter(pk__in=[document.pk for document in documents]).update(vector=vector)
+
+    def search(self, owner, query, limit):
+        """ Return the owner's documents matching every word of the query, ranked by relevance. """
+
+        query = SearchQuery(query, config=self.config)
+        documents = SearchDocument.objects.filter(owner=owner, vector=query)\
+            .annotate(rank=SearchRank(F('vector'), query))\
+            .order_by('-rank', 'id')
+
+        return list(documents.values_list('kind', 'object_id', 'rank')[:limit])
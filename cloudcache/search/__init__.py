@@ -0,0 +1,132 @@
+import re
+from html import unescape
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils.html import strip_tags
+from django.utils.module_loading import import_string
+
+from ..models import Note, Checklist, ChecklistItem, SearchDocument
+from ..pending import get_pending
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+TOKEN_PATTERN = re.compile(r'\w+')
+MAX_TERM_LENGTH = 64
+
+_backend = None
+
+
+def get_backend():
+    """ Return the search backend instance. SEARCH_BACKEND picks one by dotted path. By default PostgreSQL uses its
+    full-text search, and every other database uses the pure-Python inverted index. """
+
+    global _backend
+    if _backend is None:
+        path = getattr(settings, 'SEARCH_BACKEND', None)
+        if path is None:
+            path = 'cloudcache.search.PostgresSearchBackend' if connection.vendor == 'postgresql'\
+                else 'cloudcache.search.InvertedIndexSearchBackend'
+        _backend = import_string(path)()
+
+    return _backend
+
+
+def to_plain_text(text):
+    """ Strip the markup the note editor leaves in its content, so only the words themselves are indexed. """
+    return unescape(strip_tags(text))
+
+
+def tokenize(text):
+    """ Split text into lowercase search terms. """
+    return [token[:MAX_TERM_LENGTH] for token in TOKEN_PATTERN.findall(text.lower())]
+
+
+def index_object(kind, object_id):
+    """ Bring the SearchDocument of one Note or Checklist up to date with what's in the database, or delete it if the
+    object no longer exists. Only that one document is touched, never the rest of the index. """
+
+    if kind == SearchDocument.NOTE:
+        row = Note.objects.filter(pk=object_id).values_list('owner_id', 'title', 'content').first()
+    else:
+        row = Checklist.objects.filter(pk=object_id).values_list('owner_id', 'title').first()
+        if row is not None:
+            texts = ChecklistItem.objects.filter(checklist_id=object_id).order_by('order', 'id')\
+                .values_list('text', flat=True)
+            row += ('\n'.join(texts),)
+
+    if row is None:
+        SearchDocument.objects.filter(kind=kind, object_id=object_id).delete()
+        return
+
+    owner_id, title, body = row
+    document, _ = SearchDocument.objects.update_or_create(kind=kind, object_id=object_id, defaults={
+        'owner_id': owner_id,
+        'title': title,
+        'body': to_plain_text(body),
+    })
+    get_backend().index(document)
+
+
+def index_objects(kind, object_ids):
+    """ Bring the SearchDocuments of many Notes, or many Checklists, up to date with what's in the database, with the
+    same handful of queries however many there are. Their documents are replaced wholesale, and those of objects which
+    no longer exist are deleted. Meant for batches of a few hundred, such as an import's.
+
+    :param kind: SearchDocument.NOTE or SearchDocument.CHECKLIST.
+    :param object_ids: The IDs of the Notes or Checklists.
+    """
+
+    object_ids = list(object_ids)
+    if kind == SearchDocument.NOTE:
+        rows = {pk: (owner_id, title, content) for pk, owner_id, title, content in
+                Note.objects.filter(pk__in=object_ids).values_list('id', 'owner_id', 'title', 'content')}
+    else:
+        texts = {pk: list() for pk in object_ids}
+        items = ChecklistItem.objects.filter(checklist_id__in=object_ids).order_by('checklist_id', 'order', 'id')
+        for checklist_id, text in items.values_list('checklist_id', 'text'):
+            texts[checklist_id].append(text)
+
+        rows = {pk: (owner_id, title, '\n'.join(texts[pk])) for pk, owner_id, title in
+                Checklist.objects.filter(pk__in=object_ids).values_list('id', 'owner_id', 'title')}
+
+    with transaction.atomic():
+        SearchDocument.objects.filter(kind=kind, object_id__in=object_ids).delete()
+        SearchDocument.objects.bulk_create([
+            SearchDocument(kind=kind, object_id=pk, owner_id=owner_id, title=title, body=to_plain_text(body))
+            for pk, (owner_id, title, body) in rows.items()
+        ])
+
+        # Not every database returns the IDs from bulk_create, and the backend needs them
+        get_backend().index_many(list(SearchDocument.objects.filter(kind=kind, object_id__in=rows.keys())))
+
+
+def _index_pending(pending):
+    for kind, object_id in pending:
+        index_object(kind, object_id)
+
+
+def schedule_index(kind, object_id):
+    """ Index a Note or Checklist once the current transaction commits, or right away outside of a transaction.
+    Saving many items of the same Checklist in one transaction only indexes that Checklist once. """
+
+    if not transaction.get_connection().in_atomic_block:
+        index_object(kind, object_id)
+        return
+
+    get_pending('search', _index_pending)[(kind, object_id)] = None
+
+
+def search(owner, query, limit=50):
+    """ Search the owner's Notes and Checklists.
+
+    :param owner: The Account whose data is searched.
+    :param query: The search text, as typed by the user.
+    :param limit: The maximum number of results.
+    :return: A list of (kind, object_id, rank) tuples, best match first.
+    """
+    return get_backend().search(owner, query, limit)
+
+
+from .PostgresSearchBackend import PostgresSearchBackend
+from .InvertedIndexSearchBackend import InvertedIndexSearchBackend
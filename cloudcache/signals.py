@@ -0,0 +1,144 @@
+from django.db.models.signals import pre_delete, post_delete, post_save
+
+from .events import publish_change
+from .models import Note, Checklist, ChecklistItem, Tombstone, SearchDocument
+from .pending import get_pending, forget_pending
+from .search import schedule_index
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+def _get_deleting_checklists():
+    """ Owners of the Checklists being deleted by the current deletion, keyed by Checklist ID. Deleting a Checklist
+    cascades to its items, and those items don't have their Checklist loaded, so this saves a query per item when
+    writing their tombstones. """
+    return get_pending('deleting_checklists')
+
+
+def remember_checklist_owner(sender, instance, **kwargs):
+    """ Before a Checklist and its items are deleted, remember who owned it for the items' tombstones. """
+    _get_deleting_checklists()[instance.pk] = instance.owner_id
+
+
+def expect_deletion(sender, instance, **kwargs):
+    """ Before an object is deleted, note that its tombstone is still to come. Django sends pre_delete for everything a
+    deletion collected before it deletes any of it, so this is the whole deletion, cascades included. """
+    get_pending('deletions')[(sender, instance.pk)] = None
+
+
+def record_tombstone(owner_id, kind, sender, object_id):
+    """ Queue the tombstone for a deleted object, and once every object the deletion collected has been deleted, write
+    all of their tombstones with a single bulk_create. This happens inside the deletion's own transaction, so the
+    tombstones are committed or rolled back along with it, and deleting a Checklist with a thousand items, or an Account
+    with everything it owns, costs one INSERT rather than one per object. The next deletion starts its own batch, so
+    one which failed part way and was rolled back to a savepoint leaves nothing behind for it. """
+
+    deletions = get_pending('deletions')
+    deletions.pop((sender, object_id), None)
+    tombstones = get_pending('tombstones')
+    tombstones[(kind, object_id)] = Tombstone(owner_id=owner_id, kind=kind, object_id=object_id)
+
+    if not deletions:
+        Tombstone.objects.bulk_create(tombstones.values())
+        for name in ('deletions', 'tombstones', 'deleting_checklists'):
+            forget_pending(name)
+
+
+def record_note_deletion(sender, instance, **kwargs):
+    """ Write a tombstone for a deleted Note. """
+    record_tombstone(instance.owner_id, Tombstone.NOTE, sender, instance.pk)
+
+
+def record_checklist_deletion(sender, instance, **kwargs):
+    """ Write a tombstone for a deleted Checklist. Its items have already been deleted by now. """
+
+    _get_deleting_checklists().pop(instance.pk, None)
+    record_tombstone(instance.owner_id, Tombstone.CHECKLIST, sender, instance.pk)
+
+
+def record_checklist_item_deletion(sender, instance, **kwargs):
+    """ Write a tombstone for a deleted ChecklistItem. The owner comes from the Checklist being deleted along with it if
+    there is one, otherwise from the item's own Checklist, which is already loaded when deleting through it. """
+
+    owner_id = _get_deleting_checklists().get(instance.checklist_id)
+    if owner_id is None:
+        owner_id = instance.checklist.owner_id
+
+    record_tombstone(owner_id, Tombstone.CHECKLIST_ITEM, sender, instance.pk)
+
+
+def _needs_index(instance, **kwargs):
+    """ Whether a saved or deleted object's search document may have changed: it was created or deleted, or the save
+    wrote a new value to one of its indexed fields. """
+    return kwargs['signal'] is post_delete or kwargs.get('created') or \
+        instance.indexed_fields_changed(kwargs.get('update_fields'))
+
+
+def index_note(sender, instance, **kwargs):
+    """ Update the search index for a Note which was created, deleted, or had its title or content changed. """
+
+    if _needs_index(instance, **kwargs):
+        schedule_index(SearchDocument.NOTE, instance.pk)
+
+
+def index_checklist(sender, instance, **kwargs):
+    """ Update the search index for a Checklist which was created, deleted, or had its title changed. """
+
+    if _needs_index(instance, **kwargs):
+        schedule_index(SearchDocument.CHECKLIST, instance.pk)
+
+
+def index_checklist_item(sender, instance, **kwargs):
+    """ Update the search index for the Checklist of an item which was created, deleted, or had its text changed,
+    unless that Checklist is being deleted too. An item moved to another Checklist updates both of them. """
+
+    if not _needs_index(instance, **kwargs):
+        return
+
+    previous_id = instance.get_indexed_value('checklist_id')
+    for checklist_id in {instance.checklist_id, previous_id} - {None}:
+        if checklist_id not in _get_deleting_checklists():
+            schedule_index(SearchDocument.CHECKLIST, checklist_id)
+
+
+def publish_note_change(sender, instance, **kwargs):
+    """ Push a Note which was saved or deleted to its owner's open dashboards. """
+
+    action = 'deleted' if kwargs['signal'] is post_delete else 'saved'
+    publish_change(instance.owner_id, Tombstone.NOTE, action, instance.pk)
+
+
+def publish_checklist_change(sender, instance, **kwargs):
+    """ Push a Checklist which was saved or deleted to its owner's open dashboards. """
+
+    action = 'deleted' if kwargs['signal'] is post_delete else 'saved'
+    publish_change(instance.owner_id, Tombstone.CHECKLIST, action, instance.pk)
+
+
+def publish_checklist_item_change(sender, instance, **kwargs):
+    """ Push a ChecklistItem which was saved or deleted to its owner's open dashboards, unless its whole Checklist is
+    being deleted, which is pushed on its own. """
+
+    if instance.checklist_id in _get_deleting_checklists():
+        return
+
+    action = 'deleted' if kwargs['signal'] is post_delete else 'saved'
+    publish_change(instance.checklist.owner_id, Tombstone.CHECKLIST_ITEM, action, instance.pk, instance.checklist_id)
+
+
+def connect_signals():
+    """ Connect the handlers above. Called from the app config once the models are ready. """
+
+    pre_delete.connect(remember_checklist_owner, sender=Checklist)
+    for model in (Note, Checklist, ChecklistItem):
+        pre_delete.connect(expect_deletion, sender=model)
+    post_delete.connect(record_note_deletion, sender=Note)
+    post_delete.connect(record_checklist_deletion, sender=Checklist)
+    post_delete.connect(record_checklist_item_deletion, sender=ChecklistItem)
+
+    for signal in (post_save, post_delete):
+        signal.connect(index_note, sender=Note)
+        signal.connect(index_checklist, sender=Checklist)
+        signal.connect(index_checklist_item, sender=ChecklistItem)
+        signal.connect(publish_note_change, sender=Note)
+        signal.connect(publish_checklist_change, sender=Checklist)
+        signal.connect(publish_checklist_item_change, sender=ChecklistItem)
@@ -1,3 +1,1578 @@
-from django.test import TestCase
+import asyncio
+import gzip
+import json
+import os
+import re
+from collections import OrderedDict
+from datetime import date, datetime, time, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from hashlib import sha256
+from importlib import import_module
+from io import BytesIO, StringIO
+from tempfile import TemporaryDirectory
+from time import sleep
+from unittest import mock
+from uuid import UUID
 
-# Create your tests here.
+import brotli
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command, CommandError
+from django.db import DatabaseError, connection, transaction
+from django.db.models.signals import post_delete
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import TestCase, TransactionTestCase, RequestFactory, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from django.utils.text import Truncator
+
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from api.compression import CompressionMiddleware
+from api.events import EventStreamApplication
+from api.parsers import FastJSONParser
+from api.renderers import FastJSONRenderer
+from api.serializers import NoteSerializer, ChecklistSerializer, ChecklistItemSerializer, NoteValuesSerializer,\
+    ChecklistValuesSerializer, ChecklistItemValuesSerializer
+from api.sync import decode_cursor, encode_cursor, get_next_cursor
+from api.throttling import MemoryThrottleStore, get_store as get_throttle_store
+from authentication.models import Account, ApiToken
+from cloudcache.bundles import BUNDLES, BundleFinder
+from cloudcache.events import MemoryBroker, get_broker
+from cloudcache.management.seeding import delete_account
+from cloudcache.models.Note import PREVIEW_LENGTH, make_preview
+from cloudcache.models import Note, Checklist, ChecklistItem, ClientOperation, SearchDocument, SearchTerm, Tombstone
+from cloudcache.search import InvertedIndexSearchBackend, get_backend as get_search_backend, search
+from web.asgi import application as asgi_application
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class ApiQueryCountTests(TestCase):
+    """ Pin the number of queries each owner-scoped list endpoint runs, so that it stays constant however much data
+    the user has. Every count includes one query to load the session, which is kept in the database, and one aggregate
+    query per model for the ETag validators. The logged-in Account comes from the cache, which setUp warms up, so it
+    costs nothing. """
+
+    def setUp(self):
+        self.account = Account.objects.create_user('owner', 'owner@example.com', 'password')
+        self.client.force_login(self.account)
+        self.client.get('/api/', secure=True)
+
+    def add_data(self, count):
+        """ Create `count` notes, and `count` checklists with `count` items each, for the logged-in user. """
+
+        for i in range(count):
+            Note.objects.create(owner=self.account, title='note {}'.format(i), content='content')
+            checklist = Checklist.objects.create(owner=self.account, title='list {}'.format(i))
+            for j in range(count):
+                ChecklistItem.objects.create(checklist=checklist, text='item {}'.format(j), order=count - j)
+
+        return checklist
+
+    def assertConstantQueries(self, num, get_url):
+        """ Assert the endpoint whose url is returned by `get_url` runs `num` queries with a little data, and still
+        runs `num` queries after a lot more data is added. """
+
+        for count in (1, 10):
+            self.add_data(count)
+            url = get_url()
+            with self.assertNumQueries(num):
+                self.assertEqual(self.client.get(url, secure=True).status_code, 200)
+
+    def test_note_list(self):
+        self.assertConstantQueries(3, lambda: '/api/notes/')
+
+    def test_checklist_list(self):
+        self.assertConstantQueries(5, lambda: '/api/checklists/')
+
+    def test_checklist_detail(self):
+        self.assertConstantQueries(5, lambda: '/api/checklists/{}/'.format(Checklist.objects.last().pk))
+
+    def test_checklistitem_list(self):
+        self.assertConstantQueries(3, lambda: '/api/checklistitems/')
+
+    def test_checklist_items_list(self):
+        self.assertConstantQueries(3, lambda: '/api/checklists/{}/items/'.format(Checklist.objects.last().pk))
+
+    def test_not_modified_skips_serialization(self):
+        """ A matching If-None-Match is answered with a 304 using only the validator aggregates. """
+
+        checklist = self.add_data(3)
+        url = '/api/checklists/{}/'.format(checklist.pk)
+        etag = self.client.get(url, secure=True)['ETag']
+
+        with self.assertNumQueries(3):
+            self.assertEqual(self.client.get(url, secure=True, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        checklist.items.last().delete()
+        self.assertEqual(self.client.get(url, secure=True, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_checklist_items_are_ordered(self):
+        """ Nested items come back sorted by their `order`, rather than by ID. """
+
+        checklist = self.add_data(3)
+        response = self.client.get('/api/checklists/{}/'.format(checklist.pk), secure=True)
+        self.assertEqual([item['order'] for item in response.json()['items']], [1, 2, 3])
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class ConditionalRequestTests(TestCase):
+    """ The ETag and Last-Modified validators answer conditional GETs with a 304, and keep writes from overwriting or
+    deleting an object which has changed since the client last read it. """
+
+    def setUp(self):
+        self.account = Account.objects.create_user('owner', 'owner@example.com', 'password')
+        self.client.force_login(self.account)
+        self.note = Note.objects.create(owner=self.account, title='note', content='content')
+        Note.objects.filter(pk=self.note.pk).update(modified=timezone.now() - timedelta(hours=1))
+        self.url = '/api/notes/{}/'.format(self.note.pk)
+
+    def patch(self, data, **headers):
+        return self.client.patch(self.url, json.dumps(data), content_type='application/json', secure=True, **headers)
+
+    def test_if_match(self):
+        """ An ETag read with any choice of fields, as the dashboard does before editing a Note, is accepted by
+        If-Match on a write, and a stale one gets a 412 which leaves the Note alone. """
+
+        etag = self.client.get(self.url, {'fields': 'content,content_hash'}, secure=True)['ETag']
+        self.assertEqual(self.client.get(self.url, secure=True)['ETag'], etag)
+        self.assertEqual(self.patch({'title': 'first'}, HTTP_IF_MATCH=etag).status_code, 200)
+
+        self.assertEqual(self.patch({'title': 'second'}, HTTP_IF_MATCH=etag).status_code, 412)
+        self.assertEqual(self.client.delete(self.url, secure=True, HTTP_IF_MATCH=etag).status_code, 412)
+        self.assertEqual(Note.objects.get(pk=self.note.pk).title, 'first')
+
+        etag = self.client.get(self.url, secure=True)['ETag']
+        self.assertEqual(self.client.delete(self.url, secure=True, HTTP_IF_MATCH=etag).status_code, 204)
+
+    def test_if_unmodified_since(self):
+        last_modified = self.client.get(self.url, secure=True)['Last-Modified']
+        self.assertEqual(self.patch({'title': 'first'}, HTTP_IF_UNMODIFIED_SINCE=last_modified).status_code, 200)
+
+        self.assertEqual(self.patch({'title': 'second'}, HTTP_IF_UNMODIFIED_SINCE=last_modified).status_code, 412)
+        self.assertEqual(Note.objects.get(pk=self.note.pk).title, 'first')
+
+    def test_if_modified_since(self):
+        """ A detail view answers If-Modified-Since with a 304 until the object changes. """
+
+        last_modified = self.client.get(self.url, secure=True)['Last-Modified']
+        response = self.client.get(self.url, secure=True, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['Last-Modified'], last_modified)
+
+        self.assertEqual(self.patch({'title': 'edited'}).status_code, 200)
+        response = self.client.get(self.url, secure=True, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['title'], 'edited')
+
+    def test_delete_changes_list_etag(self):
+        """ Deleting an object which isn't the latest changed doesn't move the list's Last-Modified date, but it does
+        change its ETag. """
+
+        Note.objects.create(owner=self.account, title='latest', content='content')
+        response = self.client.get('/api/notes/', secure=True)
+        etag = response['ETag']
+
+        Note.objects.filter(pk=self.note.pk).delete()
+        response = self.client.get('/api/notes/', secure=True, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual([note['title'] for note in response.json()['results']], ['latest'])
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class PaginationTests(TestCase):
+    """ Lists are paged with keyset cursors, in any of the supported orderings. """
+
+    def setUp(self):
+        self.account = Account.objects.create_user('owner', 'owner@example.com', 'password')
+        self.client.force_login(self.account)
+
+    def add_notes(self, count):
+        Note.objects.bulk_create(Note(owner=self.account, title=str(i), content='content') for i in range(count))
+        return list(Note.objects.values_list('pk', flat=True))
+
+    def get(self, url, **params):
+        response = self.client.get(url, params, secure=True)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def get_ids(self, page):
+        return [note['id'] for note in page['results']]
+
+    def test_links(self):
+        ids = self.add_notes(5)
+
+        page = self.get('/api/notes/', page_size=2)
+        self.assertEqual(self.get_ids(page), ids[:2])
+        self.assertIsNone(page['previous'])
+
+        second = self.get(page['next'])
+        self.assertEqual(self.get_ids(second), ids[2:4])
+
+        last = self.get(second['next'])
+        self.assertEqual(self.get_ids(last), ids[4:])
+        self.assertIsNone(last['next'])
+
+        self.assertEqual(self.get_ids(self.get(last['previous'])), ids[2:4])
+
+        page = self.get('/api/notes/', page_size=2, ordering='-id')
+        self.assertEqual(self.get_ids(page), ids[:-3:-1])
+
+    def test_page_size_is_capped(self):
+        ids = self.add_notes(1001)
+
+        page = self.get('/api/notes/', page_size=5000)
+        self.assertEqual(self.get_ids(page), ids[:1000])
+        self.assertEqual(self.get_ids(self.get(page['next'])), ids[1000:])
+
+        self.assertEqual(len(self.get('/api/notes/')['results']), 100)
+
+    def test_ordering_by_modified_with_ties(self):
+        """ Paging by `-modified` visits every Note once, however many share a timestamp, newest first and then by
+        `-id`. Unsupported orderings fall back to `id`. """
+
+        ids = self.add_notes(7)
+        now = timezone.now()
+        Note.objects.filter(pk__in=ids[:5]).update(modified=now)
+        Note.objects.filter(pk=ids[5]).update(modified=now + timedelta(seconds=1))
+        Note.objects.filter(pk=ids[6]).update(modified=now - timedelta(seconds=1))
+
+        seen = list()
+        page = self.get('/api/notes/', page_size=2, ordering='-modified')
+        while True:
+            seen += self.get_ids(page)
+            if page['next'] is None:
+                break
+            page = self.get(page['next'])
+
+        self.assertEqual(seen, [ids[5]] + ids[4::-1] + [ids[6]])
+
+        page = self.get('/api/notes/', page_size=3, ordering='title')
+        self.assertEqual(self.get_ids(page), ids[:3])
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class SparseFieldsetTests(TestCase):
+    """ Clients can pick the fields they want back, and only pay for the columns and nested items they pick. """
+
+    def setUp(self):
+        self.account = Account.objects.create_user('owner', 'owner@example.com', 'password')
+        self.client.force_login(self.account)
+        self.client.get('/api/', secure=True)
+
+        self.note = Note.objects.create(owner=self.account, title='note', content='content')
+        self.checklist = Checklist.objects.create(owner=self.account, title='list')
+        self.items = [ChecklistItem.objects.create(checklist=self.checklist, text='item', order=order)
+                      for order in (2, 1)]
+
+    def get(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, secure=True)
+
+        self.assertEqual(response.status_code, 200)
+        return response.json(), [query['sql'] for query in queries]
+
+    def test_fields_and_omit(self):
+        data, queries = self.get('/api/notes/?fields=id,title&ordering=-modified')
+        self.assertEqual(data['results'], [{'id': self.note.pk, 'title': 'note'}])
+        self.assertNotIn('"content"', queries[-1])
+
+        data, queries = self.get('/api/notes/{}/?omit=content,owner,preview,content_hash,content_size'.format(
+            self.note.pk))
+        self.assertEqual(list(data), ['id', 'title', 'created', 'modified', 'url'])
+        self.assertNotIn('"content"', queries[-1])
+
+        response = self.client.get('/api/notes/?fields=id,secret', secure=True)
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('secret', response.json()['fields'][0])
+
+    def test_nested_items(self):
+        ids = [item.pk for item in reversed(self.items)]
+
+        # The session, the two validator aggregates, then the checklists, and the items only when they're chosen
+        for url in ('/api/checklists/?fields=id,title', '/api/checklists/{}/?fields=id,title'):
+            data, queries = self.get(url.format(self.checklist.pk))
+            self.assertEqual(len(queries), 4)
+
+        data, _ = self.get('/api/checklists/?fields=id,items')
+        self.assertEqual(data['results'], [{'id': self.checklist.pk, 'items': ids}])
+
+        data, _ = self.get('/api/checklists/{}/?fields=items'.format(self.checklist.pk))
+        self.assertEqual(data, {'items': ids})
+
+        for url in ('/api/checklists/?fields=items&expand=items', '/api/checklists/{}/?omit=title&expand=items'):
+            data, _ = self.get(url.format(self.checklist.pk))
+            items = data['results'][0]['items'] if 'results' in data else data['items']
+            self.assertEqual([item['id'] for item in items], ids)
+            self.assertEqual(items[0]['text'], 'item')
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class NotePreviewTests(TestCase):
+    """ Notes keep a plain text preview of their content, which lists send instead of the content itself. """
+
+    def setUp(self):
+        self.account = Account.objects.create_user('owner', 'owner@example.com', 'password')
+        self.client.force_login(self.account)
+
+    def test_preview_kept_up_to_date(self):
+        note = Note.objects.create(owner=self.account, title='note', content='<b>Caf\u00e9</b>&nbsp;&amp;\r\nmore')
+        self.assertEqual(note.preview, 'Caf\u00e9 &\r\nmore')
+        self.assertEqual(note.content_size, len(note.content.encode('utf-8')))
+
+        old_hash = note.content_hash
+        note.content = 'x' * 1000
+        note.save(update_fields=['content'])
+        note.refresh_from_db()
+        self.assertEqual(len(note.preview), 500)
+        self.assertEqual(note.content_size, 1000)
+        self.assertNotEqual(note.content_hash, old_hash)
+
+        # Saving with the content deferred leaves the preview alone
+        note = Note.objects.defer('content').get(pk=note.pk)
+        note.title = 'renamed'
+        note.save()
+        self.assertEqual(Note.objects.get(pk=note.pk).content_size, 1000)
+
+    def test_preview_of_long_markup(self):
+        """ Only the start of long content is stripped for the preview, and a tag or entity cut in half there doesn't
+        leak into it. """
+
+        for tail in ('<a href="https://example.com/">', '&amp;', '&#8212;'):
+            for cut in range(1, len(tail)):
+                start = '<span class="{}">text '
+                padding = 'y' * (PREVIEW_LENGTH * 8 - len(start.format('')) - cut)
+                content = start.format(padding) + tail + 'more</a></span>'
+                self.assertEqual(make_preview(content), 'text', (tail, cut))
+
+        content = '<p>' + 'word ' * 2000 + '</p>'
+        self.assertEqual(make_preview(content), Truncator(('word ' * 2000).strip()).chars(PREVIEW_LENGTH))
+
+    def test_list_defers_content(self):
+        note = Note.objects.create(owner=self.account, title='note', content='full content')
+
+        with CaptureQueriesContext(connection) as queries:
+            data = self.client.get('/api/notes/', secure=True).json()
+        self.assertNotIn('content', data['results'][0])
+        self.assertEqual(data['results'][0]['preview'], 'full content')
+        self.assertNotIn('"content"', queries[-1]['sql'])
+
+        data = self.client.get('/api/notes/?fields=id,content', secure=True).json()
+        self.assertEqual(data['results'], [{'id': note.pk, 'content': 'full content'}])
+
+        data = self.client.get('/api/notes/{}/'.format(note.pk), secure=True).json()
+        self.assertEqual(data['content'], 'full content')
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class ContentPatchTests(TestCase):
+    """ Note content can be updated with a patch against a known version of it, rather than sent in full. """
+
+    def setUp(self):
+        self.account = Account.objects.create_user('owner', 'owner@example.com', 'password')
+        self.client.force_login(self.account)
+        self.note = Note.objects.create(owner=self.account, title='note', content='Hello \U0001F600 world')
+
+    def patch(self, data):
+        return self.client.patch('/api/notes/{}/'.format(self.note.pk), json.dumps(data),
+                                 content_type='application/json', secure=True)
+
+    def test_patch(self):
+        # Offsets count UTF-16 code units, so the emoji takes up two
+        edits = [{'at': 6, 'delete': 2, 'insert': ':)'}, {'at': 9, 'insert': 'wide '}]
+        response = self.patch({'title': 'patched', 'base_hash': self.note.content_hash, 'content_patch': edits})
+        self.assertEqual(response.status_code, 200)
+
+        self.note.refresh_from_db()
+        self.assertEqual((self.note.title, self.note.content), ('patched', 'Hello :) wide world'))
+        self.assertEqual(response.json()['content_hash'], self.note.content_hash)
+
+        # The same patch again is made against the old content
+        response = self.patch({'base_hash': sha256('Hello \U0001F600 world'.encode('utf-8')).hexdigest(),
+                               'content_patch': edits})
+        self.assertEqual(response.status_code, 409)
+
+        for edits in ([{'at': 100, 'insert': 'x'}], [{'at': 3}, {'at': 1}], [{'at': 0, 'delete': 19}]):
+            response = self.patch({'base_hash': self.note.content_hash, 'content_patch': edits})
+            self.assertEqual(response.status_code, 400)
+        self.assertEqual(Note.objects.get(pk=self.note.pk).content, 'Hello :) wide world')
+
+    def test_operation_patch(self):
+        def update(key, base_hash):
+            return {'key': key, 'op': 'update', 'type': 'note', 'id': self.note.pk,
+                    'data': {'base_hash': base_hash, 'content_patch': [{'at': 0, 'delete': 5, 'insert': 'Bye'}]}}
+
+        base_hash = self.note.content_hash
+        ops = [update('d6d2c0b1-7e0f-4a8e-8a55-0b8c2b7f6f01', base_hash),
+               update('d6d2c0b1-7e0f-4a8e-8a55-0b8c2b7f6f02', base_hash)]
+        response = self.client.post('/api/ops/', json.dumps({'ops': ops}), content_type='application/json',
+                                    secure=True)
+
+        results = response.json()['results']
+        self.assertEqual([result['status'] for result in results], [200, 409])
+        self.assertEqual(results[1]['object']['content'], 'Bye \U0001F600 world')
+        self.assertEqual(Note.objects.get(pk=self.note.pk).content, 'Bye \U0001F600 world')
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class QueryPlanTests(TestCase):
+    """ Make sure every owner-scoped API query is still served by an index. """
+
+    def test_no_sequential_scans(self):
+        """ The audit raises a CommandError, naming the endpoints, if any of their queries scans a whole table. """
+        call_command('audit_query_plans', stdout=StringIO())
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class ValuesSerializerTests(TestCase):
+    """ The values() serializers used by the list endpoints must render exactly the same JSON as the regular ones. """
+
+    def setUp(self):
+        self.account = Account.objects.create_user('owner', 'owner@example.com', 'password')
+        self.request = RequestFactory().get('/api/', secure=True)
+        self.request.user = self.account
+
+        Note.objects.create(owner=self.account, title='Caf\u00e9 <b>"quotes"</b>', content='line\nbreak \u2603')
+        checklist = Checklist.objects.create(owner=self.account, title='list')
+        ChecklistItem.objects.create(checklist=checklist, text='second', complete=True, order=2)
+        ChecklistItem.objects.create(checklist=checklist, text='first', order=1)
+        Checklist.objects.create(owner=self.account, title='empty')
+
+    def assertSameJSON(self, queryset, serializer_class, values_serializer_class):
+        context = {'request': self.request}
+        deferred = values_serializer_class.deferred_fields
+        kwargs = {'fields': [name for name in serializer_class.Meta.fields if name not in deferred]} if deferred else {}
+        expected = JSONRenderer().render(serializer_class(queryset.all(), many=True, context=context, **kwargs).data)
+        self.assertEqual(JSONRenderer().render(values_serializer_class(context).serialize(queryset.all())), expected)
+
+    def test_notes(self):
+        self.assertSameJSON(Note.objects.all(), NoteSerializer, NoteValuesSerializer)
+
+    def test_checklists(self):
+        self.assertSameJSON(Checklist.objects.with_items(), ChecklistSerializer, ChecklistValuesSerializer)
+
+    def test_checklistitems(self):
+        self.assertSameJSON(ChecklistItem.objects.all(), ChecklistItemSerializer, ChecklistItemValuesSerializer)
+
+    def test_sparse_fields_agree(self):
+        """ Each field a values() serializer writes out by hand, in to_representation, comes out the same from its
+        getter, used for sparse fieldsets, and both match the regular serializer given the same fieldset. """
+
+        context = {'request': self.request}
+        for queryset, serializer_class, values_serializer_class in (
+                (Note.objects.all(), NoteSerializer, NoteValuesSerializer),
+                (Checklist.objects.with_items(), ChecklistSerializer, ChecklistValuesSerializer),
+                (ChecklistItem.objects.all(), ChecklistItemSerializer, ChecklistItemValuesSerializer)):
+
+            names = serializer_class.Meta.fields
+            expand = ('items',) if 'items' in names else ()
+            full = values_serializer_class(context).serialize(queryset.all())
+            self.assertEqual(set(values_serializer_class(context, fields=names).get_getters([])), set(names))
+
+            for name in names:
+                sparse = values_serializer_class(context, fields=[name], expand=expand).serialize(queryset.all())
+                expected = serializer_class(queryset.all(), many=True, context=context, fields=[name], expand=expand)
+                self.assertEqual(JSONRenderer().render(sparse), JSONRenderer().render(expected.data), name)
+
+                if name not in values_serializer_class.deferred_fields:
+                    self.assertEqual([row[name] for row in sparse], [row[name] for row in full], name)
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class ChecklistOrderingTests(TestCase):
+    """ Reordering, inserting and checking off items only writes the items which change. """
+
+    def setUp(self):
+        self.account = Account.objects.create_user('owner', 'owner@example.com', 'password')
+        self.client.force_login(self.account)
+
+        self.checklist = Checklist.objects.create(owner=self.account, title='list')
+        self.url = '/api/checklists/{}/items/bulk/'.format(self.checklist.pk)
+        self.put([{'text': str(i)} for i in range(5)])
+        self.ids = self.get_ids()
+
+    def put(self, items):
+        response = self.client.put(self.url, json.dumps(items), content_type='application/json', secure=True)
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def get_ids(self):
+        response = self.client.get('/api/checklists/{}/'.format(self.checklist.pk), secure=True)
+        return [item['id'] for item in response.json()['items']]
+
+    def get_orders(self):
+        return dict(ChecklistItem.objects.values_list('id', 'order'))
+
+    def test_bulk_reorder_writes_moved_item(self):
+        before = self.get_orders()
+        ids = self.ids[1:4] + self.ids[:1] + self.ids[4:]
+
+        response = self.put([{'id': pk, 'text': str(self.ids.index(pk))} for pk in ids])
+        self.assertEqual([item['id'] for item in response.json()['items']], ids)
+
+        after = self.get_orders()
+        self.assertEqual([pk for pk in self.ids if before[pk] != after[pk]], [self.ids[0]])
+
+    def test_move_writes_one_row(self):
+        before = self.get_orders()
+
+        url = '/api/checklistitems/{}/move/'.format(self.ids[4])
+        response = self.client.post(url, {'before': self.ids[0]}, secure=True)
+        self.assertEqual(response.status_code, 200)
+
+        self.assertEqual(self.get_ids(), self.ids[4:] + self.ids[:4])
+        after = self.get_orders()
+        self.assertEqual([pk for pk in self.ids if before[pk] != after[pk]], [self.ids[4]])
+
+    def test_repeated_moves_rebalance(self):
+        """ Moving items into the same spot over and over eventually runs out of room, and the list is laid out again
+        without losing its order. """
+
+        ids = list(self.ids)
+        for _ in range(20):
+            self.client.post('/api/checklistitems/{}/move/'.format(ids[-1]), {'after': ids[0]}, secure=True)
+            ids.insert(1, ids.pop())
+
+        self.assertEqual(self.get_ids(), ids)
+
+    def test_new_items_go_last(self):
+        url = '/api/checklists/{}/items/'.format(self.checklist.pk)
+        response = self.client.post(url, json.dumps({'text': 'new'}), content_type='application/json', secure=True)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(self.get_ids()[-1], response.json()['id'])
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class ChecklistBulkTests(TestCase):
+    """ Replacing a Checklist's items in one request diffs them against what's stored, all or nothing. """
+
+    def setUp(self):
+        self.account = Account.objects.create_user('owner', 'owner@example.com', 'password')
+        self.client.force_login(self.account)
+
+        self.checklist = Checklist.objects.create(owner=self.account, title='list')
+        self.items = [ChecklistItem.objects.create(checklist=self.checklist, text=str(i), order=i) for i in range(3)]
+        self.url = '/api/checklists/{}/items/bulk/'.format(self.checklist.pk)
+
+    def put(self, data):
+        return self.client.put(self.url, json.dumps(data), content_type='application/json', secure=True)
+
+    def get_state(self):
+        return list(self.checklist.items.order_by('order', 'id').values_list('id', 'text', 'complete'))
+
+    def test_diff(self):
+        """ Existing items are updated, new ones created, and missing ones deleted, while unchanged items aren't
+        written at all. """
+
+        first, second, third = self.items
+        modified = ChecklistItem.objects.get(pk=second.pk).modified
+
+        response = self.put([{'id': first.pk, 'text': 'edited', 'complete': True}, {'id': second.pk, 'text': '1'},
+                             {'text': 'new'}])
+        self.assertEqual(response.status_code, 200)
+
+        new = ChecklistItem.objects.get(text='new')
+        self.assertEqual(self.get_state(),
+                         [(first.pk, 'edited', True), (second.pk, '1', False), (new.pk, 'new', False)])
+        self.assertEqual([item['id'] for item in response.json()['items']], [first.pk, second.pk, new.pk])
+        self.assertEqual(ChecklistItem.objects.get(pk=second.pk).modified, modified)
+        self.assertFalse(ChecklistItem.objects.filter(pk=third.pk).exists())
+
+    def test_delete_everything(self):
+        response = self.put([])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['items'], [])
+        self.assertFalse(ChecklistItem.objects.exists())
+
+    def test_title(self):
+        """ The object form can update the title too, while the bare array leaves it alone. """
+
+        response = self.put({'title': 'renamed', 'items': [{'id': self.items[0].pk, 'text': '0'}]})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['title'], 'renamed')
+        self.assertEqual(len(response.json()['items']), 1)
+
+        self.assertEqual(self.put([]).json()['title'], 'renamed')
+        self.assertEqual(Checklist.objects.get().title, 'renamed')
+
+    def test_invalid_items(self):
+        """ Items from another Checklist, another account's items, and repeated items are all refused, and nothing is
+        changed. """
+
+        other = Checklist.objects.create(owner=self.account, title='other')
+        foreign = ChecklistItem.objects.create(checklist=other, text='foreign', order=1)
+        stranger = Account.objects.create_user('other', 'other@example.com', 'password')
+        theirs = ChecklistItem.objects.create(checklist=Checklist.objects.create(owner=stranger, title='theirs'),
+                                              text='theirs', order=1)
+        before = self.get_state()
+
+        for pk in (foreign.pk, theirs.pk):
+            response = self.put({'title': 'renamed', 'items': [{'text': 'new'}, {'id': pk, 'text': 'stolen'}]})
+            self.assertEqual(response.status_code, 400)
+            self.assertIn(str(pk), response.json()['items'][0])
+
+        response = self.put([{'id': self.items[0].pk, 'text': 'a'}, {'id': self.items[0].pk, 'text': 'b'}])
+        self.assertEqual(response.status_code, 400)
+
+        self.assertEqual(self.get_state(), before)
+        self.assertEqual(Checklist.objects.get(pk=self.checklist.pk).title, 'list')
+        self.assertEqual(ChecklistItem.objects.get(pk=foreign.pk).text, 'foreign')
+        self.assertEqual(ChecklistItem.objects.get(pk=theirs.pk).text, 'theirs')
+
+        stranger_checklist = Checklist.objects.get(owner=stranger)
+        url = '/api/checklists/{}/items/bulk/'.format(stranger_checklist.pk)
+        response = self.client.put(url, '[]', content_type='application/json', secure=True)
+        self.assertEqual(response.status_code, 404)
+        self.assertTrue(ChecklistItem.objects.filter(pk=theirs.pk).exists())
+
+    def test_rollback(self):
+        """ A failure part way through leaves the Checklist as it was, deletions and updates included. """
+
+        before = self.get_state()
+        with mock.patch.object(ChecklistItem.objects, 'bulk_create', side_effect=DatabaseError):
+            with self.assertRaises(DatabaseError):
+                self.put([{'id': self.items[0].pk, 'text': 'edited'}, {'text': 'new'}])
+
+        self.assertEqual(self.get_state(), before)
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+@override_settings(STATICFILES_STORAGE='django.contrib.staticfiles.storage.StaticFilesStorage')
+class HomePageTests(TestCase):
+    """ The dashboard embeds its bootstrap data in the page, where no stored text may break out of the script element.
+    The page is rendered without the static file manifest, which only exists once collectstatic has run. """
+
+    def setUp(self):
+        self.account = Account.objects.create_user('owner', 'owner@example.com', 'password')
+        self.client.force_login(self.account)
+
+    def get_bootstrap(self):
+        response = self.client.get('/cloudcache/', secure=True)
+        self.assertEqual(response.status_code, 200)
+
+        html = response.content.decode('utf-8')
+        start = html.index('<script id="bootstrap-data" type="application/json">')
+        payload = html[html.index('>', start) + 1:html.index('</script>', start)]
+        return html, payload
+
+    def test_bootstrap_is_escaped(self):
+        title = '</script><script>alert("&")</script><!--'
+        first = Note.objects.create(owner=self.account, title=title, content='<p>content</p>')
+        checklist = Checklist.objects.create(owner=self.account, title='list')
+        ChecklistItem.objects.create(checklist=checklist, text='<item>', order=1)
+        second = Note.objects.create(owner=self.account, title='second', content='content')
+
+        now = timezone.now()
+        Note.objects.filter(pk=second.pk).update(created=now - timedelta(minutes=3))
+        Checklist.objects.filter(pk=checklist.pk).update(created=now - timedelta(minutes=2))
+        Note.objects.filter(pk=first.pk).update(created=now - timedelta(minutes=1))
+
+        html, payload = self.get_bootstrap()
+        self.assertNotIn('<', payload)
+        self.assertNotIn('>', payload)
+        self.assertNotIn('&', payload)
+        self.assertIn('\\u003C/script\\u003E', payload)
+        self.assertNotIn('alert', html.replace(payload, ''))
+
+        data = json.loads(payload)
+        self.assertIn('cursor', data)
+
+        # Notes and Checklists are merged into one list by creation time
+        elements = [('items' in element, element['id']) for element in data['elements']]
+        self.assertEqual(elements, [(False, second.pk), (True, checklist.pk), (False, first.pk)])
+        self.assertEqual(data['elements'][2]['title'], title)
+        self.assertEqual(data['elements'][1]['items'][0]['text'], '<item>')
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class TransferTests(TestCase):
+    """ Exporting an account and importing it into another. """
+
+    def setUp(self):
+        self.account = Account.objects.create_user('owner', 'owner@example.com', 'password')
+        Note.objects.create(owner=self.account, title='note', content='content')
+        checklist = Checklist.objects.create(owner=self.account, title='list')
+        for i in range(3):
+            ChecklistItem.objects.create(checklist=checklist, text=str(i), complete=i == 1, order=(i + 1) * 1024)
+
+        self.other = Account.objects.create_user('other', 'other@example.com', 'password')
+
+    def export(self, url):
+        self.client.force_login(self.account)
+        response = self.client.get(url, secure=True)
+        self.assertEqual(response.status_code, 200)
+        return b''.join(response.streaming_content)
+
+    def import_file(self, content, name):
+        upload = BytesIO(content)
+        upload.name = name
+        self.client.force_login(self.other)
+        return self.client.post('/api/import/', {'file': upload}, secure=True)
+
+    def assertImported(self):
+        self.assertEqual(Note.objects.filter(owner=self.other).count(), 1)
+        items = ChecklistItem.objects.filter(checklist__owner=self.other).order_by('order')
+        self.assertEqual([(item.text, item.complete) for item in items], [('0', False), ('1', True), ('2', False)])
+
+    def test_ndjson_round_trip(self):
+        response = self.import_file(self.export('/api/export/'), 'export.ndjson')
+        self.assertEqual(response.json(), {'notes': 1, 'checklists': 1, 'checklistitems': 3})
+        self.assertImported()
+
+    def test_zip_round_trip(self):
+        self.assertEqual(self.import_file(self.export('/api/export/zip/'), 'export.zip').status_code, 201)
+        self.assertImported()
+
+    def test_import_is_indexed_in_batches(self):
+        """ Everything imported can be searched for, and indexing it takes the same number of queries however much
+        there is. """
+
+        content = self.export('/api/export/')
+        with CaptureQueriesContext(connection) as queries:
+            self.import_file(content, 'export.ndjson')
+        few = len([query for query in queries if 'cloudcache_search' in query['sql']])
+
+        for i in range(20):
+            Note.objects.create(owner=self.account, title='note {}'.format(i), content='content')
+            checklist = Checklist.objects.create(owner=self.account, title='list {}'.format(i))
+            ChecklistItem.objects.create(checklist=checklist, text='item {}'.format(i), order=1)
+
+        content = self.export('/api/export/')
+        with CaptureQueriesContext(connection) as queries:
+            self.import_file(content, 'export.ndjson')
+        self.assertEqual(len([query for query in queries if 'cloudcache_search' in query['sql']]), few)
+
+        self.assertEqual(len(search(self.other, 'note')), 22)
+        checklist = Checklist.objects.get(owner=self.other, title='list 7')
+        self.assertEqual([hit[:2] for hit in search(self.other, 'item 7')], [('checklist', checklist.pk)])
+
+    def test_invalid_file_imports_nothing(self):
+        """ The whole file is checked before anything is written. """
+
+        content = self.export('/api/export/') + b'{"type": "checklistitem", "checklist": 999, "text": "x"}\n'
+        self.assertEqual(self.import_file(content, 'export.ndjson').status_code, 400)
+        self.assertFalse(Note.objects.filter(owner=self.other).exists())
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class PerformanceMiddlewareTests(TestCase):
+    """ Requests are timed, with the breakdown sent back in a Server-Timing header and logged, and slow sampled
+    requests are profiled. """
+
+    def setUp(self):
+        self.account = Account.objects.create_user('owner', 'owner@example.com', 'password')
+        self.client.force_login(self.account)
+        Note.objects.create(owner=self.account, title='note', content='content')
+
+    @override_settings(PERF_SERVER_TIMING=True)
+    def test_server_timing_and_log(self):
+        with self.assertLogs('cloudcache.perf', 'INFO') as logs:
+            response = self.client.get('/api/notes/', secure=True)
+
+        timing = response['Server-Timing']
+        for name in ('auth', 'db', 'serialize', 'render', 'total'):
+            self.assertIn(name + ';dur=', timing)
+
+        record = json.loads(logs.records[-1].getMessage())
+        self.assertEqual(record['view'], 'NoteList')
+        self.assertEqual(record['status'], 200)
+        self.assertIn('queries="{}'.format(record['queries']), timing.replace(';desc=', ' queries='))
+
+    def test_server_timing_is_for_admins(self):
+        """ Without PERF_SERVER_TIMING, only admins get the Server-Timing header, though every request is logged. """
+
+        with self.assertLogs('cloudcache.perf', 'INFO'):
+            self.assertFalse(self.client.get('/api/notes/', secure=True).has_header('Server-Timing'))
+
+        self.account.is_admin = True
+        self.account.save()
+        self.assertTrue(self.client.get('/api/notes/', secure=True).has_header('Server-Timing'))
+
+    @override_settings(PERF_SERVER_TIMING=True)
+    def test_render_is_timed_on_its_own(self):
+        """ The render timing covers rendering the response, not the middleware which handles it afterwards. """
+
+        process_response = CompressionMiddleware.process_response
+
+        def slow_process_response(middleware, request, response):
+            sleep(0.2)
+            return process_response(middleware, request, response)
+
+        with mock.patch.object(CompressionMiddleware, 'process_response', slow_process_response):
+            timing = self.client.get('/api/notes/', secure=True)['Server-Timing']
+
+        durations = {name: float(duration) for name, duration in re.findall(r'(\w+);dur=([\d.]+)', timing)}
+        self.assertLess(durations['render'], 100)
+        self.assertGreaterEqual(durations['total'], 200)
+
+    def test_slow_sampled_request_is_profiled(self):
+        with TemporaryDirectory() as directory:
+            profiling = override_settings(PERF_PROFILE_SAMPLE_RATE=1, PERF_PROFILE_THRESHOLD_MS=0,
+                                          PERF_PROFILE_DIR=directory)
+            with profiling, self.assertLogs('cloudcache.perf', 'WARNING'):
+                self.client.get('/api/notes/', secure=True)
+
+            profiles = os.listdir(directory)
+            self.assertEqual(len(profiles), 1)
+            self.assertTrue(profiles[0].startswith('NoteList-'))
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class CompressionMiddlewareTests(TestCase):
+    """ Responses are compressed with the best coding the client accepts, unless they're small, already compressed,
+    event streams, or carry the CSRF token. """
+
+    def setUp(self):
+        self.account = Account.objects.create_user('owner', 'owner@example.com', 'password')
+        self.client.force_login(self.account)
+        for i in range(20):
+            Note.objects.create(owner=self.account, title='note {}'.format(i), content='content')
+
+    def get(self, path, accept_encoding):
+        return self.client.get(path, secure=True, HTTP_ACCEPT_ENCODING=accept_encoding)
+
+    def test_negotiation(self):
+        expected = self.get('/api/notes/', '').content
+
+        response = self.get('/api/notes/', 'gzip, deflate, br')
+        self.assertEqual(response['Content-Encoding'], 'br')
+        self.assertEqual(brotli.decompress(response.content), expected)
+        self.assertEqual(int(response['Content-Length']), len(response.content))
+        self.assertIn('Accept-Encoding', response['Vary'])
+
+        response = self.get('/api/notes/', 'br;q=0.5, gzip')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(response.content), expected)
+
+        self.assertFalse(self.get('/api/notes/', 'br;q=0, identity').has_header('Content-Encoding'))
+        self.assertFalse(self.get('/api/', 'gzip, br').has_header('Content-Encoding'))
+
+    def test_etag_per_coding(self):
+        """ Each coding of a response gets its own ETag, which If-None-Match and If-Match still accept. """
+
+        etags = {coding: self.get('/api/notes/', coding)['ETag'] for coding in ('identity', 'gzip', 'br')}
+        self.assertEqual(etags['gzip'], etags['identity'][:-1] + '-gzip"')
+        self.assertEqual(etags['br'], etags['identity'][:-1] + '-br"')
+
+        for coding, etag in etags.items():
+            response = self.client.get('/api/notes/', secure=True, HTTP_ACCEPT_ENCODING=coding, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, 304)
+            self.assertEqual(response['ETag'], etag)
+
+        note = Note.objects.create(owner=self.account, title='long', content='content ' * 200)
+        url = '/api/notes/{}/'.format(note.pk)
+        etag = self.get(url, 'gzip')['ETag']
+        self.assertTrue(etag.endswith('-gzip"'))
+
+        def patch(title):
+            return self.client.patch(url, json.dumps({'title': title}), content_type='application/json', secure=True,
+                                     HTTP_IF_MATCH=etag)
+
+        self.assertEqual(patch('first').status_code, 200)
+        self.assertEqual(patch('second').status_code, 412)
+        self.assertEqual(Note.objects.get(pk=note.pk).title, 'first')
+
+    def test_streaming(self):
+        response = self.get('/api/export/', 'gzip')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(len(gzip.decompress(b''.join(response.streaming_content)).splitlines()), 21)
+
+        self.assertFalse(self.get('/api/export/zip/', 'gzip').has_header('Content-Encoding'))
+
+        request = RequestFactory().get('/api/events/', HTTP_ACCEPT_ENCODING='gzip')
+        events = StreamingHttpResponse(iter([b'data: {}\n\n'] * 100), content_type='text/event-stream')
+        self.assertFalse(CompressionMiddleware().process_response(request, events).has_header('Content-Encoding'))
+
+    def test_csrf_token_responses_are_padded(self):
+        request = RequestFactory().get('/', HTTP_ACCEPT_ENCODING='br, gzip')
+        request.META['CSRF_COOKIE_USED'] = True
+        content = b'<input name="csrfmiddlewaretoken" value="secret">' * 100
+
+        lengths = set()
+        for _ in range(10):
+            response = CompressionMiddleware().process_response(request, HttpResponse(content))
+            self.assertEqual(response['Content-Encoding'], 'gzip')
+            self.assertEqual(gzip.decompress(response.content), content)
+            lengths.add(len(response.content))
+        self.assertGreater(len(lengths), 1)
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class ThrottleTests(TestCase):
+    """ Each account, or address for anonymous requests, has a token bucket per scope, which refills over time. """
+
+    def setUp(self):
+        self.account = Account.objects.create_user('owner', 'owner@example.com', 'password')
+        get_throttle_store().clear()
+        self.addCleanup(get_throttle_store().clear)
+
+    def test_scopes_and_retry_after(self):
+        self.client.force_login(self.account)
+        note = json.dumps({'title': 'note', 'content': 'content'})
+
+        with override_settings(THROTTLE_RATES={'read': '100/min', 'write': '2/min', 'register': '1/hour'}):
+            for expected in (201, 201, 429):
+                response = self.client.post('/api/notes/', note, content_type='application/json', secure=True)
+                self.assertEqual(response.status_code, expected)
+
+            self.assertTrue(29 <= int(response['Retry-After']) <= 30)
+            self.assertEqual(self.client.get('/api/notes/', secure=True).status_code, 200)
+
+            # Anonymous clients are throttled by address
+            self.client.logout()
+            for expected in (201, 429):
+                data = {'username': 'new', 'email': 'new@example.com', 'password': 'password'}
+                response = self.client.post('/api/accounts/', data, secure=True, REMOTE_ADDR='10.0.0.1')
+                self.assertEqual(response.status_code, expected)
+
+        self.assertEqual(get_throttle_store().get_throttled_counts(), {'write': 1, 'register': 1})
+
+    def test_forwarded_for_cannot_be_spoofed(self):
+        # Only the last address, the one added by the trusted proxy, identifies the client
+        with override_settings(THROTTLE_RATES={'read': '2/min', 'write': '2/min', 'register': '1/hour'}):
+            statuses = [self.client.get('/api/accounts/', secure=True,
+                                        HTTP_X_FORWARDED_FOR='10.9.9.{}, 10.0.0.1'.format(i)).status_code
+                        for i in range(4)]
+        self.assertEqual(statuses, [200, 200, 429, 429])
+
+    def test_bucket_refills(self):
+        store = MemoryThrottleStore()
+        clock = import_module('api.throttling.MemoryThrottleStore')
+
+        with mock.patch.object(clock, 'monotonic', return_value=100):
+            self.assertEqual([store.take('key', 2, 0.5) for _ in range(3)], [0, 0, 2])
+        with mock.patch.object(clock, 'monotonic', return_value=101):
+            self.assertEqual(store.take('key', 2, 0.5), 1)
+        with mock.patch.object(clock, 'monotonic', return_value=102):
+            self.assertEqual(store.take('key', 2, 0.5), 0)
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class OperationLogTests(TestCase):
+    """ Batches of client operations are applied in order and in one transaction, and retries are never applied twice.
+    """
+
+    def setUp(self):
+        self.account = Account.objects.create_user('owner', 'owner@example.com', 'password')
+        self.client.force_login(self.account)
+
+    def send(self, *ops):
+        return self.client.post('/api/ops/', json.dumps({'ops': ops}), content_type='application/json', secure=True)
+
+    def test_retries_are_replayed(self):
+        checklist_id = '8c4f6b7e-2b35-4f4d-9a43-6c1b8e4f0a11'
+        ops = [
+            {'key': 'a6d2c0b1-7e0f-4a8e-8a55-0b8c2b7f6f01', 'op': 'create', 'type': 'checklist',
+             'client_id': checklist_id, 'data': {'title': 'list'}},
+            {'key': 'a6d2c0b1-7e0f-4a8e-8a55-0b8c2b7f6f02', 'op': 'create', 'type': 'checklistitem',
+             'data': {'checklist': checklist_id, 'text': 'first'}},
+            {'key': 'a6d2c0b1-7e0f-4a8e-8a55-0b8c2b7f6f03', 'op': 'create', 'type': 'checklistitem',
+             'data': {'checklist': checklist_id, 'text': 'second'}},
+        ]
+
+        results = self.send(*ops).json()['results']
+        self.assertEqual([result['status'] for result in results], [201, 201, 201])
+        self.assertEqual([item['text'] for item in results[0]['object']['items']], ['first', 'second'])
+
+        item_id = results[2]['id']
+        toggle = {'key': 'a6d2c0b1-7e0f-4a8e-8a55-0b8c2b7f6f04', 'op': 'toggle', 'type': 'checklistitem',
+                  'id': item_id, 'data': {'complete': True}}
+        results = self.send(*(ops + [toggle])).json()['results']
+
+        self.assertEqual([result.get('replayed', False) for result in results], [True, True, True, False])
+        self.assertEqual(Checklist.objects.count(), 1)
+        self.assertEqual(ChecklistItem.objects.count(), 2)
+        self.assertTrue(ChecklistItem.objects.get(pk=item_id).complete)
+
+    def test_missing_objects_and_invalid_batches(self):
+        note = Note.objects.create(owner=self.account, title='note', content='content')
+        other = Account.objects.create_user('other', 'other@example.com', 'password')
+        hidden = Note.objects.create(owner=other, title='hidden', content='content')
+
+        update = {'key': 'b6d2c0b1-7e0f-4a8e-8a55-0b8c2b7f6f01', 'op': 'update', 'type': 'note', 'id': note.pk,
+                  'data': {'title': 'renamed'}}
+        missing = {'key': 'b6d2c0b1-7e0f-4a8e-8a55-0b8c2b7f6f02', 'op': 'delete', 'type': 'note', 'id': hidden.pk}
+        invalid = {'key': 'b6d2c0b1-7e0f-4a8e-8a55-0b8c2b7f6f03', 'op': 'toggle', 'type': 'note', 'id': note.pk}
+
+        response = self.send(update, invalid)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(Note.objects.get(pk=note.pk).title, 'note')
+
+        results = self.send(update, missing).json()['results']
+        self.assertEqual([result['status'] for result in results], [200, 404])
+        self.assertEqual(results[0]['object']['title'], 'renamed')
+        self.assertTrue(Note.objects.filter(pk=hidden.pk).exists())
+
+    def test_compaction(self):
+        self.send({'key': 'c6d2c0b1-7e0f-4a8e-8a55-0b8c2b7f6f01', 'op': 'create', 'type': 'note',
+                   'data': {'title': 'note', 'content': 'content'}})
+        ClientOperation.objects.update(created=timezone.now() - timedelta(days=30))
+
+        call_command('compact_sync_log', stdout=StringIO())
+        self.assertFalse(ClientOperation.objects.exists())
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class FastJSONTests(TestCase):
+    """ The fast JSON renderer and parser give exactly what DRF's own do, with orjson or without it. """
+
+    data = OrderedDict([
+        ('utc', datetime(2020, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc)),
+        ('offset', datetime(2020, 1, 2, 3, 4, 5, tzinfo=dt_timezone(timedelta(hours=-5)))),
+        ('naive', datetime(2020, 1, 2, 3, 4, 5)),
+        ('date', date(2020, 1, 2)),
+        ('time', time(3, 4, 5, 6)),
+        ('duration', timedelta(minutes=90)),
+        ('decimal', Decimal('12.50')),
+        ('uuid', UUID('8c4f6b7e-2b35-4f4d-9a43-6c1b8e4f0a11')),
+        ('text', 'Caf\u00e9 \u2603 \U0001F600 "quoted" \\ \n \u2028\u2029 \x00 </script>'),
+        ('numbers', [0, -1, 2 ** 62, 1.5, True, False, None]),
+        ('keys', {1: 'one', 'two': [{}, []]}),
+    ])
+
+    def test_renderer(self):
+        expected = JSONRenderer().render(self.data)
+        self.assertEqual(FastJSONRenderer().render(self.data), expected)
+        self.assertEqual(FastJSONRenderer().render({'big': 2 ** 70}), JSONRenderer().render({'big': 2 ** 70}))
+
+        with mock.patch.object(import_module('api.renderers.FastJSONRenderer'), 'orjson', None):
+            self.assertEqual(FastJSONRenderer().render(self.data), expected)
+
+        self.assertEqual(FastJSONRenderer().render(self.data, 'application/json; indent=4'),
+                         JSONRenderer().render(self.data, 'application/json; indent=4'))
+
+    def test_parser(self):
+        body = JSONRenderer().render(self.data)
+        expected = JSONParser().parse(BytesIO(body))
+        self.assertEqual(FastJSONParser().parse(BytesIO(body)), expected)
+
+        with mock.patch.object(import_module('api.parsers.FastJSONParser'), 'orjson', None):
+            self.assertEqual(FastJSONParser().parse(BytesIO(body)), expected)
+
+        for invalid in (b'{"a": NaN}', b'{"a": 1', b''):
+            with self.assertRaises(ParseError):
+                FastJSONParser().parse(BytesIO(invalid))
+
+    def test_benchmark(self):
+        stdout = StringIO()
+        call_command('bench_json', size=3, items=2, repeat=1, stdout=stdout)
+        self.assertIn('render', stdout.getvalue())
+        self.assertFalse(Account.objects.exists())
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class BenchmarkTests(TransactionTestCase):
+    """ The API benchmark runs every endpoint, writes a baseline, and flags regressions against one. It commits what it
+    seeds, so these tests commit for real too. """
+
+    def test_baseline_and_compare(self):
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'baseline.json')
+            options = {'scales': '3', 'max_items': 3, 'repeat': 1, 'stdout': StringIO()}
+
+            # By the time the account is deleted, it was indexed for search, and its deletions were committed
+            def check_and_delete(account):
+                self.assertEqual(SearchDocument.objects.filter(owner=account, kind=SearchDocument.NOTE).count(),
+                                 Note.objects.filter(owner=account).count())
+                self.assertTrue(Tombstone.objects.filter(owner=account, kind=Tombstone.NOTE).exists())
+                delete_account(account)
+
+            with mock.patch('cloudcache.management.commands.benchmark_api.delete_account', check_and_delete):
+                call_command('benchmark_api', output=path, **options)
+
+            with open(path) as f:
+                baseline = json.load(f)
+            self.assertEqual(baseline['results']['3']['note-list']['queries'], 3)
+            for model in (Account, Note, Checklist, ChecklistItem, ClientOperation, SearchDocument, SearchTerm,
+                          Tombstone):
+                self.assertFalse(model.objects.exists(), model)
+
+            # Any rise in the number of queries is a regression, however small
+            baseline['results']['3']['note-list']['queries'] = 2
+            with open(path, 'w') as f:
+                json.dump(baseline, f)
+
+            with self.assertRaisesMessage(CommandError, '1 regression(s)'):
+                call_command('benchmark_api', compare=path, threshold=1000, min_delta_ms=1000, **options)
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class BundleTests(TestCase):
+    """ The static bundles are built from the assets by the staticfiles finder, and only rebuilt when those change. """
+
+    def test_bundles_are_built_when_stale(self):
+        with TemporaryDirectory() as directory, override_settings(BUNDLE_ROOT=directory):
+            finder = BundleFinder()
+            self.assertEqual(sorted(path for path, _ in finder.list([])), sorted(BUNDLES))
+
+            path = finder.find('js/app.js')
+            with open(path) as f:
+                self.assertIn('Handlebars.templates["list-item-new"]=Handlebars.compile(', f.read())
+
+            # A bundle newer than its assets is left alone, and one older than them is rebuilt
+            future = os.path.getmtime(path) + 3600
+            os.utime(path, (future, future))
+            finder.find('js/app.js')
+            self.assertEqual(os.path.getmtime(path), future)
+
+            os.utime(path, (0, 0))
+            finder.find('js/app.js')
+            self.assertNotEqual(os.path.getmtime(path), 0)
+
+            self.assertEqual(finder.find('js/missing.js'), [])
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class SyncTests(TransactionTestCase):
+    """ Incremental sync and its tombstones. Tombstones are written in the deleting transaction, and these tests commit
+    for real to check that they're kept or rolled back along with it. """
+
+    def setUp(self):
+        self.account = Account.objects.create_user('owner', 'owner@example.com', 'password')
+        self.client.force_login(self.account)
+
+    def sync(self, since=None):
+        params = {} if since is None else {'since': since}
+        response = self.client.get('/api/sync/', params, secure=True)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    @override_settings(SYNC_CURSOR_OVERLAP_SECONDS=5)
+    def test_cursor_round_trip(self):
+        now = timezone.now()
+        self.assertEqual(decode_cursor(encode_cursor(now)), now)
+        self.assertEqual(encode_cursor(datetime(1970, 1, 1, 0, 0, 1, tzinfo=timezone.utc)), '1000000')
+        self.assertEqual(decode_cursor(get_next_cursor(now)), now - timedelta(seconds=5))
+
+        for cursor in ('', 'soon', '1.5', '9' * 30):
+            response = self.client.get('/api/sync/', {'since': cursor}, secure=True)
+            self.assertEqual(response.status_code, 400)
+            self.assertIn('since', response.json())
+
+    def test_reset_and_delta(self):
+        """ The first sync sends everything with `reset`, and later ones only what changed since, items included. """
+
+        note = Note.objects.create(owner=self.account, title='note', content='content')
+        checklist = Checklist.objects.create(owner=self.account, title='list')
+        item = ChecklistItem.objects.create(checklist=checklist, text='item', order=1)
+        Note.objects.create(owner=Account.objects.create_user('other', 'other@example.com', 'password'),
+                            title='theirs', content='content')
+
+        data = self.sync()
+        self.assertTrue(data['reset'])
+        self.assertEqual([n['id'] for n in data['notes']], [note.pk])
+        self.assertEqual([c['id'] for c in data['checklists']], [checklist.pk])
+        self.assertEqual(data['checklistitems'], [])
+
+        # Nothing changed, bar whatever falls within the cursor's overlap
+        Note.objects.filter(pk=note.pk).update(modified=timezone.now() - timedelta(minutes=1))
+        Checklist.objects.filter(pk=checklist.pk).update(modified=timezone.now() - timedelta(minutes=1))
+        ChecklistItem.objects.filter(pk=item.pk).update(modified=timezone.now() - timedelta(minutes=1))
+        data = self.sync(data['cursor'])
+        self.assertFalse(data['reset'])
+        self.assertEqual((data['notes'], data['checklists'], data['checklistitems']), ([], [], []))
+
+        item.text = 'edited'
+        item.save()
+        data = self.sync(data['cursor'])
+        self.assertFalse(data['reset'])
+        self.assertEqual([i['id'] for i in data['checklistitems']], [item.pk])
+        self.assertEqual(data['notes'], [])
+
+    def test_tombstones_per_kind(self):
+        note = Note.objects.create(owner=self.account, title='note', content='content')
+        checklist = Checklist.objects.create(owner=self.account, title='list')
+        items = [ChecklistItem.objects.create(checklist=checklist, text=str(i), order=i) for i in range(2)]
+        other = Checklist.objects.create(owner=self.account, title='other')
+        item = ChecklistItem.objects.create(checklist=other, text='item', order=1)
+        ids = {'notes': [note.pk], 'checklists': [checklist.pk], 'checklistitems': [item.pk] + [i.pk for i in items]}
+        cursor = self.sync()['cursor']
+
+        note.delete()
+        item.delete()
+        checklist.delete()
+
+        deleted = self.sync(cursor)['deleted']
+        self.assertEqual({kind: sorted(object_ids) for kind, object_ids in deleted.items()},
+                         {kind: sorted(object_ids) for kind, object_ids in ids.items()})
+
+        self.client.force_login(Account.objects.create_user('other', 'other@example.com', 'password'))
+        self.assertEqual(self.sync(cursor)['deleted'], {'notes': [], 'checklists': [], 'checklistitems': []})
+
+    @override_settings(SYNC_TOMBSTONE_RETENTION_DAYS=30)
+    def test_retention(self):
+        """ A cursor older than the retention period gets a reset, and compact_sync_log only deletes tombstones older
+        than that. """
+
+        Note.objects.create(owner=self.account, title='note', content='content')
+        stale = encode_cursor(timezone.now() - timedelta(days=31))
+        data = self.sync(stale)
+        self.assertTrue(data['reset'])
+        self.assertEqual(len(data['notes']), 1)
+        self.assertFalse(self.sync(encode_cursor(timezone.now() - timedelta(days=29)))['reset'])
+
+        Note.objects.create(owner=self.account, title='old', content='content').delete()
+        Note.objects.create(owner=self.account, title='new', content='content').delete()
+        old = Tombstone.objects.earliest('id')
+        Tombstone.objects.filter(pk=old.pk).update(deleted=timezone.now() - timedelta(days=31))
+
+        output = StringIO()
+        call_command('compact_sync_log', stdout=output)
+        self.assertIn('Deleted 1 tombstone(s)', output.getvalue())
+        self.assertEqual(list(Tombstone.objects.values_list('pk', flat=True)), [old.pk + 1])
+
+    def test_tombstones_are_batched(self):
+        """ Deleting a Checklist writes the tombstones for it and all of its items with one INSERT, and a deletion
+        which is rolled back leaves none behind. """
+
+        checklist = Checklist.objects.create(owner=self.account, title='list')
+        items = [ChecklistItem.objects.create(checklist=checklist, text=str(i), order=i) for i in range(20)]
+        expected = {('checklist', checklist.pk)} | {('checklistitem', item.pk) for item in items}
+
+        with CaptureQueriesContext(connection) as queries:
+            checklist.delete()
+        inserts = [query for query in queries if query['sql'].startswith('INSERT INTO "cloudcache_tombstone"')]
+        self.assertEqual(len(inserts), 1)
+
+        self.assertEqual(set(Tombstone.objects.filter(owner=self.account).values_list('kind', 'object_id')), expected)
+
+        note = Note.objects.create(owner=self.account, title='note', content='content')
+        with transaction.atomic():
+            Note.objects.create(owner=self.account, title='kept', content='content').delete()
+            try:
+                with transaction.atomic():
+                    note.delete()
+                    raise ValueError
+            except ValueError:
+                pass
+
+        self.assertTrue(Note.objects.filter(title='note').exists())
+        self.assertEqual(Tombstone.objects.filter(kind=Tombstone.NOTE).count(), 1)
+
+    def test_failed_deletion_leaves_no_tombstones(self):
+        """ A deletion which fails part way and is rolled back to a savepoint writes no tombstones, and doesn't keep
+        the next deletion in the same transaction from writing its own. """
+
+        checklist = Checklist.objects.create(owner=self.account, title='list')
+        for i in range(3):
+            ChecklistItem.objects.create(checklist=checklist, text=str(i), order=i)
+        note = Note.objects.create(owner=self.account, title='note', content='content')
+        note_id = note.pk
+
+        def fail(sender, **kwargs):
+            raise ValueError
+
+        post_delete.connect(fail, sender=ChecklistItem)
+        try:
+            with transaction.atomic():
+                try:
+                    with transaction.atomic():
+                        checklist.delete()
+                except ValueError:
+                    pass
+                note.delete()
+        finally:
+            post_delete.disconnect(fail, sender=ChecklistItem)
+
+        self.assertTrue(Checklist.objects.filter(title='list').exists())
+        self.assertEqual(list(Tombstone.objects.values_list('kind', 'object_id')), [(Tombstone.NOTE, note_id)])
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class SearchTests(TransactionTestCase):
+    """ Notes and Checklists are indexed as they're saved, using the inverted index on SQLite. Indexing waits for the
+    transaction to commit, so these tests commit for real. """
+
+    def setUp(self):
+        self.account = Account.objects.create_user('owner', 'owner@example.com', 'password')
+        self.client.force_login(self.account)
+
+    def search(self, query, **params):
+        return self.client.get('/api/search/', dict(params, q=query), secure=True)
+
+    def find(self, query):
+        return [(result['type'], result['object']['id']) for result in self.search(query).json()['results']]
+
+    def test_inverted_index_is_used(self):
+        self.assertIsInstance(get_search_backend(), InvertedIndexSearchBackend)
+
+    def test_note_lifecycle(self):
+        """ A Note is found by the words of its title and content, markup aside, until it's changed or deleted. """
+
+        note = Note.objects.create(owner=self.account, title='Recipes', content='<p>Lemon <b>tart</b></p>')
+        self.assertEqual(self.find('lemon tart'), [('note', note.pk)])
+        self.assertEqual(self.find('recipes'), [('note', note.pk)])
+        self.assertEqual(self.find('lemon cake'), [])
+        self.assertEqual(self.find('b'), [])
+
+        note.content = 'Lime pie'
+        note.save()
+        self.assertEqual(self.find('lemon'), [])
+        self.assertEqual(self.find('lime'), [('note', note.pk)])
+
+        note.delete()
+        self.assertEqual(self.find('lime'), [])
+        self.assertFalse(SearchDocument.objects.exists())
+        self.assertFalse(SearchTerm.objects.exists())
+
+    def test_checklist_lifecycle(self):
+        """ A Checklist is found by its title and by the text of its items, as items are added, edited and removed.
+        The title counts for more than the items. """
+
+        checklist = Checklist.objects.create(owner=self.account, title='Garden')
+        note = Note.objects.create(owner=self.account, title='Notes', content='garden')
+        first = ChecklistItem.objects.create(checklist=checklist, text='weed the beds', order=1)
+        second = ChecklistItem.objects.create(checklist=checklist, text='water', order=2)
+
+        self.assertEqual(self.find('garden'), [('checklist', checklist.pk), ('note', note.pk)])
+        self.assertEqual(self.find('weed water'), [('checklist', checklist.pk)])
+
+        first.text = 'mow the lawn'
+        first.save()
+        self.assertEqual(self.find('weed'), [])
+        self.assertEqual(self.find('mow'), [('checklist', checklist.pk)])
+
+        second.delete()
+        self.assertEqual(self.find('water'), [])
+
+        checklist.title = 'Yard'
+        checklist.save()
+        self.assertEqual(self.find('garden'), [('note', note.pk)])
+        self.assertEqual(self.find('yard lawn'), [('checklist', checklist.pk)])
+
+        checklist.delete()
+        self.assertEqual(self.find('lawn'), [])
+        self.assertEqual(SearchDocument.objects.get().object_id, note.pk)
+
+    def test_rebuild(self):
+        note = Note.objects.create(owner=self.account, title='note', content='content')
+        checklist = Checklist.objects.create(owner=self.account, title='list')
+        ChecklistItem.objects.create(checklist=checklist, text='content', order=1)
+        SearchDocument.objects.all().delete()
+        self.assertEqual(self.find('content'), [])
+
+        output = StringIO()
+        call_command('rebuild_search_index', stdout=output)
+        self.assertIn('Indexed 2 object(s)', output.getvalue())
+        self.assertEqual(self.find('content'), [('note', note.pk), ('checklist', checklist.pk)])
+
+    def test_owner_isolation(self):
+        """ Nobody finds another account's Notes or Checklists, even by searching for the same words. """
+
+        other = Account.objects.create_user('other', 'other@example.com', 'password')
+        mine = Note.objects.create(owner=self.account, title='shared words', content='mine')
+        Note.objects.create(owner=other, title='shared words', content='theirs')
+        checklist = Checklist.objects.create(owner=other, title='private')
+        ChecklistItem.objects.create(checklist=checklist, text='shared', order=1)
+
+        self.assertEqual(self.find('shared'), [('note', mine.pk)])
+        self.assertEqual(self.find('theirs'), [])
+        self.assertEqual(self.find('private'), [])
+        self.assertEqual(len(search(other, 'shared')), 2)
+
+        self.client.logout()
+        self.assertEqual(self.search('shared').status_code, 401)
+
+    def test_invalid_parameters(self):
+        self.assertEqual(self.search('').status_code, 400)
+        for limit in ('0', '-1', 'many'):
+            response = self.search('anything', limit=limit)
+            self.assertEqual(response.status_code, 400)
+            self.assertIn('limit', response.json())
+
+        self.assertEqual(self.search('anything', limit=1).status_code, 200)
+
+    def test_unindexed_changes_skip_reindexing(self):
+        """ Checking off an item, or saving an object without changing its text, leaves the index alone. """
+
+        checklist = Checklist.objects.create(owner=self.account, title='groceries')
+        item = ChecklistItem.objects.create(checklist=checklist, text='apples', order=1)
+        note = Note.objects.create(owner=self.account, title='note', content='content')
+        url = '/api/checklistitems/{}/'.format(item.pk)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.patch(url, '{"complete": true}', content_type='application/json', secure=True)
+            self.assertEqual(response.status_code, 200)
+            Note.objects.get(pk=note.pk).save()
+            Checklist.objects.get(pk=checklist.pk).save(update_fields=['modified'])
+        self.assertFalse([query for query in queries if 'cloudcache_search' in query['sql']])
+
+        response = self.client.patch(url, '{"text": "pears"}', content_type='application/json', secure=True)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.find('pears'), [('checklist', checklist.pk)])
+        self.assertEqual(self.find('apples'), [])
+
+        # The bulk endpoint writes items without their signals, so it indexes the Checklist itself
+        url = '/api/checklists/{}/items/bulk/'.format(checklist.pk)
+        items = [{'id': item.pk, 'text': 'plums', 'complete': True}, {'text': 'figs'}]
+        response = self.client.put(url, json.dumps(items), content_type='application/json', secure=True)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.find('plums figs'), [('checklist', checklist.pk)])
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+@override_settings(EVENTS_KEEPALIVE=0.01, EVENTS_STREAM_TIMEOUT=5)
+class ChangeEventTests(TransactionTestCase):
+    """ Changes are published to the owner's event streams once they commit, over WSGI and natively over ASGI. """
+
+    def setUp(self):
+        self.account = Account.objects.create_user('owner', 'owner@example.com', 'password')
+        self.events = list()
+        self.deliver = lambda event: self.events.append(event)
+        get_broker().subscribe(self.account.pk, self.deliver)
+
+    def tearDown(self):
+        get_broker().unsubscribe(self.account.pk, self.deliver)
+
+    def test_changes_are_published_once_committed(self):
+        with transaction.atomic():
+            note = Note.objects.create(owner=self.account, title='note', content='content')
+            note.save()
+            self.assertEqual(self.events, [])
+
+        checklist = Checklist.objects.create(owner=self.account, title='list')
+        item = ChecklistItem.objects.create(checklist=checklist, text='item', order=1)
+        note_id, checklist_id = note.pk, checklist.pk
+        note.delete()
+
+        self.assertEqual(self.events, [
+            {'type': 'note', 'action': 'saved', 'id': note_id},
+            {'type': 'checklist', 'action': 'saved', 'id': checklist_id},
+            {'type': 'checklistitem', 'action': 'saved', 'id': item.pk, 'checklist': checklist_id},
+            {'type': 'note', 'action': 'deleted', 'id': note_id},
+        ])
+
+        # Deleting a Checklist is one event, not one per item
+        del self.events[:]
+        checklist.delete()
+        self.assertEqual(self.events, [{'type': 'checklist', 'action': 'deleted', 'id': checklist_id}])
+
+    def test_memory_broker_refuses_several_workers(self):
+        """ Events published in one worker never reach streams held open by another, so the in-memory broker won't
+        run with more than one. """
+
+        with override_settings(WEB_WORKERS=2), self.assertRaises(ImproperlyConfigured):
+            MemoryBroker()
+        self.assertIsInstance(MemoryBroker(), MemoryBroker)
+
+    def test_move_is_published(self):
+        checklist = Checklist.objects.create(owner=self.account, title='list')
+        first, second = [ChecklistItem.objects.create(checklist=checklist, text=str(i), order=i) for i in (1, 2)]
+        del self.events[:]
+
+        self.client.force_login(self.account)
+        response = self.client.post('/api/checklistitems/{}/move/'.format(second.pk), {'before': first.pk},
+                                    secure=True)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.events, [{'type': 'checklistitem', 'action': 'saved', 'id': second.pk,
+                                        'checklist': checklist.pk}])
+
+    def test_wsgi_event_stream_is_off_by_default(self):
+        """ Without EVENTS_WSGI_STREAM, a WSGI worker doesn't hold a thread open for the stream, but says not to
+        reconnect. """
+
+        self.client.force_login(self.account)
+        response = self.client.get('/api/events/', secure=True, HTTP_ACCEPT='text/event-stream')
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(get_broker().subscribers[self.account.pk], {self.deliver})
+
+    @override_settings(EVENTS_WSGI_STREAM=True)
+    def test_event_stream(self):
+        self.client.force_login(self.account)
+        response = self.client.get('/api/events/', secure=True, HTTP_ACCEPT='text/event-stream')
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+
+        chunks = iter(response.streaming_content)
+        self.assertIn(b'retry:', next(chunks))
+        self.assertEqual(next(chunks), b': keepalive\n\n')
+
+        note = Note.objects.create(owner=self.account, title='note', content='content')
+        self.assertIn('data: {{"type":"note","action":"saved","id":{}}}'.format(note.pk).encode(), next(chunks))
+
+        response.close()
+        self.assertEqual(get_broker().subscribers[self.account.pk], {self.deliver})
+
+    def test_asgi_event_stream(self):
+        _, key = ApiToken.objects.issue(self.account)
+        scope = {'type': 'http', 'method': 'GET', 'path': '/api/events/', 'query_string': b'', 'http_version': '1.1',
+                 'headers': [(b'authorization', 'Token {}'.format(key).encode())]}
+
+        loop = asyncio.new_event_loop()
+        disconnected = loop.create_future()
+        messages = list()
+
+        async def receive():
+            await disconnected
+            return {'type': 'http.disconnect'}
+
+        async def send(message):
+            messages.append(message)
+            if b'retry:' in message.get('body', b''):
+                get_broker().publish(self.account.pk, {'type': 'note', 'action': 'saved', 'id': 1})
+            elif b'event: change' in message.get('body', b''):
+                disconnected.set_result(True)
+
+        loop.run_until_complete(asyncio.wait_for(EventStreamApplication()(scope, receive, send), 5))
+        loop.close()
+
+        self.assertEqual(messages[0]['status'], 200)
+        self.assertIn(b'"id":1', messages[-1]['body'])
+        self.assertEqual(get_broker().subscribers[self.account.pk], {self.deliver})
+
+        scope['headers'] = [(b'authorization', b'Token wrong')]
+        messages = list()
+        asyncio.new_event_loop().run_until_complete(EventStreamApplication()(scope, receive, send))
+        self.assertEqual(messages[0]['status'], 403)
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class AsgiTests(TransactionTestCase):
+    """ Under ASGI, everything but the event stream is served by the WSGI application through asgiref's adapter. The
+    adapter runs it on another thread, so these tests commit for real. """
+
+    def setUp(self):
+        self.account = Account.objects.create_user('owner', 'owner@example.com', 'password')
+        _, self.key = ApiToken.objects.issue(self.account)
+
+    def request(self, method, path, body=b'', headers=()):
+        """ Send a request through web.asgi.application, and return the status, headers and body of the response. """
+
+        scope = {'type': 'http', 'method': method, 'path': path, 'raw_path': path.encode(), 'root_path': '',
+                 'query_string': b'', 'http_version': '1.1', 'scheme': 'https', 'server': ('testserver', 443),
+                 'client': ('127.0.0.1', 50000),
+                 'headers': [(b'host', b'testserver'), (b'authorization', 'Token {}'.format(self.key).encode()),
+                             (b'content-length', str(len(body)).encode())] + list(headers)}
+        messages = list()
+        requests = [{'type': 'http.request', 'body': body, 'more_body': False}]
+
+        async def receive():
+            return requests.pop(0) if requests else {'type': 'http.disconnect'}
+
+        async def send(message):
+            messages.append(message)
+
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(asyncio.wait_for(asgi_application(scope, receive, send), 5))
+        loop.close()
+
+        start = messages[0]
+        headers = {name.decode().lower(): value.decode() for name, value in start['headers']}
+        return start['status'], headers, b''.join(message.get('body', b'') for message in messages[1:])
+
+    def test_api_requests(self):
+        body = json.dumps({'title': 'note', 'content': 'content'}).encode()
+        status, _, content = self.request('POST', '/api/notes/', body, [(b'content-type', b'application/json')])
+        self.assertEqual(status, 201)
+        note_id = json.loads(content.decode())['id']
+
+        status, headers, content = self.request('GET', '/api/notes/')
+        self.assertEqual(status, 200)
+        self.assertEqual(headers['content-type'], 'application/json')
+        self.assertEqual([note['id'] for note in json.loads(content.decode())['results']], [note_id])
+        self.assertIn('etag', headers)
+
+        status, _, _ = self.request('GET', '/api/notes/', headers=[(b'if-none-match', headers['etag'].encode())])
+        self.assertEqual(status, 304)
@@ -0,0 +1,273 @@
+import json
+import zipfile
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection, transaction
+
+from ..models import Note, Checklist, ChecklistItem, SearchDocument
+from ..search import index_objects
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+FORMAT_VERSION = 1
+
+# The name of the NDJSON file inside a zip archive export
+ARCHIVE_MEMBER = 'cloudcache.ndjson'
+
+# Records are written out in chunks of roughly this many bytes
+CHUNK_SIZE = 64 * 1024
+
+NOTE_FIELDS = ('id', 'title', 'content', 'created', 'modified')
+CHECKLIST_FIELDS = ('id', 'title', 'created', 'modified')
+CHECKLIST_ITEM_FIELDS = ('id', 'checklist_id', 'text', 'complete', 'order', 'created', 'modified')
+
+TITLE_MAX_LENGTH = 1024
+
+
+class InvalidImportError(ValueError):
+    """ Raised when an import file isn't a valid cloudCache export. """
+
+    def __init__(self, message, line=None):
+        super().__init__('Line {}: {}'.format(line, message) if line else message)
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+def iter_records(owner):
+    """ Yield every Note, Checklist and ChecklistItem the owner has, as export records, after a header record. Rows are
+    streamed from the database with .iterator(), which uses a server-side cursor on PostgreSQL, so memory use doesn't
+    grow with the size of the account. Checklists all come before any items, which are grouped by Checklist in order.
+    """
+
+    yield {'type': 'header', 'format': 'cloudcache', 'version': FORMAT_VERSION}
+
+    for row in Note.objects.filter(owner=owner).order_by('id').values(*NOTE_FIELDS).iterator():
+        yield dict(type='note', **row)
+
+    for row in Checklist.objects.filter(owner=owner).order_by('id').values(*CHECKLIST_FIELDS).iterator():
+        yield dict(type='checklist', **row)
+
+    items = ChecklistItem.objects.filter(checklist__owner=owner).order_by('checklist_id', 'order', 'id')
+    for row in items.values(*CHECKLIST_ITEM_FIELDS).iterator():
+        yield dict(type='checklistitem', id=row.pop('id'), checklist=row.pop('checklist_id'), **row)
+
+
+def iter_ndjson(owner):
+    """ Yield the owner's export as chunks of NDJSON bytes, one record per line. """
+
+    encoder = DjangoJSONEncoder(ensure_ascii=False, separators=(',', ':'))
+    chunk = list()
+    size = 0
+
+    for record in iter_records(owner):
+        line = (encoder.encode(record) + '\n').encode('utf-8')
+        chunk.append(line)
+        size += len(line)
+
+        if size >= CHUNK_SIZE:
+            yield b''.join(chunk)
+            chunk, size = list(), 0
+
+    if chunk:
+        yield b''.join(chunk)
+
+
+class _ChunkWriter(object):
+    """ Write-only file object which just collects what's written, so a zip archive can be streamed out as it's built.
+    zipfile copes with output it can't seek in, by writing each member's sizes after its data. """
+
+    def __init__(self):
+        self.chunks = list()
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def take(self):
+        data = b''.join(self.chunks)
+        self.chunks = list()
+        return data
+
+
+def iter_zip(owner):
+    """ Yield the owner's export as chunks of a zip archive, holding the NDJSON export compressed. """
+
+    output = _ChunkWriter()
+    with zipfile.ZipFile(output, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        with archive.open(ARCHIVE_MEMBER, 'w') as member:
+            for chunk in iter_ndjson(owner):
+                member.write(chunk)
+                data = output.take()
+                if data:
+                    yield data
+
+    yield output.take()
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+def open_lines(upload):
+    """ Return an iterator over the lines, as bytes, of an uploaded export, which may be NDJSON or a zip archive. The
+    file must be seekable, as Django's uploaded files and regular files are. """
+
+    upload.seek(0)
+    if zipfile.is_zipfile(upload):
+        upload.seek(0)
+        try:
+            return zipfile.ZipFile(upload).open(ARCHIVE_MEMBER)
+        except KeyError:
+            raise InvalidImportError('The archive has no {} file.'.format(ARCHIVE_MEMBER))
+
+    upload.seek(0)
+    return upload
+
+
+def _is_text(value, max_length=None, blank=False):
+    return isinstance(value, str) and (blank or value) and (max_length is None or len(value) <= max_length)
+
+
+def _check_record(record, checklist_ids):
+    """ Return the problem with a parsed record, or None if it's valid. `checklist_ids` is the set of Checklist IDs
+    seen so far, which items must refer to. """
+
+    if not isinstance(record, dict):
+        return 'Each line must be a JSON object.'
+
+    kind = record.get('type')
+    if kind == 'note':
+        if not _is_text(record.get('title'), TITLE_MAX_LENGTH) or not _is_text(record.get('content')):
+            return 'A note needs a non-empty `title` and `content`.'
+
+    elif kind == 'checklist':
+        if not isinstance(record.get('id'), int) or not _is_text(record.get('title'), TITLE_MAX_LENGTH):
+            return 'A checklist needs an integer `id` and a non-empty `title`.'
+        checklist_ids.add(record['id'])
+
+    elif kind == 'checklistitem':
+        if record.get('checklist') not in checklist_ids:
+            return 'An item must refer to a checklist earlier in the file.'
+        if not _is_text(record.get('text'), TITLE_MAX_LENGTH) or not isinstance(record.get('complete', False), bool)\
+                or not isinstance(record.get('order', 0), int):
+            return 'An item needs non-empty `text`, and a boolean `complete` and integer `order` if given.'
+
+    elif kind != 'header':
+        return 'Unknown record type {!r}.'.format(kind)
+
+    return None
+
+
+def iter_import_records(lines):
+    """ Parse and validate the lines of an export, as bytes, yielding each record other than the header. Raises
+    InvalidImportError at the first problem. """
+
+    checklist_ids = set()
+
+    for number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+
+        try:
+            record = json.loads(line.decode('utf-8'))
+        except ValueError:
+            raise InvalidImportError('Not valid UTF-8 encoded JSON.', number)
+
+        if number == 1 and (not isinstance(record, dict) or record.get('type') != 'header'):
+            raise InvalidImportError('The file must start with a cloudCache export header.', number)
+
+        problem = _check_record(record, checklist_ids)
+        if problem:
+            raise InvalidImportError(problem, number)
+
+        if record['type'] == 'header':
+            if record.get('version') != FORMAT_VERSION:
+                raise InvalidImportError('Unsupported export version {!r}.'.format(record.get('version')), number)
+            continue
+
+        yield record
+
+
+def validate_import(upload):
+    """ Check every line of an uploaded export, without writing anything. Raises InvalidImportError if it's invalid. """
+
+    for _ in iter_import_records(open_lines(upload)):
+        pass
+
+
+def import_records(owner, upload, batch_size=500):
+    """ Add everything in an uploaded export to the owner's account, as new objects. The file is validated in full
+    first, so a bad file imports nothing. It's then read a second time and written with bulk_create, one transaction
+    per batch, so neither memory use nor the length of any transaction grows with the size of the file. New timestamps
+    are given to everything imported.
+
+    :param owner: The Account to import into.
+    :param upload: The seekable export file, NDJSON or zip.
+    :param batch_size: The maximum number of objects written per transaction.
+    :return: A dict of how many notes, checklists and checklistitems were imported.
+    """
+
+    validate_import(upload)
+
+    # Everything imported is indexed for search at the end, in batches, since a Checklist's document includes items
+    # which may arrive in later batches. Finding the new IDs afterwards is simpler than tracking them, as only
+    # PostgreSQL returns them from bulk_create.
+    last_ids = {model: model.objects.order_by('-id').values_list('id', flat=True).first() or 0
+                for model in (Note, Checklist)}
+
+    counts = {'notes': 0, 'checklists': 0, 'checklistitems': 0}
+    checklist_ids = dict()
+    pending = {'note': list(), 'checklist': list(), 'checklistitem': list()}
+
+    def flush(kind):
+        objects = pending[kind]
+        if not objects:
+            return
+
+        with transaction.atomic():
+            if kind == 'note':
+                Note.objects.bulk_create(objects)
+            elif kind == 'checklistitem':
+                ChecklistItem.objects.bulk_create(objects)
+            elif connection.features.can_return_ids_from_bulk_insert:
+                Checklist.objects.bulk_create([checklist for _, checklist in objects])
+            else:
+                # The items need the new Checklists' IDs, which can't be had from bulk_create here
+                for _, checklist in objects:
+                    checklist.save()
+
+        if kind == 'checklist':
+            checklist_ids.update((old_id, checklist.pk) for old_id, checklist in objects)
+
+        counts[kind + 's'] += len(objects)
+        pending[kind] = list()
+
+    for record in iter_import_records(open_lines(upload)):
+        kind = record['type']
+
+        if kind == 'note':
+            note = Note(owner=owner, title=record['title'], content=record['content'])
+            # bulk_create doesn't call save(), which keeps the preview up to date
+            note.update_preview()
+            pending[kind].append(note)
+
+        elif kind == 'checklist':
+            pending[kind].append((record['id'], Checklist(owner=owner, title=record['title'])))
+
+        else:
+            if record['checklist'] not in checklist_ids:
+                flush('checklist')
+            pending[kind].append(ChecklistItem(checklist_id=checklist_ids[record['checklist']], text=record['text'],
+                                               complete=record.get('complete', False), order=record.get('order', 0)))
+
+        if len(pending[kind]) >= batch_size:
+            flush(kind)
+
+    for kind in ('note', 'checklist', 'checklistitem'):
+        flush(kind)
+
+    for kind, model in ((SearchDocument.NOTE, Note), (SearchDocument.CHECKLIST, Checklist)):
+        object_ids = list(model.objects.filter(owner=owner, id__gt=last_ids[model]).values_list('id', flat=True))
+        for start in range(0, len(object_ids), batch_size):
+            index_objects(kind, object_ids[start:start + batch_size])
+
+    return counts
@@ -1,9 +1,23 @@
+from django.utils.safestring import mark_safe
 from django.views.generic import TemplateView
 
+from api.renderers import FastJSONRenderer
+from api.sync import get_bootstrap_data
+
 from . import LoginRequiredMixin
 
 # ----------------------------------------------------------------------------------------------------------------------
 
+# Characters which could end the <script> element the bootstrap JSON is embedded in, or otherwise confuse the HTML
+# parser, escaped the same way Django's json_script filter does.
+JSON_SCRIPT_ESCAPES = {
+    ord('>'): '\\u003E',
+    ord('<'): '\\u003C',
+    ord('&'): '\\u0026',
+}
+
+# ----------------------------------------------------------------------------------------------------------------------
+
 class HomePageView(LoginRequiredMixin, TemplateView):
     """ Placeholder homepage view. """
 
@@ -11,7 +25,12 @@ class HomePageView(LoginRequiredMixin, TemplateView):
 
 
     def get_context_data(self, **kwargs):
-        """ Builds the context with the currently logged-in User. """
+        """ Builds the context with the currently logged-in User, and the bootstrap data for the dashboard, already
+        serialized to JSON so the page can render without any further API requests. """
         context = super().get_context_data(**kwargs)
         context['user'] = self.request.user
+
+        bootstrap = FastJSONRenderer().render(get_bootstrap_data(self.request)).decode('utf-8')
+        context['bootstrap'] = mark_safe(bootstrap.translate(JSON_SCRIPT_ESCAPES))
+
         return context
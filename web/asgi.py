@@ -0,0 +1,46 @@
+"""
+ASGI config for cloudcache project.
+
+It exposes the ASGI callable as a module-level variable named ``application``, for serving with an ASGI server such as
+uvicorn, as the Procfile does:
+
+    uvicorn web.asgi:application --workers 1 --timeout-keep-alive 75
+
+uvicorn closes an idle keep-alive connection after five seconds by default, and under load that timer was seen to fire
+while a response was still being sent, truncating it. 75 seconds also outlasts the idle timeout of the usual proxies in
+front of it, so the proxy is always the one to close a connection.
+
+Change events only reach the event streams of other processes through a shared EVENTS_BROKER. With the default
+in-memory broker, run a single worker; it refuses to start if WEB_WORKERS is set any higher. To run more, set
+WEB_WORKERS to match --workers, along with a shared broker.
+
+Django 1.11 predates ASGI, and has neither async views nor an async ORM, so the WSGI application is adapted with
+asgiref. Each request then runs on the adapter's thread pool, so a worker blocked on the database only ties up one
+thread rather than a whole process.
+
+The change event stream is the exception. It's served natively, since it stays open for minutes while doing nothing,
+and holding a thread for each open dashboard would soon use up the pool.
+"""
+
+from asgiref.wsgi import WsgiToAsgi
+from django.urls import reverse
+
+from .wsgi import application as wsgi_application
+from api.events import EventStreamApplication
+from cloudcache.events import get_broker
+
+wsgi_asgi_application = WsgiToAsgi(wsgi_application)
+event_stream_application = EventStreamApplication()
+
+# Create the broker now, so that a misconfigured one stops the server starting rather than the first stream
+get_broker()
+
+# Resolved once, rather than on every request
+events_path = reverse('events')
+
+
+async def application(scope, receive, send):
+    if scope['type'] == 'http' and scope['method'] == 'GET' and scope['path'] == events_path:
+        return await event_stream_application(scope, receive, send)
+
+    return await wsgi_asgi_application(scope, receive, send)
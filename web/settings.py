@@ -11,6 +11,7 @@ https://docs.djangoproject.com/en/1.9/ref/settings/
 """
 
 import os
+import sys
 import dj_database_url
 
 SECURE_SSL_REDIRECT = True
@@ -50,12 +51,13 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE_CLASSES = [
+    'api.instrumentation.PerformanceMiddleware',
+    'api.compression.CompressionMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
-    'django.contrib.auth.middleware.AuthenticationMiddleware',
-    'django.contrib.auth.middleware.SessionAuthenticationMiddleware',
+    'authentication.middleware.CachedAuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -96,6 +98,10 @@ except KeyError as e:
         'PORT': '5432'
     }
 
+# Keep connections open between requests instead of reconnecting every time. Each worker thread holds its own, so the
+# database has to allow one connection per thread across all of the worker processes.
+default_db_conn['CONN_MAX_AGE'] = int(os.environ.get('DB_CONN_MAX_AGE', 600))
+
 DATABASES = {'default': default_db_conn}
 
 
@@ -119,9 +125,150 @@ AUTH_PASSWORD_VALIDATORS = [
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework.authentication.BasicAuthentication',
+        'authentication.tokens.ApiTokenAuthentication',
         'rest_framework.authentication.SessionAuthentication',
-    )
+        'rest_framework.authentication.BasicAuthentication',
+    ),
+    'DEFAULT_PAGINATION_CLASS': 'api.pagination.KeysetPagination',
+    # JSON is encoded and decoded with orjson when it's installed, and the standard library otherwise
+    'DEFAULT_RENDERER_CLASSES': (
+        'api.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
+    'DEFAULT_PARSER_CLASSES': (
+        'api.parsers.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ),
+    'DEFAULT_THROTTLE_CLASSES': (
+        'api.throttling.TokenBucketThrottle',
+    ),
+    # Anonymous clients are throttled by address. Behind the Heroku router, the last X-Forwarded-For entry is the one
+    # the router added, and anything before it came from the client, so it can't be trusted. Set this to 0 to use the
+    # connection's address when the app is reached directly.
+    'NUM_PROXIES': int(os.environ.get('NUM_PROXIES', '1')),
+}
+
+# Caching
+# The local-memory cache is per process, so nothing which has to be invalidated across processes is kept only in it.
+# Deployments running more than one process can point this at a shared cache, such as memcached.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'cloudcache',
+    }
+}
+
+# Sessions stay in the database, so a logout in one process is seen by all of them
+SESSION_ENGINE = 'django.contrib.sessions.backends.db'
+
+# How long the logged-in Account is cached for. Accounts are dropped from this process's cache whenever they're saved,
+# and reloaded whenever they disagree with the session's password hash. Other sessions of an Account whose password was
+# changed through another process are logged out once the cached copy expires.
+USER_CACHE_TIMEOUT = 30
+
+# Incremental sync
+# Tombstones for deleted objects are kept this long, so a client which hasn't synced for longer has to fetch everything
+SYNC_TOMBSTONE_RETENTION_DAYS = 30
+
+# How far the sync cursor lags behind the time of the sync, to catch writes which committed after it started
+SYNC_CURSOR_OVERLAP_SECONDS = 5
+
+# Operation log
+# Applied client operations are remembered this long, so a client retrying an operation within it never applies it
+# twice. Clients retry for far less time than this; the rest is for clients which went offline mid-request.
+CLIENT_OPERATION_RETENTION_DAYS = 7
+
+# API tokens
+# Verified tokens are cached in-process, so a token revoked in one process may still be accepted by the others for up
+# to API_TOKEN_CACHE_TTL seconds.
+API_TOKEN_CACHE_SIZE = 1024
+API_TOKEN_CACHE_TTL = 60
+
+# Search
+# Dotted path of the search backend. None picks PostgreSQL full-text search on PostgreSQL, and the pure-Python inverted
+# index everywhere else.
+SEARCH_BACKEND = None
+
+# PostgreSQL text search configuration, which decides the stemming and stop words
+SEARCH_CONFIG = 'english'
+
+# Change events
+# Dotted path of the broker fanning change events out to open event streams. The in-memory broker only reaches streams
+# served by the same process.
+EVENTS_BROKER = 'cloudcache.events.MemoryBroker'
+
+# How many server processes the Procfile starts. The in-memory broker refuses to run with more than one.
+WEB_WORKERS = int(os.environ.get('WEB_WORKERS', '1'))
+
+# Seconds of quiet before a keepalive is sent, and before a stream is closed for the browser to reconnect
+EVENTS_KEEPALIVE = 15
+EVENTS_STREAM_TIMEOUT = 300
+
+# How many events can wait for a slow stream before it's told to resync instead
+EVENTS_QUEUE_SIZE = 100
+
+# Whether the WSGI application serves the event stream. Each open stream holds a worker thread for minutes, so this is
+# off in production, which runs web.asgi and serves the stream natively without going through here. The development
+# server has no ASGI, so it's on there. When off, dashboards are told not to reconnect, and do without live updates.
+EVENTS_WSGI_STREAM = os.environ.get(
+    'EVENTS_WSGI_STREAM', 'true' if sys.argv[1:2] in (['runserver'], ['runsslserver']) else 'false').lower() == 'true'
+
+# Throttling
+# How many requests each account, or IP address for anonymous requests, may make in each scope: all at once, or spread
+# over the period. None means no limit. Turn throttling off to load test a server.
+THROTTLE_ENABLED = os.environ.get('THROTTLE_ENABLED', 'true').lower() == 'true'
+THROTTLE_RATES = {
+    'read': '600/min',
+    'write': '120/min',
+    'register': '10/hour',
+}
+
+# Dotted path of the store holding the token buckets. The in-memory store is per process, so each worker process allows
+# the full rates.
+THROTTLE_STORE = 'api.throttling.MemoryThrottleStore'
+
+# Response compression
+# Responses smaller than this many bytes are sent uncompressed
+COMPRESSION_MIN_SIZE = 1024
+
+# Brotli quality 4 and gzip level 6 compress nearly as well as the maximum, at a fraction of the CPU time, which matters
+# for responses compressed afresh every time
+COMPRESSION_BROTLI_QUALITY = 4
+COMPRESSION_GZIP_LEVEL = 6
+
+# Performance instrumentation
+# Whether to send each request's timings back to every client in a Server-Timing header, rather than only to admins.
+# They're always logged to cloudcache.perf.
+PERF_SERVER_TIMING = os.environ.get('PERF_SERVER_TIMING', 'false').lower() == 'true'
+
+# The fraction of requests to run under cProfile, and how slow one has to be for its profile to be kept
+PERF_PROFILE_SAMPLE_RATE = float(os.environ.get('PERF_PROFILE_SAMPLE_RATE', 0))
+PERF_PROFILE_THRESHOLD_MS = int(os.environ.get('PERF_PROFILE_THRESHOLD_MS', 500))
+PERF_PROFILE_DIR = os.environ.get('PERF_PROFILE_DIR', os.path.join(BASE_DIR, 'profiles'))
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+        },
+    },
+    'loggers': {
+        'cloudcache.perf': {
+            'handlers': ['console'],
+            # The test runner would otherwise print a line for every request
+            'level': os.environ.get('PERF_LOG_LEVEL', 'WARNING' if sys.argv[1:2] == ['test'] else 'INFO'),
+            'propagate': False,
+        },
+        'cloudcache.throttle': {
+            'handlers': ['console'],
+            # The tests throttle requests on purpose
+            'level': os.environ.get('THROTTLE_LOG_LEVEL', 'ERROR' if sys.argv[1:2] == ['test'] else 'WARNING'),
+            'propagate': False,
+        },
+    },
 }
 
 # Internationalization
@@ -151,7 +298,17 @@ STATICFILES_DIRS = (
     os.path.join(PROJECT_ROOT, 'static'),
 )
 
+STATICFILES_FINDERS = (
+    'django.contrib.staticfiles.finders.FileSystemFinder',
+    'django.contrib.staticfiles.finders.AppDirectoriesFinder',
+    'cloudcache.bundles.BundleFinder',
+)
+
+# Where the JS and CSS bundles are built, before collectstatic copies them to STATIC_ROOT
+BUNDLE_ROOT = os.path.join(BASE_DIR, 'build', 'bundles')
+
 # Simplified static file serving.
 # https://warehouse.python.org/project/whitenoise/
-STATICFILES_STORAGE = 'whitenoise.django.GzipManifestStaticFilesStorage'
+# Files are stored under content-hashed names, next to gzip and brotli compressed copies for WhiteNoise to serve
+STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
 
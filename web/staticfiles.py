@@ -0,0 +1,12 @@
+from whitenoise.django import DjangoWhiteNoise
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class ImmutableWhiteNoise(DjangoWhiteNoise):
+    """ DjangoWhiteNoise which also marks the content-hashed static files as immutable. They're already cached for ten
+    years, but without `immutable` browsers still revalidate them every time the page is reloaded. """
+
+    def add_cache_headers(self, headers, path, url):
+        super().add_cache_headers(headers, path, url)
+        if 'Cache-Control' in headers and self.is_immutable_file(path, url):
+            headers['Cache-Control'] += ', immutable'
@@ -10,8 +10,9 @@ https://docs.djangoproject.com/en/1.9/howto/deployment/wsgi/
 import os
 
 from django.core.wsgi import get_wsgi_application
-from whitenoise.django import DjangoWhiteNoise
+
+from .staticfiles import ImmutableWhiteNoise
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "web.settings")
 
-application = DjangoWhiteNoise(get_wsgi_application())
+application = ImmutableWhiteNoise(get_wsgi_application())